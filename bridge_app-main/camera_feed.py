@@ -0,0 +1,253 @@
+import glob
+import os
+import threading
+import time
+from collections import deque
+
+from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtGui import QImage, QImageReader, QPixmap
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QComboBox
+
+try:
+    import cv2  # Needed for video files; image sequences decode with Qt alone
+except ImportError:
+    cv2 = None
+
+from sensor_registry import shared_registry
+
+IMAGE_EXTENSIONS = ('*.jpg', '*.jpeg', '*.png', '*.bmp')
+VIDEO_EXTENSIONS = ('.mp4', '.avi', '.mov', '.mkv')
+
+
+class Frame:
+    """A decoded frame; keeps the pixel buffer alive for as long as its QImage is in use"""
+
+    def __init__(self, image, buffer, index, started, decoded):
+        self.image = image
+        self.buffer = buffer
+        self.index = index
+        self.started = started  # perf_counter when decoding began
+        self.decoded = decoded  # perf_counter when the frame was ready
+
+
+class ImageSequenceSource:
+    """Frames from a directory of images, played back at a fixed rate"""
+
+    def __init__(self, directory, fps=10.0):
+        self.paths = sorted(path for pattern in IMAGE_EXTENSIONS for path in glob.glob(os.path.join(directory, pattern)))
+        self.fps = fps
+        self.position = 0
+
+    def read(self):
+        """Return (QImage, buffer) for the next frame, looping at the end; (None, None) if empty"""
+        if not self.paths:
+            return None, None
+        path = self.paths[self.position % len(self.paths)]
+        self.position += 1
+        image = QImageReader(path).read()
+        return (None, None) if image.isNull() else (image, None)
+
+    def close(self):
+        pass
+
+
+class VideoFileSource:
+    """Frames from a video file via OpenCV, looping at the end like a live stream"""
+
+    def __init__(self, path):
+        if cv2 is None:
+            raise RuntimeError("OpenCV (cv2) is required to play video files")
+        self.capture = cv2.VideoCapture(path)
+        self.fps = self.capture.get(cv2.CAP_PROP_FPS) or 25.0
+
+    def read(self):
+        ok, frame = self.capture.read()
+        if not ok:
+            self.capture.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            ok, frame = self.capture.read()
+            if not ok:
+                return None, None
+        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        # QImage wraps the array's memory directly; the Frame keeps the array alive
+        height, width, _ = rgb.shape
+        image = QImage(rgb.data, width, height, rgb.strides[0], QImage.Format_RGB888)
+        return image, rgb
+
+    def close(self):
+        self.capture.release()
+
+
+def open_source(path):
+    """Pick the frame source for a camera's stand-in: a video file or a directory of images"""
+    if os.path.isdir(path):
+        return ImageSequenceSource(path)
+    if os.path.splitext(path)[1].lower() in VIDEO_EXTENSIONS:
+        return VideoFileSource(path)
+    raise ValueError(f"Unsupported camera source: {path}")
+
+
+class CameraDecoder:
+    """Decode a frame source on a background thread into a bounded queue.
+
+    The queue holds at most max_frames; when the GUI falls behind, the oldest frames
+    are dropped so it always shows the most recent one.
+    """
+
+    def __init__(self, source, max_frames=3):
+        self.source = source
+        self.frames = deque(maxlen=max_frames)
+        self.lock = threading.Lock()
+        self.stop_event = threading.Event()
+        self.decoded_count = 0
+        self.dropped_count = 0
+        self.thread = threading.Thread(target=self.run, daemon=True)
+
+    def start(self):
+        self.thread.start()
+
+    def stop(self):
+        self.stop_event.set()
+        self.thread.join(timeout=1.0)
+        self.source.close()
+
+    def run(self):
+        interval = 1.0 / self.source.fps
+        next_time = time.perf_counter()
+        while not self.stop_event.is_set():
+            started = time.perf_counter()
+            image, buffer = self.source.read()
+            if image is None:
+                self.stop_event.wait(0.5)
+                continue
+            frame = Frame(image, buffer, self.decoded_count, started, time.perf_counter())
+            with self.lock:
+                if len(self.frames) == self.frames.maxlen:
+                    self.dropped_count += 1
+                self.frames.append(frame)
+            self.decoded_count += 1
+
+            # Pace to the source frame rate, catching up rather than drifting
+            next_time = max(next_time + interval, time.perf_counter() - interval)
+            self.stop_event.wait(max(next_time - time.perf_counter(), 0.0))
+
+    def latest(self):
+        """Take the newest frame and discard the older ones still queued"""
+        with self.lock:
+            if not self.frames:
+                return None
+            frame = self.frames.pop()
+            self.dropped_count += len(self.frames)
+            self.frames.clear()
+        return frame
+
+
+class CameraFeedWindow(QWidget):
+    """Latest frame from one of the registry's cameras, with FPS and latency readouts.
+
+    Each camera plays a stand-in from camera_dir named after its data key: a video
+    file (Camera_1.mp4, ...) or a directory of images (Camera_1/).
+    """
+
+    def __init__(self, camera_dir, display_fps=30, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Camera Feed")
+        self.setGeometry(100, 100, 900, 600)
+        self.camera_dir = camera_dir
+        self.decoder = None
+
+        self.camera_combo = QComboBox()
+        self.cameras = shared_registry().of_type('Camera')
+        self.camera_combo.addItems([camera['name'] for camera in self.cameras])
+        self.camera_combo.currentIndexChanged.connect(self.select_camera)
+
+        self.image_label = QLabel("No camera source")
+        self.image_label.setAlignment(Qt.AlignCenter)
+        self.image_label.setMinimumSize(320, 240)
+        self.image_label.setStyleSheet("background-color: black; color: #AAAAAA;")
+        self.stats_label = QLabel()
+
+        top = QHBoxLayout()
+        top.addWidget(QLabel("Camera:"))
+        top.addWidget(self.camera_combo, 1)
+        layout = QVBoxLayout(self)
+        layout.addLayout(top)
+        layout.addWidget(self.image_label, 1)
+        layout.addWidget(self.stats_label)
+
+        # Display statistics (exponential moving averages)
+        self.display_fps = 0.0
+        self.decode_ms = 0.0
+        self.latency_ms = 0.0
+        self.last_shown = None
+
+        self.display_timer = QTimer(self)
+        self.display_timer.timeout.connect(self.show_latest_frame)
+        self.display_timer.start(int(1000 / display_fps))
+
+        if self.cameras:
+            self.select_camera(0)
+
+    def source_path(self, camera):
+        for candidate in [camera['data_key']] + [camera['data_key'] + ext for ext in VIDEO_EXTENSIONS]:
+            path = os.path.join(self.camera_dir, candidate)
+            if os.path.exists(path):
+                return path
+        return None
+
+    def select_camera(self, index):
+        self.stop_decoder()
+        camera = self.cameras[index]
+        path = self.source_path(camera)
+        if path is None:
+            self.image_label.setText(f"No stand-in video for {camera['name']} in {self.camera_dir}")
+            return
+        try:
+            self.decoder = CameraDecoder(open_source(path))
+        except Exception as e:
+            print(f"Error opening camera source {path}: {e}")
+            self.image_label.setText(f"Could not open {path}: {e}")
+            return
+        self.last_shown = None
+        self.decoder.start()
+
+    def stop_decoder(self):
+        if self.decoder is not None:
+            self.decoder.stop()
+            self.decoder = None
+
+    def show_latest_frame(self):
+        if self.decoder is None:
+            return
+        frame = self.decoder.latest()
+        if frame is None:
+            return
+        now = time.perf_counter()
+
+        pixmap = QPixmap.fromImage(frame.image)
+        self.image_label.setPixmap(
+            pixmap.scaled(self.image_label.size(), Qt.KeepAspectRatio, Qt.FastTransformation)
+        )
+
+        alpha = 0.1
+        if self.last_shown is not None:
+            self.display_fps += alpha * (1.0 / max(now - self.last_shown, 1e-6) - self.display_fps)
+        self.last_shown = now
+        self.decode_ms += alpha * ((frame.decoded - frame.started) * 1000 - self.decode_ms)
+        self.latency_ms += alpha * ((now - frame.started) * 1000 - self.latency_ms)
+        self.stats_label.setText(
+            f"Display: {self.display_fps:.1f} fps   Decode: {self.decode_ms:.1f} ms   "
+            f"Decode-to-display: {self.latency_ms:.1f} ms   "
+            f"Frames: {self.decoder.decoded_count}   Dropped: {self.decoder.dropped_count}"
+        )
+
+    def closeEvent(self, event):
+        self.stop_decoder()
+        self.display_timer.stop()
+        super().closeEvent(event)
+
+    def showEvent(self, event):
+        # Reopened after a close: resume the selected camera
+        if self.decoder is None and self.cameras:
+            self.select_camera(self.camera_combo.currentIndex())
+        self.display_timer.start()
+        super().showEvent(event)
@@ -0,0 +1,59 @@
+class DamageStateEngine:
+    """Track element damage colors and report only the entries that change between times"""
+
+    def __init__(self, parts, damage_data, damage_colors, safe_color=(0.0, 1.0, 0.0)):
+        self.parts = parts
+        self.damage_data = damage_data
+        self.damage_colors = damage_colors
+
+        # Every element that belongs to a part starts out as safe
+        self.baseline = {}
+        for part in parts.values():
+            for group in part.values():
+                for element in group:
+                    self.baseline[element] = safe_color
+
+        # Elements whose color currently differs from the baseline
+        self.overrides = {}
+
+        # Damaged-element colors per (time, groups), computed once
+        self._states = {}
+
+    def state_at(self, time, group_types=('arc1', 'arc2', 'bar')):
+        """Return {element: color} for the elements that are damaged at the given time"""
+        key = (time, tuple(group_types))
+        if key not in self._states:
+            state = {}
+            damage_info = self.damage_data[time]
+            if damage_info["status"] == "Yes":
+                part = self.parts.get(f'part{damage_info["location"]}', {})
+                damage_color = self.damage_colors[damage_info["damage_type"]]
+                for group_type in group_types:
+                    for element in part.get(group_type, []):
+                        state[element] = damage_color
+            self._states[key] = state
+        return self._states[key]
+
+    def transition(self, time, group_types=('arc1', 'arc2', 'bar')):
+        """Move to the given time and return {element: color} for the entries that changed"""
+        target = self.state_at(time, group_types)
+        changes = {}
+
+        # Elements that are no longer damaged go back to their baseline color
+        for element in self.overrides:
+            if element not in target:
+                changes[element] = self.baseline.get(element, (1.0, 1.0, 1.0))
+
+        # Newly damaged elements, or elements whose damage level changed
+        for element, color in target.items():
+            if self.overrides.get(element) != color:
+                changes[element] = color
+
+        self.overrides = target
+        return changes
+
+    def color_of(self, element):
+        """Return the color currently assigned to an element"""
+        if element in self.overrides:
+            return self.overrides[element]
+        return self.baseline.get(element, (1.0, 1.0, 1.0))
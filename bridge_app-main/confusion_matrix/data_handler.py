@@ -1,30 +1,98 @@
-import pandas as pd
+import csv
+import os
+
+import numpy as np
+
+from data_model import shared_model
+from sensor_analysis.damage_evaluation import EvaluationStore
+from .parts import PARTS, location_of, part_centroids
+
 
 class DataHandler:
     @staticmethod
     def load_geometry_data():
         """Load node and connectivity data"""
         try:
-            # Read node data
-            df_nodes = pd.read_excel('../data/data.xlsx', 
-                                   sheet_name='Sheet1', 
-                                   header=None, 
-                                   skiprows=5, 
-                                   usecols='I:L', 
-                                   nrows=1882)
-            df_nodes.columns = ['number', 'x', 'y', 'z']
-
-            # Read connectivity data
-            df_conn = pd.read_excel('../data/data.xlsx', 
-                                  sheet_name='Sheet1', 
-                                  header=None, 
-                                  skiprows=4, 
-                                  usecols='A:E', 
-                                  nrows=1882)
-            df_conn.columns = ['Element', 'Node1', 'Node2', 'Node3', 'Node4']
-
-            return df_nodes, df_conn
-
+            # Geometry is shared with the other analysis views in the same process
+            return shared_model().geometry()
         except Exception as e:
             print(f"Error loading geometry data: {e}")
-            return None, None
\ No newline at end of file
+            return None, None
+
+    @staticmethod
+    def load_damage_data(path=None):
+        """Load the recorded damage timeline from confusion_matrix.csv as {time: damage info}"""
+        path = path or f'{shared_model().data_dir}/confusion_matrix.csv'
+        try:
+            damage_data = {}
+            with open(path, newline='', encoding='utf-8-sig') as f:
+                for row in csv.DictReader(f):
+                    if not (row.get('Time') or '').strip():
+                        continue
+                    location = (row.get('Location') or '').strip()
+                    damage_data[float(row['Time'])] = {
+                        "status": row['Damage'].strip(),
+                        "damage_type": (row.get('Damage Type') or '').strip(),
+                        "location": int(location) if location else None
+                    }
+            return damage_data
+        except Exception as e:
+            print(f"Error loading damage data: {e}")
+            return {}
+
+    @staticmethod
+    def load_evaluation(path=None):
+        """Load simulated-scenario localisation results (damage_scenarios.csv) into an EvaluationStore"""
+        path = path or f'{shared_model().data_dir}/damage_scenarios.csv'
+        centroids = None
+        try:
+            df_nodes, df_conn = shared_model().geometry()
+            centroids = part_centroids(df_nodes, df_conn)[1]
+        except Exception as e:
+            print(f"Error loading part positions: {e}")
+        if not os.path.exists(path):
+            return EvaluationStore(len(PARTS), centroids)
+        try:
+            return EvaluationStore.from_csv(path, len(PARTS), centroids)
+        except Exception as e:
+            print(f"Error loading damage scenarios: {e}")
+            return EvaluationStore(len(PARTS), centroids)
+
+    @staticmethod
+    def compute_damage_table(acc_feed, strain_feed, task=None):
+        """Detect damage per part from the accelerometer and strain feeds; meant for a loader thread.
+
+        Both feeds are aligned onto one time base, and each part is weighted
+        towards the sensors nearest its centroid.
+        """
+        from sensor_analysis.damage_detection import DamageDetector, idw_weights
+        from sensor_feed import align_feeds
+        from sensor_registry import shared_registry
+
+        block = align_feeds([acc_feed, strain_feed], task=task)
+        df_nodes, df_conn = shared_model().geometry()
+        part_names, centroids = part_centroids(df_nodes, df_conn)
+        registry = shared_registry()
+
+        def sensor_weights(names):
+            # Channels missing from the inventory get no weight
+            sensors = [registry.get(name) for name in names]
+            available = np.array([sensor is not None for sensor in sensors], dtype=bool)
+            weights = np.zeros((len(part_names), len(names)))
+            if available.any():
+                positions = [[s['x'], s['y'], s['z']] for s in sensors if s is not None]
+                weights[:, available] = idw_weights(centroids, positions)
+            return weights
+
+        acc_names, strain_names = acc_feed.names(), strain_feed.names()
+        detector = DamageDetector(
+            block.fs, sensor_weights(acc_names), sensor_weights(strain_names),
+            [location_of(name) for name in part_names]
+        )
+        # The aligner stacks the accelerometers first; row slices are views, so the
+        # detector only reads the windows it processes instead of copying the history
+        if block.names == acc_names + strain_names:
+            acc, strain = block.values[:len(acc_names)], block.values[len(acc_names):]
+        else:
+            acc, strain = block.subset(acc_names).values, block.subset(strain_names).values
+        return detector.detect(block.time_values, acc, strain, task=task)
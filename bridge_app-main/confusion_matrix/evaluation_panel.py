@@ -0,0 +1,90 @@
+import numpy as np
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QComboBox, QTableWidget, QTableWidgetItem, QHeaderView
+from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.figure import Figure
+
+
+class EvaluationPanel(QWidget):
+    """Aggregated confusion matrix and per-location precision/recall of one detector configuration"""
+
+    def __init__(self, store, parent=None):
+        super().__init__(parent)
+        self.store = store
+
+        self.config_combo = QComboBox()
+        self.config_combo.currentTextChanged.connect(self.show_configuration)
+        self.summary_label = QLabel()
+        self.summary_label.setWordWrap(True)
+
+        self.figure = Figure(figsize=(4, 4))
+        self.canvas = FigureCanvas(self.figure)
+        self.ax = self.figure.add_subplot(111)
+
+        self.table = QTableWidget(0, 4)
+        self.table.setHorizontalHeaderLabels(['Location', 'Precision', 'Recall', 'Windows'])
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+
+        controls = QHBoxLayout()
+        controls.addWidget(QLabel("Configuration:"))
+        controls.addWidget(self.config_combo, 1)
+        layout = QVBoxLayout(self)
+        layout.addLayout(controls)
+        layout.addWidget(self.summary_label)
+        layout.addWidget(self.canvas, 2)
+        layout.addWidget(self.table, 1)
+
+        self.refresh()
+
+    def refresh(self, select=None):
+        """Re-list the store's configurations, keeping (or switching to) the selected one"""
+        current = select or self.config_combo.currentText()
+        names = [str(name) for name in self.store.configurations()]
+        self.config_combo.blockSignals(True)
+        self.config_combo.clear()
+        self.config_combo.addItems(names)
+        if current in names:
+            self.config_combo.setCurrentText(current)
+        self.config_combo.blockSignals(False)
+        self.show_configuration(self.config_combo.currentText())
+
+    def show_configuration(self, name):
+        configuration = next((c for c in self.store.configurations() if str(c) == name), None)
+        metrics = self.store.metrics(configuration) if configuration is not None else None
+        self.ax.clear()
+        if metrics is None:
+            self.summary_label.setText("No evaluation results")
+            self.table.setRowCount(0)
+            self.canvas.draw_idle()
+            return
+
+        # Rows normalised to recall for the colors, with the window counts written in
+        matrix = metrics['matrix']
+        with np.errstate(invalid='ignore', divide='ignore'):
+            shares = np.nan_to_num(matrix / matrix.sum(axis=1, keepdims=True))
+        labels = ['None'] + [str(location) for location in range(1, len(matrix))]
+        self.ax.imshow(shares, cmap='Blues', vmin=0.0, vmax=1.0)
+        for (row, column), count in np.ndenumerate(matrix):
+            if count:
+                self.ax.text(column, row, f"{int(count)}", ha='center', va='center', fontsize=7,
+                             color='white' if shares[row, column] > 0.5 else 'black')
+        self.ax.set_xticks(range(len(labels)))
+        self.ax.set_xticklabels(labels)
+        self.ax.set_yticks(range(len(labels)))
+        self.ax.set_yticklabels(labels)
+        self.ax.set_xlabel("Predicted location")
+        self.ax.set_ylabel("True location")
+        self.figure.tight_layout()
+        self.canvas.draw_idle()
+
+        self.summary_label.setText(
+            f"{int(metrics['windows'])} windows   Accuracy: {metrics['accuracy']:.1%}   "
+            f"Detection: {metrics['detection_rate']:.1%}   False alarms: {metrics['false_alarm_rate']:.1%}   "
+            f"Localisation error: {metrics['localisation_error']:.2f}"
+        )
+        self.table.setRowCount(len(labels))
+        for row, label in enumerate(labels):
+            values = [label, f"{metrics['precision'][row]:.2f}", f"{metrics['recall'][row]:.2f}",
+                      f"{int(metrics['support'][row])}"]
+            for column, value in enumerate(values):
+                self.table.setItem(row, column, QTableWidgetItem(value))
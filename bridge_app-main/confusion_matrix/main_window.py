@@ -2,8 +2,10 @@ from PyQt5.QtCore import Qt
 from PyQt5.QtWidgets import QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QFrame
 from vtkmodules.qt.QVTKRenderWindowInteractor import QVTKRenderWindowInteractor
 import vtk
-from data_handler import DataHandler
-from visualization import Visualization
+from sensor_analysis.damage_evaluation import timeline_locations
+from .data_handler import DataHandler
+from .evaluation_panel import EvaluationPanel
+from .visualization import Visualization
 from PyQt5.QtCore import QTimer
 
 
@@ -15,11 +17,11 @@ class MainWindow(QMainWindow):
         # Create central widget and layout
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
-        layout = QVBoxLayout(central_widget)
+        layout = QHBoxLayout(central_widget)
         
         # Create VTK widget
         self.vtkWidget = QVTKRenderWindowInteractor()
-        layout.addWidget(self.vtkWidget)
+        layout.addWidget(self.vtkWidget, 3)
         
         # Set up VTK pipeline
         self.render_window = self.vtkWidget.GetRenderWindow()
@@ -34,6 +36,34 @@ class MainWindow(QMainWindow):
         # Initialize visualization
         self.visualization = Visualization(self.renderer)
         self.visualization.setup_visualization()
+        self.recorded_damage = self.visualization.damage_data
+
+        # Confusion matrix of the localisation results beside the model
+        self.evaluation = DataHandler.load_evaluation()
+        self.evaluation_panel = EvaluationPanel(self.evaluation)
+        layout.addWidget(self.evaluation_panel, 2)
+
+    def show_damage_table(self, table, configuration="Detected vs recorded"):
+        """Show a detected DamageTable, scoring its locations against the recorded timeline where they overlap"""
+        self.visualization.set_damage_table(table)
+        if not self.recorded_damage or not len(table):
+            return
+        # Only windows inside the recorded span share its time base; holding the last
+        # recorded entry beyond it would label every later window with that damage
+        times = table.times
+        inside = (times >= min(self.recorded_damage)) & (times <= max(self.recorded_damage))
+        if not inside.any():
+            return
+        predicted = timeline_locations(table.damage_data(), times[inside])
+        self.evaluation.add(configuration, timeline_locations(self.recorded_damage, times[inside]), predicted)
+        self.evaluation_panel.refresh(select=configuration)
+
+    def set_active(self, active):
+        """Pause the damage timeline while the view is hidden, e.g. in an inactive dashboard tab"""
+        if active:
+            self.visualization.timer.start(2000)
+        else:
+            self.visualization.timer.stop()
 
     def setup_visualization(self):
         # Create visualization manager
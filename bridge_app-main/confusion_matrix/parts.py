@@ -0,0 +1,74 @@
+import numpy as np
+
+# Structural parts monitored for damage: the element numbers of their arc and bar members.
+# A part's damage location number is the number in its name.
+PARTS = {
+    'part1': {
+        'arc1': [979, 978, 977, 976, 975, 974, 973],
+        'arc2': [1358, 1359, 1360, 1361, 1362, 1363, 1364]
+    },
+    'part2': {
+        'arc1': [991, 990, 1403, 1402],
+        'arc2': [996, 997, 1375, 1376],
+        'bar': [992, 993, 994, 995]
+    },
+    'part3': {
+        'arc1': [1427, 1426, 1425, 1424],
+        'arc2': [1569, 1570, 1571, 1572]
+    },
+    'part4': {
+        'arc1': [1310, 1309, 1308, 1307],
+        'arc2': [1210, 1211, 1212, 1213],
+        'bar': [1537, 1538, 1539, 1540]
+    },
+    'part5': {
+        'arc1': [1314, 1313, 1312, 1311],
+        'arc2': [1214, 1215, 1216, 1217]
+    },
+    'part6': {
+        'arc1': [1330, 1329, 1061, 1060],
+        'arc2': [695, 696, 697, 698],
+        'bar': [1056, 1057, 1058, 1059]
+    },
+    'part7': {
+        'arc1': [1147, 1146, 1145, 1144],
+        'arc2': [699, 700, 701, 702]
+    },
+    'part8': {
+        'arc1': [710, 709, 1079, 1078],
+        'arc2': [703, 704, 1076, 1077],
+        'bar': [705, 706, 707, 708]
+    },
+    'part9': {
+        'arc1': [717, 716, 715, 714, 713, 712, 711],
+        'arc2': [1090, 1091, 1092, 1093, 1094, 1095, 1096]
+    }
+}
+
+
+def location_of(part_name):
+    """Damage location number of a part ('part3' -> 3)"""
+    return int(part_name.replace('part', ''))
+
+
+def part_elements(part):
+    """Every element number of a part, over all its groups"""
+    return [element for group in part.values() for element in group]
+
+
+def part_centroids(df_nodes, df_conn, parts=PARTS):
+    """(part names, (parts, 3) centroids) from the mean node position of each part's elements"""
+    positions = dict(zip(df_nodes['number'].astype(int), df_nodes[['x', 'y', 'z']].to_numpy(dtype=float)))
+    element_nodes = {}
+    for row in df_conn.itertuples(index=False):
+        nodes = [int(node) for node in (row.Node1, row.Node2, row.Node3, row.Node4) if not np.isnan(node)]
+        element_nodes.setdefault(int(row.Element), nodes)
+
+    names = list(parts)
+    centroids = np.zeros((len(names), 3))
+    for i, name in enumerate(names):
+        points = [positions[node] for element in part_elements(parts[name])
+                  for node in element_nodes.get(element, []) if node in positions]
+        if points:
+            centroids[i] = np.mean(points, axis=0)
+    return names, centroids
@@ -2,11 +2,19 @@
 import vtk
 import pandas as pd
 import numpy as np
-from data_handler import DataHandler
+from .data_handler import DataHandler
+from .damage_state import DamageStateEngine
+from .parts import PARTS
 from PyQt5.QtWidgets import QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QFrame
 from PyQt5.QtWidgets import QLabel, QComboBox, QHBoxLayout, QVBoxLayout, QWidget
 from PyQt5.QtCore import QTimer
 
+
+def format_time(time):
+    """Dropdown/status text for a timeline time (whole recorded times, or detection window end seconds)"""
+    return f"{time:.12g}"
+
+
 class Visualization:
     def __init__(self, renderer):
         self.renderer = renderer
@@ -16,19 +24,8 @@ class Visualization:
         self.node_labels = []
         self.highlighted_nodes = []
         
-        # Define damage data
-        self.damage_data = {
-            4: {"status": "No", "damage_type": "", "location": None},
-            6: {"status": "Yes", "damage_type": "20%", "location": 1},
-            8: {"status": "Yes", "damage_type": "40%", "location": 2},
-            10: {"status": "Yes", "damage_type": "Failure", "location": 3},
-            12: {"status": "Yes", "damage_type": "Failure", "location": 4},
-            14: {"status": "Yes", "damage_type": "Failure", "location": 5},
-            16: {"status": "Yes", "damage_type": "Failure", "location": 6},
-            18: {"status": "Yes", "damage_type": "Failure", "location": 7},
-            20: {"status": "Yes", "damage_type": "Failure", "location": 8},
-            22: {"status": "Yes", "damage_type": "Failure", "location": 9}
-        }
+        # Recorded damage timeline until one detected from the sensor data replaces it
+        self.damage_data = DataHandler.load_damage_data()
         
         self.times = sorted(self.damage_data.keys())
         self.current_time_index = 0
@@ -41,53 +38,15 @@ class Visualization:
             "Failure": (1.0, 0.0, 0.0) # Red for failure
         }
         
-        # Define the parts structure
-        self.parts = {
-            'part1': {
-                'arc1': [979, 978, 977, 976, 975, 974, 973],
-                'arc2': [1358, 1359, 1360, 1361, 1362, 1363, 1364]
-            },
-            'part2': {
-                'arc1': [991, 990, 1403, 1402],
-                'arc2': [996, 997, 1375, 1376],
-                'bar': [992, 993, 994, 995]
-            },
-            'part3': {
-                'arc1': [1427, 1426, 1425, 1424],
-                'arc2': [1569, 1570, 1571, 1572]
-            },
-            'part4': {
-                'arc1': [1310, 1309, 1308, 1307],
-                'arc2': [1210, 1211, 1212, 1213],
-                'bar': [1537, 1538, 1539, 1540]
-            },
-            'part5': {
-                'arc1': [1314, 1313, 1312, 1311],
-                'arc2': [1214, 1215, 1216, 1217]
-            },
-            'part6': {
-                'arc1': [1330, 1329, 1061, 1060],
-                'arc2': [695, 696, 697, 698],
-                'bar': [1056, 1057, 1058, 1059]
-            },
-            'part7': {
-                'arc1': [1147, 1146, 1145, 1144],
-                'arc2': [699, 700, 701, 702]
-            },
-            'part8': {
-                'arc1': [710, 709, 1079, 1078],
-                'arc2': [703, 704, 1076, 1077],
-                'bar': [705, 706, 707, 708]
-            },
-            'part9': {
-                'arc1': [717, 716, 715, 714, 713, 712, 711],
-                'arc2': [1090, 1091, 1092, 1093, 1094, 1095, 1096]
-            }
-        }
+        # Structural parts, shared with the damage detection
+        self.parts = PARTS
         
-        # Initialize element colors dictionary with default colors
-        self.element_colors = {}
-        self.set_initial_colors()
+        # Damage-state engine reports which element colors change between times
+        self.damage_state = DamageStateEngine(self.parts, self.damage_data, self.damage_colors)
+
+        # Edge colors are patched in place, so keep the array and the element lookup
+        self.edge_colors = None
+        self.element_to_edges = {}
 
         self.status_actor = None
         self.status_message = "Bridge is safe"
@@ -97,39 +56,63 @@ class Visualization:
         self.timer.timeout.connect(self.update_next_time)
         self.timer.start(2000)
 
-    def set_initial_colors(self):
-        # Set all elements to white first
-        for part in self.parts.values():
-            for group in part.values():
-                for element in group:
-                    self.element_colors[element] = (1.0, 1.0, 1.0)  # White
-        
-        # Set arch and bar elements to green
-        for part in self.parts.values():
-            for group_type in ['arc1', 'arc2', 'bar']:  # Added 'bar' to the list
-                if group_type in part:
-                    for element in part[group_type]:
-                        self.element_colors[element] = (0.0, 1.0, 0.0)  # Green
-
-    def update_time(self, time_str):
-        time = int(time_str)
+    def apply_damage_state(self, time, group_types):
+        """Patch only the edges whose color changed when moving to the given time"""
+        changes = self.damage_state.transition(time, group_types)
+        if not changes or self.edge_colors is None:
+            return
+
+        for element, color in changes.items():
+            for cell_id in self.element_to_edges.get(element, []):
+                self.edge_colors.SetTuple3(
+                    cell_id,
+                    int(color[0] * 255),
+                    int(color[1] * 255),
+                    int(color[2] * 255)
+                )
+        self.edge_colors.Modified()
+
+    def set_damage_table(self, table):
+        """Show a DamageTable from the damage detection instead of the current timeline"""
+        self.set_damage_data(table.damage_data())
+
+    def set_damage_data(self, damage_data):
+        """Replace the damage timeline, recoloring the elements for its first time"""
+        if not damage_data:
+            return
+        self.damage_data = damage_data
+        self.times = sorted(damage_data.keys())
+        self.current_time_index = -1  # The next update shows the first time
+
+        # Back to the safe colors before the new engine takes over
+        if self.edge_colors is not None:
+            for element in self.damage_state.overrides:
+                color = self.damage_state.baseline.get(element, (1.0, 1.0, 1.0))
+                for cell_id in self.element_to_edges.get(element, []):
+                    self.edge_colors.SetTuple3(cell_id, int(color[0] * 255), int(color[1] * 255), int(color[2] * 255))
+            self.edge_colors.Modified()
+        self.damage_state = DamageStateEngine(self.parts, self.damage_data, self.damage_colors)
+
+        if hasattr(self, 'time_combo'):
+            self.time_combo.blockSignals(True)
+            self.time_combo.clear()
+            self.time_combo.addItems([format_time(time) for time in self.times])
+            self.time_combo.blockSignals(False)
+        self.update_next_time()
+
+    def render(self):
+        render_window = self.renderer.GetRenderWindow()
+        if render_window is not None:
+            render_window.Render()
+
+    def update_time(self, index):
+        if not 0 <= index < len(self.times):
+            return
+        time = self.times[index]
         damage_info = self.damage_data[time]
         
-        # Reset colors to initial state
-        self.set_initial_colors()
-        
         # Update colors based on damage
-        if damage_info["status"] == "Yes":
-            location = damage_info["location"]
-            damage_type = damage_info["damage_type"]
-            damage_color = self.damage_colors[damage_type]
-            
-            # Update colors for the specified location
-            if f'part{location}' in self.parts:
-                for group_type in ['arc1', 'arc2']:
-                    if group_type in self.parts[f'part{location}']:
-                        for element in self.parts[f'part{location}'][group_type]:
-                            self.element_colors[element] = damage_color
+        self.apply_damage_state(time, ['arc1', 'arc2'])
         
         # Update status message
         if damage_info["status"] == "Yes":
@@ -138,7 +121,7 @@ class Visualization:
             self.status_message = "Bridge is safe"
         
         self.update_status_text()
-        self.update_geometry(self.current_node_to_index, self.current_edges, self.current_planes)
+        self.render()
 
 
     def setup_ui(self, parent_layout):
@@ -148,12 +131,10 @@ class Visualization:
         self.time_combo = QComboBox()
         
         # Add times to dropdown
-        times = sorted(self.damage_data.keys())
-        for time in times:
-            self.time_combo.addItem(str(time))
+        self.time_combo.addItems([format_time(time) for time in self.times])
         
-        # Connect dropdown to update function
-        self.time_combo.currentTextChanged.connect(self.update_time)
+        # Connect dropdown to update function; entries are in self.times order
+        self.time_combo.currentIndexChanged.connect(self.update_time)
         
         time_layout.addWidget(time_label)
         time_layout.addWidget(self.time_combo)
@@ -164,6 +145,8 @@ class Visualization:
     
 
     def update_next_time(self):
+        if not self.times:
+            return
         # Update to next time
         self.current_time_index = (self.current_time_index + 1) % len(self.times)
         current_time = self.times[self.current_time_index]
@@ -171,40 +154,22 @@ class Visualization:
         # Update visualization for current time
         damage_info = self.damage_data[current_time]
         
-        # Reset colors to initial state
-        self.set_initial_colors()
-        
-        # Update colors based on damage
-        if damage_info["status"] == "Yes":
-            location = damage_info["location"]
-            damage_type = damage_info["damage_type"]
-            damage_color = self.damage_colors[damage_type]
-            
-            # Update colors for the specified location
-            if f'part{location}' in self.parts:
-                # Update arcs and bars
-                for group_type in ['arc1', 'arc2', 'bar']:  # Added 'bar' here
-                    if group_type in self.parts[f'part{location}']:
-                        for element in self.parts[f'part{location}'][group_type]:
-                            self.element_colors[element] = damage_color
+        # Update colors for arcs and bars at the damaged location
+        self.apply_damage_state(current_time, ['arc1', 'arc2', 'bar'])
         
         # Update status message
         if damage_info["status"] == "Yes":
-            self.status_message = f"Time {current_time}: {damage_info['damage_type']} damage at location {damage_info['location']}"
+            self.status_message = f"Time {format_time(current_time)}: {damage_info['damage_type']} damage at location {damage_info['location']}"
         else:
-            self.status_message = f"Time {current_time}: Bridge is safe"
+            self.status_message = f"Time {format_time(current_time)}: Bridge is safe"
         
         self.update_status_text()
-        self.update_geometry(self.current_node_to_index, self.current_edges, self.current_planes)
+        self.render()
 
         
-    def update_status_text(self):
-        if self.status_actor:
-            self.renderer.RemoveActor(self.status_actor)
-        
-        # Create status text actor
+    def create_status_actor(self):
+        # Create status text actor once and only change its input afterwards
         self.status_actor = vtk.vtkTextActor()
-        self.status_actor.SetInput(self.status_message)
         
         # Set text properties
         text_property = self.status_actor.GetTextProperty()
@@ -218,33 +183,25 @@ class Visualization:
         self.status_actor.SetPosition(0.5, 0.02)
         
         self.renderer.AddActor2D(self.status_actor)
-        self.renderer.GetRenderWindow().Render()
+
+    def update_status_text(self):
+        if self.status_actor is None:
+            self.create_status_actor()
+        self.status_actor.SetInput(self.status_message)
 
 
     def update_visualization(self):
         # Get current colors
-        current_time = int(self.time_combo.currentText())
-        damage_info = self.damage_data[current_time]
-        
-        # Reset colors to initial state
-        self.set_initial_colors()
+        index = self.time_combo.currentIndex()
+        if not 0 <= index < len(self.times):
+            return
+        current_time = self.times[index]
         
         # Update colors based on damage
-        if damage_info["status"] == "Yes":
-            location = damage_info["location"]
-            damage_type = damage_info["damage_type"]
-            damage_color = self.damage_colors[damage_type]
-            
-            # Update colors for the specified location
-            if f'part{location}' in self.parts:
-                for group_type in ['arc1', 'arc2']:
-                    if group_type in self.parts[f'part{location}']:
-                        for element in self.parts[f'part{location}'][group_type]:
-                            self.element_colors[element] = damage_color
+        self.apply_damage_state(current_time, ['arc1', 'arc2'])
         
         # Update the visualization
-        self.update_geometry(self.current_node_to_index, self.current_edges, self.current_planes)
-        self.renderer.GetRenderWindow().Render()    
+        self.render()
 
     def create_color_legend(self):
         # Remove old legend if it exists
@@ -356,7 +313,7 @@ class Visualization:
                     ))
 
         self.create_visualization_actors(points)
-        self.update_geometry(node_to_index, edges, planes)
+        self.build_geometry(node_to_index, edges, planes, df_conn)
 
         # Add legend
         self.create_color_legend()
@@ -373,6 +330,7 @@ class Visualization:
         self.current_planes = planes
 
         self.update_status_text()
+        self.render()
 
     def highlight_node(self, x, y, z):
         """Create a highlighted sphere for important nodes"""
@@ -432,46 +390,43 @@ class Visualization:
         self.renderer.AddActor(self.point_actor)
         self.renderer.SetBackground(0.0, 0.0, 0.0)
 
-    def update_geometry(self, node_to_index, edges, planes):
+    def build_geometry(self, node_to_index, edges, planes, df_conn):
+        """Create the edge and plane cells once, colored from the current damage state"""
+        # Map each two-node element to its element number (first match wins)
+        line_elements = df_conn[pd.isna(df_conn['Node3'])]
+        element_of_edge = {}
+        for element_num, node1, node2 in zip(line_elements['Element'],
+                                             line_elements['Node1'],
+                                             line_elements['Node2']):
+            key = (min(int(node1), int(node2)), max(int(node1), int(node2)))
+            element_of_edge.setdefault(key, int(element_num))
+
         # Update edge geometry
         edge_cells = vtk.vtkCellArray()
-        edge_colors = vtk.vtkUnsignedCharArray()
-        edge_colors.SetNumberOfComponents(3)
-        edge_colors.SetName("Colors")
-        
-        # Get the connectivity data once
-        df_nodes, df_conn = DataHandler.load_geometry_data()
+        self.edge_colors = vtk.vtkUnsignedCharArray()
+        self.edge_colors.SetNumberOfComponents(3)
+        self.edge_colors.SetName("Colors")
+        self.element_to_edges = {}
         
         # Process edges and assign colors
-        for node1, node2 in edges:
+        for cell_id, (node1, node2) in enumerate(edges):
             line = vtk.vtkLine()
             line.GetPointIds().SetId(0, node_to_index[node1])
             line.GetPointIds().SetId(1, node_to_index[node2])
             edge_cells.InsertNextCell(line)
             
             # Find the element number for this edge
-            element_found = False
-            element_rows = df_conn[
-                (pd.isna(df_conn['Node3'])) & 
-                (
-                    ((df_conn['Node1'] == node1) & (df_conn['Node2'] == node2)) |
-                    ((df_conn['Node1'] == node2) & (df_conn['Node2'] == node1))
-                )
-            ]
-            
-            if not element_rows.empty:
-                element_num = int(element_rows.iloc[0]['Element'])
-                if element_num in self.element_colors:
-                    color = self.element_colors[element_num]
-                    edge_colors.InsertNextTuple3(
-                        int(color[0] * 255),
-                        int(color[1] * 255),
-                        int(color[2] * 255)
-                    )
-                    element_found = True
-            
-            if not element_found:
-                edge_colors.InsertNextTuple3(255, 255, 255)  # White for non-specified edges
+            element_num = element_of_edge.get((min(node1, node2), max(node1, node2)))
+            if element_num is not None:
+                self.element_to_edges.setdefault(element_num, []).append(cell_id)
+                color = self.damage_state.color_of(element_num)
+            else:
+                color = (1.0, 1.0, 1.0)  # White for non-specified edges
+            self.edge_colors.InsertNextTuple3(
+                int(color[0] * 255),
+                int(color[1] * 255),
+                int(color[2] * 255)
+            )
         
         # Update plane geometry
         plane_cells = vtk.vtkCellArray()
@@ -485,7 +440,5 @@ class Visualization:
         
         # Set geometry
         self.edge_polydata.SetLines(edge_cells)
-        self.edge_polydata.GetCellData().SetScalars(edge_colors)
+        self.edge_polydata.GetCellData().SetScalars(self.edge_colors)
         self.plane_polydata.SetPolys(plane_cells)
-
-        self.renderer.GetRenderWindow().Render()
\ No newline at end of file
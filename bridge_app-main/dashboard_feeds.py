@@ -0,0 +1,242 @@
+import os
+
+from PyQt5.QtCore import pyqtSlot
+
+from data_loader import loader_service
+
+# Matplotlib, OpenGL (model_main) and pandas (data_model) are imported when the
+# panel that needs them is first opened, keeping dashboard startup light.
+_matplotlib_loaded = False
+
+
+def load_matplotlib():
+    """Import the Qt matplotlib classes on first use and apply the dark style"""
+    global _matplotlib_loaded
+    from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+    from matplotlib.figure import Figure
+    if not _matplotlib_loaded:
+        import matplotlib.style
+        matplotlib.style.use('dark_background')  # Set Matplotlib style to dark
+        _matplotlib_loaded = True
+    return Figure, FigureCanvas
+
+
+def load_model_data(filename, task=None):
+    """Parse the 3D model file; runs on a worker thread, so OpenGL is imported there too"""
+    from model_main import read_csv
+    return read_csv(filename, task)
+
+
+class SensorFeedPanels:
+    """Sensor feed windows shared by both dashboards (dashboard.py and dashboard_new.py).
+
+    Mixed into the QMainWindow ahead of it. Each export is loaded once on the
+    loader thread and shared by every window that shows it; the windows are
+    created on first use and reused afterwards. Call init_feeds() from __init__.
+    """
+
+    ACCELEROMETER_FEED = ('accelerometer_window', "Accelerometer Feed", "acc_data.csv", 'Accelerometer_', "Acceleration")
+    STRAIN_GAUGE_FEED = ('strain_gauge_window', "Strain Gauge Feed", "strain_data.csv", 'Strain_Gauge_', "Strain")
+
+    def init_feeds(self):
+        """Feed and window state; call from the window's __init__ before building the UI"""
+        self.feeds = {}  # data file -> loaded SensorFeed
+        self.feed_callbacks = {}  # data file -> callbacks waiting for it to load
+        self.accelerometer_window = None
+        self.strain_gauge_window = None
+        self.stacked_window = None
+        self.modal_window = None
+        self.camera_window = None
+        self.event_windows = {}  # mode -> EventWindow
+        self.event_callbacks = {}  # data file -> callbacks waiting for its event detection
+
+    @pyqtSlot(str)
+    def plot_sensor_graph(self, sensor_key_name):
+        if "Accelerometer_" in sensor_key_name:
+            feed = self.ACCELEROMETER_FEED
+        elif "Strain_Gauge_" in sensor_key_name:
+            feed = self.STRAIN_GAUGE_FEED
+        else:
+            return
+        self.show_feed_window(*feed, then=lambda window: window.select(sensor_key_name))
+
+    def with_feed(self, data_file, prefix, ylabel, callback):
+        """Call callback(feed) once the export is loaded (callback(None) if it fails).
+
+        Parsing and pyramid building run on the loader thread pool with progress in
+        the status bar; each export is loaded once and shared by every window.
+        """
+        if data_file in self.feeds:
+            callback(self.feeds[data_file])
+            return
+        if data_file in self.feed_callbacks:
+            # Already loading; just wait for it
+            self.feed_callbacks[data_file].append(callback)
+            return
+
+        self.feed_callbacks[data_file] = [callback]
+        from sensor_feed import SensorFeed
+        loader_service().submit(
+            SensorFeed.load, data_file, prefix, ylabel,
+            pass_task=True,
+            owner=self,
+            on_progress=lambda percent: self.show_status(f"Loading {data_file}... {percent}%"),
+            on_finished=lambda feed: self.on_feed_loaded(data_file, feed),
+            on_failed=lambda message: self.on_feed_failed(data_file, message),
+            on_cancelled=lambda: self.feed_callbacks.pop(data_file, None)
+        )
+
+    def on_feed_loaded(self, data_file, feed):
+        self.feeds[data_file] = feed
+        self.show_status(f"Loaded {data_file}")
+        for callback in self.feed_callbacks.pop(data_file, []):
+            callback(feed)
+
+    def on_feed_failed(self, data_file, message):
+        print(f"Error reading {data_file}: {message}")
+        self.show_status(f"Could not load {data_file}")
+        for callback in self.feed_callbacks.pop(data_file, []):
+            callback(None)
+
+    def show_feed_window(self, attribute, title, data_file, prefix, ylabel, then=None):
+        """Show a sensor feed window, creating it once its data has loaded and reusing it afterwards"""
+        def show(feed):
+            window = getattr(self, attribute)
+            if window is None:
+                if feed is None:
+                    return
+                load_matplotlib()  # Applies the dark style before the first figure is created
+                from sensor_feed import SensorFeedWindow
+                window = SensorFeedWindow(title, feed, spectrum=(prefix == 'Accelerometer_'),
+                                          fatigue=(prefix == 'Strain_Gauge_'))
+                setattr(self, attribute, window)
+            window.show()
+            window.raise_()
+            if then is not None:
+                then(window)
+
+        if getattr(self, attribute) is not None:
+            show(None)
+        else:
+            self.with_feed(data_file, prefix, ylabel, show)
+
+    def show_accelerometer_feed(self):
+        self.show_feed_window(*self.ACCELEROMETER_FEED)
+
+    def show_strain_gauge_feed(self):
+        self.show_feed_window(*self.STRAIN_GAUGE_FEED)
+
+    def show_all_sensor_channels(self):
+        """Every accelerometer and strain gauge stacked on one linked time axis"""
+        if self.stacked_window is not None:
+            self.stacked_window.show()
+            self.stacked_window.raise_()
+            return
+
+        sources = [self.ACCELEROMETER_FEED, self.STRAIN_GAUGE_FEED]
+        loaded = {}
+
+        def collect(data_file, feed):
+            loaded[data_file] = feed
+            if len(loaded) < len(sources) or self.stacked_window is not None:
+                return
+            traces = []
+            for source in sources:
+                if loaded[source[2]] is not None:
+                    traces.extend(loaded[source[2]].traces())
+            if traces:
+                from sensor_feed import show_stacked_view
+                self.stacked_window = show_stacked_view("Real Life Response - All Channels", traces)
+
+        for _, _, data_file, prefix, ylabel in sources:
+            self.with_feed(data_file, prefix, ylabel, lambda feed, data_file=data_file: collect(data_file, feed))
+
+    def show_modal_analysis(self):
+        """Modal identification over the accelerometer array, animating mode shapes on the 3D model"""
+        if self.modal_window is not None:
+            self.modal_window.show()
+            self.modal_window.raise_()
+            return
+
+        def show(feed):
+            if feed is None or self.modal_window is not None:
+                return
+            load_matplotlib()
+            from modal_view import ModalAnalysisWindow
+            self.modal_window = ModalAnalysisWindow(feed, lambda: getattr(self, 'gl_widget', None))
+            self.modal_window.show()
+
+        _, _, data_file, prefix, ylabel = self.ACCELEROMETER_FEED
+        self.with_feed(data_file, prefix, ylabel, show)
+
+    def show_event_window(self, title, mode):
+        """Traffic Flow / Load Identification: STA/LTA events from the accelerometers"""
+        if mode in self.event_windows:
+            self.event_windows[mode].show()
+            self.event_windows[mode].raise_()
+            return
+
+        def show(table):
+            if mode in self.event_windows:
+                return
+            load_matplotlib()
+            from event_view import EventWindow
+            window = EventWindow(title, table, mode)
+            self.event_windows[mode] = window
+            window.show()
+
+        _, _, data_file, prefix, ylabel = self.ACCELEROMETER_FEED
+        self.with_feed(data_file, prefix, ylabel, lambda feed: self.with_events(data_file, feed, show))
+
+    def with_events(self, data_file, feed, callback):
+        """Call callback(table) with the feed's event table, detecting it first if needed.
+
+        Detection over the whole history runs once, on the loader thread; windows
+        asking while it runs wait for the same table.
+        """
+        if feed is None:
+            return
+        if feed.event_table is not None:
+            callback(feed.event_table)
+            return
+        if data_file in self.event_callbacks:
+            # Already detecting; just wait for it
+            self.event_callbacks[data_file].append(callback)
+            return
+
+        self.event_callbacks[data_file] = [callback]
+
+        def detected(detection):
+            table = feed.attach_events(detection)
+            for waiting in self.event_callbacks.pop(data_file, []):
+                waiting(table)
+
+        def failed(message):
+            self.event_callbacks.pop(data_file, None)
+            self.show_status(f"Event detection failed: {message}")
+
+        loader_service().submit(
+            feed.detect_events,
+            pass_task=True,
+            owner=self,
+            on_progress=lambda percent: self.show_status(f"Detecting events... {percent}%"),
+            on_finished=detected,
+            on_failed=failed,
+            on_cancelled=lambda: self.event_callbacks.pop(data_file, None)
+        )
+
+    def show_camera_feed(self):
+        """Open the camera panel, created once and reused"""
+        if self.camera_window is None:
+            from camera_feed import CameraFeedWindow
+            self.camera_window = CameraFeedWindow(os.path.join('..', 'data', 'cameras'))
+        self.camera_window.show()
+        self.camera_window.raise_()
+
+    def closeEvent(self, event):
+        # Stop any file loading started for this window
+        loader_service().cancel_owned(self)
+        super().closeEvent(event)
+
+    def show_status(self, message):
+        self.statusBar().showMessage(message)
@@ -1,30 +1,31 @@
 import sys
 import os
-import subprocess
+import time
+from startup_profile import profiler, report_requested
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QDockWidget, QWidget, QVBoxLayout, 
     QHBoxLayout, QLabel, QPushButton, QTableWidget, QTableWidgetItem, 
     QHeaderView, QComboBox, QLineEdit, QFrame, QScrollArea, QSizePolicy,
-    QStackedWidget, QToolBar, QStatusBar
+    QStackedWidget, QToolBar, QStatusBar, QTabWidget, QTabBar
 )
 
 from PyQt5.QtGui import QPixmap, QFont, QColor, QPalette
-from PyQt5.QtCore import Qt
-from model_main import GLWidget, read_csv  # Import GLWidget and read_csv function
+from PyQt5.QtCore import Qt, QTimer
 import csv
 from functools import partial
 # Add these imports at the top of your existing imports
 import qtawesome as qta
-from PyQt5.QtWidgets import (
-    QApplication, QMainWindow, QDockWidget, QWidget, QVBoxLayout, 
-    QHBoxLayout, QLabel, QPushButton, QTableWidget, QTableWidgetItem, 
-    QHeaderView, QComboBox, QLineEdit, QFrame, QScrollArea
-)
-# Import Matplotlib for plotting
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-import matplotlib.pyplot as plt
 from PyQt5.QtCore import pyqtSlot
+from data_loader import loader_service, run_in_background
+from thumbnail_cache import ThumbnailCache
+from dashboard_feeds import SensorFeedPanels, load_matplotlib, load_model_data
+
+
+def preload_data_model():
+    from data_model import shared_model
+    shared_model().preload()
+
+
 class ModernWidget(QWidget):
     """Base template for modern-looking widgets"""
     def __init__(self, parent=None):
@@ -75,6 +76,7 @@ class DataGraphWidget(ModernWidget):
         title_label.setStyleSheet("color: white;")
         
         # Graph canvas
+        Figure, FigureCanvas = load_matplotlib()
         self.figure = Figure(facecolor='#2C2C2C')
         self.canvas = FigureCanvas(self.figure)
         self.ax = self.figure.add_subplot(111)
@@ -113,7 +115,6 @@ class ControlPanel(ModernWidget):
         
         layout.addWidget(title_label)
         layout.addLayout(buttons_layout)
-plt.style.use('dark_background')  # Set Matplotlib style to dark
 class ModernButton(QPushButton):
     def __init__(self, text="", icon=None, parent=None):
         super().__init__(text, parent)
@@ -139,16 +140,27 @@ class ModernButton(QPushButton):
             }
         """)
 
-class MainAppWindow(QMainWindow):
+class MainAppWindow(SensorFeedPanels, QMainWindow):
     def __init__(self):
         super().__init__()
         self.path = os.path.join(os.getcwd(), "images")
+        self.thumbnails = ThumbnailCache(self.path)
         self.setWindowTitle("Bridge Digital Twin Interface")
         self.setGeometry(100, 100, 1600, 900)
         self.sensors = self.read_sensor_data()
+        self.analysis_views = {}  # Embedded analysis windows, created once and reused
+        self.init_feeds()
         self.setup_ui()
         self.setup_statusbar()
         self.setup_toolbar()
+
+        # Warm the shared data model so analysis views open without touching Excel
+        run_in_background(preload_data_model)
+
+        # Scale the sensor window images ahead of time so opening it decodes nothing
+        sensor_thumbnails = [('bridge_image.png', 1000, 400)]
+        sensor_thumbnails += [(img_file, 100, 100) for img_file in {sensor['image'] for sensor in self.sensors}]
+        run_in_background(self.thumbnails.generate, sensor_thumbnails)
         
     def setup_statusbar(self):
         self.statusBar = QStatusBar()
@@ -237,13 +249,17 @@ class MainAppWindow(QMainWindow):
             ("eye", "View"),
             ("tools", "Tools"),
             ("question-circle", "Help"),
-            ("comment", "Feedback")
+            ("comment", "Feedback"),
+            ("wave-square", "Modal Analysis")
         ]
         
         for icon_name, text in menu_items:
             icon = qta.icon(f"fa5s.{icon_name}", color='white')
             btn = ModernButton(text, icon)
-            btn.clicked.connect(lambda checked, t=text: self.open_menu(t))
+            if text == "Modal Analysis":
+                btn.clicked.connect(self.show_modal_analysis)
+            else:
+                btn.clicked.connect(lambda checked, t=text: self.open_menu(t))
             layout.addWidget(btn)
             
         layout.addStretch()
@@ -251,10 +267,6 @@ class MainAppWindow(QMainWindow):
         return sidebar
 
     def create_center_area(self):
-        # Load data for 3D model
-        node_data, element_data, node_weights = read_csv("nodes_animated.csv")
-        gl_widget = GLWidget(node_data, element_data, node_weights, self)
-        
         # Create frame for 3D view
         frame = QFrame()
         frame.setFrameStyle(QFrame.StyledPanel)
@@ -271,8 +283,46 @@ class MainAppWindow(QMainWindow):
         layout = QVBoxLayout(frame)
         layout.setContentsMargins(4, 4, 4, 4)  # Reduce margins
         layout.setSpacing(4)  # Reduce spacing
-        layout.addWidget(gl_widget)
-        return frame
+
+        # Show a placeholder while the 3D model loads in the background
+        self.model_layout = layout
+        self.model_placeholder = QLabel("Loading 3D model...")
+        self.model_placeholder.setAlignment(Qt.AlignCenter)
+        self.model_placeholder.setStyleSheet("color: #AAAAAA;")
+        layout.addWidget(self.model_placeholder)
+        loader_service().submit(
+            load_model_data, "nodes_animated.csv",
+            pass_task=True,
+            owner=self,
+            on_progress=lambda percent: self.model_placeholder.setText(f"Loading 3D model... {percent}%"),
+            on_finished=self.on_model_loaded,
+            on_failed=self.on_model_failed
+        )
+
+        # Analysis views open as extra tabs next to the 3D model
+        self.center_tabs = QTabWidget()
+        self.center_tabs.setTabsClosable(True)
+        self.center_tabs.addTab(frame, "3D Model")
+        self.center_tabs.tabBar().setTabButton(0, QTabBar.RightSide, None)
+        self.center_tabs.tabCloseRequested.connect(self.close_analysis_tab)
+        self.center_tabs.currentChanged.connect(self.on_center_tab_changed)
+        return self.center_tabs
+
+    def on_model_loaded(self, model_data):
+        from model_main import GLWidget  # Already imported by the loader thread
+        node_data, element_data, node_weights = model_data
+        gl_widget = GLWidget(node_data, element_data, node_weights, self)
+        self.gl_widget = gl_widget
+
+        self.model_layout.replaceWidget(self.model_placeholder, gl_widget)
+        self.model_placeholder.deleteLater()
+        profiler.mark("3D model loaded")
+        report_startup()
+
+    def on_model_failed(self, message):
+        self.model_placeholder.setText(f"Could not load 3D model: {message}")
+        profiler.mark("3D model failed")
+        report_startup()
 
     def create_right_sidebar(self):
         sidebar = QWidget()
@@ -301,11 +351,8 @@ class MainAppWindow(QMainWindow):
             
             # Image
             img_label = QLabel()
-            img_path = os.path.join(self.path, img_file)
-            if os.path.exists(img_path):
-                pixmap = QPixmap(img_path).scaled(
-                    100, 100, Qt.KeepAspectRatio, Qt.SmoothTransformation
-                )
+            pixmap = self.thumbnails.pixmap(img_file, 100, 100)
+            if pixmap is not None:
                 img_label.setPixmap(pixmap)
             img_label.setAlignment(Qt.AlignCenter)
             
@@ -330,70 +377,9 @@ class MainAppWindow(QMainWindow):
         return sidebar
 
     def read_sensor_data(self):
-        sensor_data_str = '''Sensors\tDescriptions\tLocation\tx(m)\ty(m)\tz(m)\tColor (Small Sphere or Cube)
-Accelerometer 1\t(PCB 393B04) Uniaxial Lateral\t9-10 (A)\t28,5\t16,155415\t12,4\tRED
-Accelerometer 2\t(PCB 393B04) Uniaxial Lateral\t9-10 (C)\t28,5\t16,155415\t0\tRED
-Accelerometer 3\t(PCB 393B04) Uniaxial Lateral\t15-16 (A)\t51,7\t20,811278\t12,4\tRED
-Accelerometer 4\t(PCB 393B04) Uniaxial Lateral\t15-16 (C)\t51,7\t20,811278\t0\tRED
-Accelerometer 5\t(PCB 393B04) Uniaxial Lateral\t21-22 (A)\t74,95\t19,276895\t12,4\tRED
-Accelerometer 6\t(PCB 393B04) Uniaxial Lateral\t21-22 (C)\t74,95\t19,276895\t0\tRED
-Accelerometer 7\t(PCB 393B04) Uniaxial Lateral\t17 (A)\t57,495\t0\t12,4\tRED
-Accelerometer 8\t(PCB 393B04) Uniaxial Lateral\t23 (A)\t80,493\t0\t12,4\tRED
-Accelerometer 9\t(PCB 393B04) Uniaxial Vertical\t11 (A)\t34,497\t0\t12,4\tRED
-Accelerometer 10\t(PCB 393B04) Uniaxial Vertical\t17 (A)\t57,495\t0\t12,4\tRED
-Accelerometer 11\t(PCB 393B04) Uniaxial Vertical\t17 (C)\t57,495\t0\t0\tRED
-Accelerometer 12\t(PCB 393B04) Uniaxial Vertical\t23 (A)\t80,493\t0\t12,4\tRED
-Strain Gauge 1\t(CEA-06-250UN-350) Uniaxial\t20-21 (A)\t71,972\t9,638447\t12,4\tGreen
-Strain Gauge 2\t(CEA-06-250UN-350) Uniaxial\t20-21 (C)\t71,972\t9,638447\t0\tGreen
-Strain Gauge 3\t(CEA-06-250UN-350) Uniaxial\t23-24 (A)\t83,4965\t8,077707\t12,4\tGreen
-Strain Gauge 4\t(CEA-06-250UN-350) Uniaxial\t23-24 (C)\t83,4965\t8,077707\t0\tGreen
-Strain Gauge 5\t(CEA-06-250UN-350) Uniaxial\t10-11 (A)\t32,5805\t0\t12,4\tGreen
-Strain Gauge 6\t(CEA-06-250UN-350) Uniaxial\t14-15 (A)\t47,9125\t0\t12,4\tGreen
-Strain Gauge 7\t(CEA-06-250UN-350) Uniaxial\t17-18 (A)\t59,4115\t0\t12,4\tGreen
-Strain Gauge 8\t(CEA-06-250UN-350) Uniaxial\t17-18 (C)\t59,4115\t0\t0\tGreen
-Strain Gauge 9\t(CEA-06-250UN-350) Uniaxial\t23-24 (A)\t82,4095\t0\t12,4\tGreen
-Strain Gauge 10\t(CEA-06-250UN-350) Uniaxial\t23-24 (A)\t82,4095\t0\t12\tGreen
-Strain Gauge 11\t(CEA-06-250UN-350) Uniaxial\t23-24 (C)\t82,4095\t0\t0\tGreen
-Strain Gauge 12\t(CEA-06-250UN-350) Uniaxial\t27-28 (A)\t97,7415\t0\t12,4\tGreen
-Camera 1\tPTZ\t1 (B)\t0\t0\t6,2\tOrange
-Camera 2\tPTZ\t33 (B)\t115\t0\t6,2\tOrange'''
-
-        sensors_list = []
-
-        lines = sensor_data_str.strip().split('\n')
-        headers = lines[0].split('\t')
-        for line in lines[1:]:
-            fields = line.split('\t')
-            data = dict(zip(headers, fields))
-            # Replace commas with dots in numerical values and convert to floats
-            x = float(data['x(m)'].replace(',', '.'))
-            y = float(data['y(m)'].replace(',', '.'))
-            z = float(data['z(m)'].replace(',', '.'))
-
-            # Determine image based on sensor name
-            if 'Accelerometer' in data['Sensors']:
-                image = 'accelerometer_img.jpg'
-            elif 'Strain Gauge' in data['Sensors']:
-                image = 'strain_gauge_img.jpeg'
-            elif 'Camera' in data['Sensors']:
-                image = 'Camera.jpg'
-            else:
-                image = 'default_sensor_img.jpg'
-
-            sensor = {
-                'name': data['Sensors'],
-                'description': data['Descriptions'],
-                'location': data['Location'],
-                'x': x,
-                'y': y,
-                'z': z,
-                'color': data['Color (Small Sphere or Cube)'],
-                'image': image
-            }
-            sensor['data_key'] = sensor['name'].replace(' ', '_')
-            sensors_list.append(sensor)
-
-        return sensors_list
+        # The inventory lives in data/sensors.tsv and is parsed once per process
+        from sensor_registry import shared_registry
+        return shared_registry().sensors
     def create_bottom_panel(self):
         # Create bottom panel container
         bottom_panel = QWidget()
@@ -440,11 +426,8 @@ Camera 2\tPTZ\t33 (B)\t115\t0\t6,2\tOrange'''
             
             # Add image
             img_label = QLabel()
-            img_path = os.path.join(self.path, img_file)
-            if os.path.exists(img_path):
-                pixmap = QPixmap(img_path).scaled(
-                    80, 40, Qt.KeepAspectRatio, Qt.SmoothTransformation
-                )
+            pixmap = self.thumbnails.pixmap(img_file, 80, 40)
+            if pixmap is not None:
                 img_label.setPixmap(pixmap)
             img_label.setAlignment(Qt.AlignCenter)
             
@@ -456,10 +439,18 @@ Camera 2\tPTZ\t33 (B)\t115\t0\t6,2\tOrange'''
             # Connect button signals
             if text == "View Sensors Location":
                 button.clicked.connect(self.show_sensors_location)
+            elif text == "Real Life Response":
+                button.clicked.connect(self.show_all_sensor_channels)
+            elif text == "Camera Feed":
+                button.clicked.connect(self.show_camera_feed)
             elif text == "Strain Gauge Feed":
                 button.clicked.connect(self.show_strain_gauge_feed)
             elif text == "Accelerometer Feed":
                 button.clicked.connect(self.show_accelerometer_feed)
+            elif text == "Traffic Flow":
+                button.clicked.connect(lambda: self.show_event_window("Traffic Flow", 'flow'))
+            elif text == "Load Identification":
+                button.clicked.connect(lambda: self.show_event_window("Load Identification", 'load'))
             
             # Add widgets to container
             container_layout.addWidget(img_label)
@@ -508,8 +499,7 @@ Camera 2\tPTZ\t33 (B)\t115\t0\t6,2\tOrange'''
         ]
         
         for text, img_file in buttons_texts:
-            img_path = os.path.join(self.path, img_file)
-            pixmap = QPixmap(img_path).scaled(150, 150, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            pixmap = self.thumbnails.pixmap(img_file, 150, 150) or QPixmap()
             img_label = QLabel()
             img_label.setPixmap(pixmap)
 
@@ -537,6 +527,7 @@ Camera 2\tPTZ\t33 (B)\t115\t0\t6,2\tOrange'''
         self.addDockWidget(Qt.RightDockWidgetArea, right_frame)
         
         # Load node, element, and weight data for the 3D model
+        from model_main import GLWidget, read_csv
         node_data, element_data, node_weights = read_csv("nodes_animated.csv")
 
         # Set the 3D model as the central widget
@@ -571,8 +562,7 @@ Camera 2\tPTZ\t33 (B)\t115\t0\t6,2\tOrange'''
         ]
         
         for i, (text, img_file) in enumerate(bottom_buttons_texts):
-            img_path = os.path.join(self.path, img_file)
-            pixmap = QPixmap(img_path).scaled(100, 80, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            pixmap = self.thumbnails.pixmap(img_file, 100, 80) or QPixmap()
             img_label = QLabel()
             img_label.setPixmap(pixmap)
 
@@ -623,20 +613,78 @@ Camera 2\tPTZ\t33 (B)\t115\t0\t6,2\tOrange'''
     def open_menu(self, text):
         print(f"{text} menu opened")
 
-    # Method to open model.py when Deformation Analysis button is clicked
+    def open_analysis_view(self, key, title, create_view):
+        """Show an analysis view as a tab, creating it on first use"""
+        start = time.perf_counter()
+        view = self.analysis_views.get(key)
+        if view is None:
+            view = create_view()
+            view.setWindowFlags(Qt.Widget)  # Embed the QMainWindow as a plain widget
+            view.interactor.Initialize()
+            self.analysis_views[key] = view
+
+        index = self.center_tabs.indexOf(view)
+        if index < 0:
+            index = self.center_tabs.addTab(view, title)
+        self.center_tabs.setCurrentIndex(index)
+        self.statusBar.showMessage(f"{title} opened in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    def on_center_tab_changed(self, index):
+        # Only the visible analysis view keeps its timers running
+        current = self.center_tabs.widget(index)
+        for view in self.analysis_views.values():
+            view.set_active(view is current)
+
+    def close_analysis_tab(self, index):
+        # Keep the view alive so reopening it is instant
+        view = self.center_tabs.widget(index)
+        if view in self.analysis_views.values():
+            view.set_active(False)
+            self.center_tabs.removeTab(index)
+
+    # Open the deformation viewer in-process when Deformation Analysis button is clicked
     def open_deformation_analysis(self):
-        # Get the absolute path to model.py
-        model_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'main_visualization', 'main.py')
-        
-        # Use sys.executable to ensure the right Python interpreter is used
-        subprocess.Popen([sys.executable, model_path])
+        def create_view():
+            from main_visualization.main_window import MainWindow as DeformationWindow
+            return DeformationWindow()
+        self.open_analysis_view('deformation', "Deformation Analysis", create_view)
 
     def open_damage_detection(self):
-        # Path to the main.py file in confusion_matrix directory
-        main_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'confusion_matrix', 'main.py')
-        
-        # Use sys.executable to ensure the correct Python interpreter is used
-        subprocess.Popen([sys.executable, main_path])
+        def create_view():
+            from confusion_matrix.main_window import MainWindow as DamageWindow
+            view = DamageWindow()
+            self.detect_damage(view)
+            return view
+        self.open_analysis_view('damage', "Damage Detection", create_view)
+
+    def detect_damage(self, view):
+        """Replace the damage view's recorded timeline with one detected from the sensor feeds"""
+        def show(table):
+            if len(table) == 0:
+                self.show_status("Not enough sensor data for damage detection; showing the recorded timeline")
+                return
+            view.show_damage_table(table)
+            self.show_status(f"Damage detected over {len(table)} windows")
+
+        def detect(acc_feed, strain_feed):
+            if acc_feed is None or strain_feed is None:
+                return
+            from confusion_matrix.data_handler import DataHandler
+            # Alignment and every window's indicators run on the loader thread
+            loader_service().submit(
+                DataHandler.compute_damage_table, acc_feed, strain_feed,
+                pass_task=True,
+                owner=view,
+                on_progress=lambda percent: self.show_status(f"Detecting damage... {percent}%"),
+                on_finished=show,
+                on_failed=lambda message: self.show_status(f"Damage detection failed: {message}")
+            )
+
+        _, _, acc_file, acc_prefix, acc_ylabel = self.ACCELEROMETER_FEED
+        _, _, strain_file, strain_prefix, strain_ylabel = self.STRAIN_GAUGE_FEED
+        self.with_feed(acc_file, acc_prefix, acc_ylabel, lambda acc_feed: self.with_feed(
+            strain_file, strain_prefix, strain_ylabel, lambda strain_feed: detect(acc_feed, strain_feed)
+        ))
 
         # Method to show the sensors location in a table
     def show_sensors_location(self):
@@ -651,11 +699,10 @@ Camera 2\tPTZ\t33 (B)\t115\t0\t6,2\tOrange'''
 
         # Load the images
         bridge_image1 = QLabel()
-        bridge_img_path1 = os.path.join(self.path, 'bridge_image.png')
+        pixmap1 = self.thumbnails.pixmap('bridge_image.png', 1000, 400)
 
         # Ensure the images exist
-        if os.path.exists(bridge_img_path1):
-            pixmap1 = QPixmap(bridge_img_path1).scaled(1000, 400, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        if pixmap1 is not None:
             bridge_image1.setPixmap(pixmap1)
             bridge_image1.setAlignment(Qt.AlignCenter)
         else:
@@ -679,9 +726,8 @@ Camera 2\tPTZ\t33 (B)\t115\t0\t6,2\tOrange'''
 
             # Image
             img_label = QLabel()
-            img_path = os.path.join(self.path, sensor['image'])
-            if os.path.exists(img_path):
-                pixmap = QPixmap(img_path).scaled(100, 100, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            pixmap = self.thumbnails.pixmap(sensor['image'], 100, 100)
+            if pixmap is not None:
                 img_label.setPixmap(pixmap)
             else:
                 img_label.setText("No Image")
@@ -711,207 +757,54 @@ Camera 2\tPTZ\t33 (B)\t115\t0\t6,2\tOrange'''
         self.sensor_window.setLayout(sensor_layout)
         self.sensor_window.show()
 
-    @pyqtSlot(str)
-    def plot_sensor_graph(self, sensor_key_name):
-        if "Accelerometer_" in sensor_key_name:
-            self.show_accelerometer_feed()
-            index = self.acc_dropdown.findText(sensor_key_name)
-            if index >= 0:
-                self.acc_dropdown.setCurrentIndex(index)
-                self.update_accelerometer_plot()
-        elif "Strain_Gauge_" in sensor_key_name:
-            self.show_strain_gauge_feed()
-            index = self.strain_dropdown.findText(sensor_key_name)
-            if index >= 0:
-                self.strain_dropdown.setCurrentIndex(index)
-                self.update_strain_gauge_plot()
-
-    # New method to show accelerometer feed
-    def show_accelerometer_feed(self):
-        # Read the CSV file
-        data_file = "acc_data.csv"
-        time_values = []
-        accelerometer_data = {}  # Dictionary to hold data for each accelerometer
-
-        try:
-            with open(data_file, newline='', encoding='utf-8') as csvfile:
-                reader = csv.DictReader(csvfile, delimiter=';')
-                # Initialize accelerometer_data with empty lists
-                for field in reader.fieldnames:
-                    if field.startswith('Accelerometer_'):
-                        accelerometer_data[field] = []
-                for row in reader:
-                    print(row)
-                    # Replace commas with dots and convert to float
-                    time = float(row['\ufeffTime'].replace(',', '.'))
-                    time_values.append(time)
-                    for key in accelerometer_data.keys():
-                        value_str = row[key].replace(',', '.')
-                        if value_str == '':
-                            value = None
-                        else:
-                            value = float(value_str)
-                        accelerometer_data[key].append(value)
-        except Exception as e:
-            print(f"Error reading accelerometer data: {e}")
-            return
-
-        # Create a new window
-        self.accelerometer_window = QWidget()
-        self.accelerometer_window.setWindowTitle("Accelerometer Feed")
-        self.accelerometer_window.setGeometry(100, 100, 800, 600)
-        layout = QVBoxLayout()
-
-        # Create a dropdown
-        self.acc_dropdown = QComboBox()
-        # Get the list of accelerometer names from the keys
-        accelerometer_names = list(accelerometer_data.keys())
-        # Sort the accelerometer names to ensure correct order
-        accelerometer_names.sort(key=lambda x: int(x.split('_')[1]))
-        self.acc_dropdown.addItems(accelerometer_names)
-        self.acc_dropdown.currentIndexChanged.connect(self.update_accelerometer_plot)
-
-        # Save the data to instance variables
-        self.acc_time_values = time_values
-        self.acc_data = accelerometer_data
-
-        # Create the matplotlib Figure and FigureCanvas
-        self.figure = Figure()
-        self.canvas = FigureCanvas(self.figure)
-
-        # Add widgets to layout
-        layout.addWidget(self.acc_dropdown)
-        layout.addWidget(self.canvas)
-
-        self.accelerometer_window.setLayout(layout)
-        self.accelerometer_window.show()
-
-        # Initial plot
-        self.update_accelerometer_plot()
-
-    def update_accelerometer_plot(self):
-        # Clear the figure
-        self.figure.clear()
-        ax = self.figure.add_subplot(111)
-
-        # Get selected accelerometer
-        selected_accelerometer = self.acc_dropdown.currentText()
-        y_values = self.acc_data[selected_accelerometer]
-        label = selected_accelerometer
-
-        # Plot the data
-        ax.plot(self.acc_time_values, y_values, label=label, marker='', linewidth=0.8)  # Removes markers, keeps only the line
-        ax.set_title(f"{label} Data Over Time")
-        ax.set_xlabel("Time")
-        ax.set_ylabel("Acceleration")
-        ax.legend()
-
-        self.canvas.draw()
-    def show_strain_gauge_feed(self):
-        # Read the CSV file
-        data_file = "strain_data.csv"
-        time_values = []
-        strain_gauge_data = {}  # Dictionary to hold data for each strain gauge
-
-        try:
-            with open(data_file, newline='', encoding='utf-8-sig') as csvfile:
-                reader = csv.DictReader(csvfile, delimiter=';')
-                # Normalize field names
-                reader.fieldnames = [field.strip('\ufeff') for field in reader.fieldnames]
-                # Initialize strain_gauge_data with empty lists
-                for field in reader.fieldnames:
-                    if field.startswith('Strain_Gauge_'):
-                        strain_gauge_data[field] = []
-                for row in reader:
-                    # Replace commas with dots and convert to float
-                    time = float(row['Time'].replace(',', '.'))
-                    time_values.append(time)
-                    for key in strain_gauge_data.keys():
-                        value_str = row[key].replace(',', '.')
-                        if value_str == '':
-                            value = None
-                        else:
-                            value = float(value_str)
-                        strain_gauge_data[key].append(value)
-        except Exception as e:
-            print(f"Error reading strain gauge data: {e}")
-            return
-
-        # Create a new window
-        self.strain_gauge_window = QWidget()
-        self.strain_gauge_window.setWindowTitle("Strain Gauge Feed")
-        self.strain_gauge_window.setGeometry(100, 100, 800, 600)
-        layout = QVBoxLayout()
-
-        # Create a dropdown
-        self.strain_dropdown = QComboBox()
-        # Get the list of strain gauge names from the keys
-        strain_gauge_names = list(strain_gauge_data.keys())
-        # Sort the strain gauge names to ensure correct order
-        strain_gauge_names.sort(key=lambda x: int(x.split('_')[2]))
-        self.strain_dropdown.addItems(strain_gauge_names)
-        self.strain_dropdown.currentIndexChanged.connect(self.update_strain_gauge_plot)
-
-        # Save the data to instance variables
-        self.strain_time_values = time_values
-        self.strain_data = strain_gauge_data
-
-        # Create the matplotlib Figure and FigureCanvas
-        self.strain_figure = Figure()
-        self.strain_canvas = FigureCanvas(self.strain_figure)
-
-        # Add widgets to layout
-        layout.addWidget(self.strain_dropdown)
-        layout.addWidget(self.strain_canvas)
-
-        self.strain_gauge_window.setLayout(layout)
-        self.strain_gauge_window.show()
-
-        # Initial plot
-        self.update_strain_gauge_plot()
-
-    def update_strain_gauge_plot(self):
-        # Clear the figure
-        self.strain_figure.clear()
-        ax = self.strain_figure.add_subplot(111)
-
-        # Get selected strain gauge
-        selected_strain_gauge = self.strain_dropdown.currentText()
-        y_values = self.strain_data[selected_strain_gauge]
-        label = selected_strain_gauge
-
-        # Plot the data
-        ax.plot(self.strain_time_values, y_values, label=label, marker='', linewidth=0.8)
-        ax.set_title(f"{label} Data Over Time")
-        ax.set_xlabel("Time")
-        ax.set_ylabel("Strain")
-        ax.legend()
-
-        self.strain_canvas.draw()
-
-
-
-# Create the application and set the style
-app = QApplication(sys.argv)
-app.setStyle('Fusion')
-
-# Set the dark palette
-palette = QPalette()
-palette.setColor(QPalette.Window, QColor(53, 53, 53))
-palette.setColor(QPalette.WindowText, Qt.white)
-palette.setColor(QPalette.Base, QColor(25, 25, 25))
-palette.setColor(QPalette.AlternateBase, QColor(53, 53, 53))
-palette.setColor(QPalette.ToolTipBase, Qt.white)
-palette.setColor(QPalette.ToolTipText, Qt.white)
-palette.setColor(QPalette.Text, Qt.white)
-palette.setColor(QPalette.Button, QColor(53, 53, 53))
-palette.setColor(QPalette.ButtonText, Qt.white)
-palette.setColor(QPalette.BrightText, Qt.red)
-palette.setColor(QPalette.Link, QColor(42, 130, 218))
-palette.setColor(QPalette.Highlight, QColor(42, 130, 218))
-palette.setColor(QPalette.HighlightedText, Qt.black)
-app.setPalette(palette)
-
-window = MainAppWindow()
-window.show()
-sys.exit(app.exec_())
\ No newline at end of file
+    def show_status(self, message):
+        self.statusBar.showMessage(message)
+
+
+def report_startup():
+    """Print (and optionally append to BRIDGE_STARTUP_JSON) the startup milestones"""
+    if not report_requested():
+        return
+    print(profiler.report())
+    json_path = os.environ.get('BRIDGE_STARTUP_JSON')
+    if json_path:
+        from startup_profile import append_json
+        append_json(json_path, {'entry_point': 'dashboard_new', 'milestones_ms': profiler.milestones()})
+
+
+def main():
+    profiler.mark("imports done")
+
+    # Create the application and set the style
+    app = QApplication(sys.argv)
+    app.setStyle('Fusion')
+
+    # Set the dark palette
+    palette = QPalette()
+    palette.setColor(QPalette.Window, QColor(53, 53, 53))
+    palette.setColor(QPalette.WindowText, Qt.white)
+    palette.setColor(QPalette.Base, QColor(25, 25, 25))
+    palette.setColor(QPalette.AlternateBase, QColor(53, 53, 53))
+    palette.setColor(QPalette.ToolTipBase, Qt.white)
+    palette.setColor(QPalette.ToolTipText, Qt.white)
+    palette.setColor(QPalette.Text, Qt.white)
+    palette.setColor(QPalette.Button, QColor(53, 53, 53))
+    palette.setColor(QPalette.ButtonText, Qt.white)
+    palette.setColor(QPalette.BrightText, Qt.red)
+    palette.setColor(QPalette.Link, QColor(42, 130, 218))
+    palette.setColor(QPalette.Highlight, QColor(42, 130, 218))
+    palette.setColor(QPalette.HighlightedText, Qt.black)
+    app.setPalette(palette)
+
+    window = MainAppWindow()
+    profiler.mark("window constructed")
+    window.show()
+    profiler.mark("window shown")
+
+    # The first pass through the event loop is when the window can take input
+    QTimer.singleShot(0, lambda: profiler.mark("interactive"))
+    sys.exit(app.exec_())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+
+class LoadCancelled(Exception):
+    """Raised inside a task function when its task has been cancelled"""
+
+
+class TaskSignals(QObject):
+    """Signals a background task uses to hand its result back to the GUI thread"""
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(str)
+    progress = pyqtSignal(int)  # Percent complete
+    cancelled = pyqtSignal()
+
+
+class BackgroundTask(QRunnable):
+    """Run a function on the Qt thread pool and report the result through signals.
+
+    With pass_task=True the function is called with task=<this task>, so it can call
+    task.report_progress(done, total) and task.check_cancelled() as it goes. Results
+    are emitted as the object the function returned, so NumPy arrays reach the GUI
+    thread without being copied.
+    """
+
+    def __init__(self, function, *args, pass_task=False, **kwargs):
+        super().__init__()
+        self.function = function
+        self.args = args
+        self.kwargs = dict(kwargs, task=self) if pass_task else kwargs
+        self.signals = TaskSignals()
+        self.is_cancelled = False
+        self.last_percent = -1
+
+    def cancel(self):
+        self.is_cancelled = True
+
+    def check_cancelled(self):
+        if self.is_cancelled:
+            raise LoadCancelled()
+
+    def report_progress(self, done, total):
+        """Emit progress, only when the whole percentage changes"""
+        percent = int(100 * done / total) if total else 100
+        if percent != self.last_percent:
+            self.last_percent = percent
+            self.signals.progress.emit(percent)
+
+    def run(self):
+        try:
+            self.check_cancelled()
+            result = self.function(*self.args, **self.kwargs)
+            self.check_cancelled()
+        except LoadCancelled:
+            self.signals.cancelled.emit()
+            return
+        except Exception as e:
+            self.signals.failed.emit(f"{type(e).__name__}: {e}")
+            return
+        self.signals.finished.emit(result)
+
+
+class LoaderService(QObject):
+    """Starts loading tasks on a thread pool and cancels them along with the window that owns them"""
+
+    def __init__(self, pool=None, parent=None):
+        super().__init__(parent)
+        self.pool = pool or QThreadPool.globalInstance()
+        self.running = {}  # task -> owner (or None)
+
+    def submit(self, function, *args, on_finished=None, on_failed=None, on_progress=None,
+               on_cancelled=None, owner=None, pass_task=False, **kwargs):
+        """Start function(*args, **kwargs) on the pool.
+
+        on_finished(result), on_failed(message), on_progress(percent) and on_cancelled()
+        are called on the GUI thread. Tasks with an owner are cancelled by cancel_owned(owner) or when
+        the owner is destroyed; a cancelled task never calls on_finished.
+        """
+        task = BackgroundTask(function, *args, pass_task=pass_task, **kwargs)
+
+        # Keep the task (and its signals object) alive until it reports back
+        self.running[task] = owner
+        for signal in (task.signals.finished, task.signals.failed):
+            signal.connect(lambda _, task=task: self.running.pop(task, None))
+        task.signals.cancelled.connect(lambda task=task: self.running.pop(task, None))
+        if on_finished is not None:
+            # The task may finish just before it is cancelled, with its result still queued
+            task.signals.finished.connect(
+                lambda result, task=task: None if task.is_cancelled else on_finished(result)
+            )
+        if on_failed is not None:
+            task.signals.failed.connect(on_failed)
+        if on_progress is not None:
+            task.signals.progress.connect(on_progress)
+        if on_cancelled is not None:
+            task.signals.cancelled.connect(on_cancelled)
+        if owner is not None:
+            owner.destroyed.connect(lambda *_, task=task: task.cancel())
+
+        task.setAutoDelete(False)
+        self.pool.start(task)
+        return task
+
+    def cancel_owned(self, owner):
+        """Cancel every task started for owner, e.g. from its closeEvent"""
+        for task, task_owner in list(self.running.items()):
+            if task_owner is owner:
+                task.cancel()
+
+
+_service = None
+
+
+def loader_service():
+    """Return the application-wide LoaderService"""
+    global _service
+    if _service is None:
+        _service = LoaderService()
+    return _service
+
+
+def run_in_background(function, *args, on_finished=None, on_failed=None, **kwargs):
+    """Start function(*args, **kwargs) on the global thread pool.
+
+    on_finished(result) and on_failed(message) are called on the GUI thread.
+    """
+    return loader_service().submit(function, *args, on_finished=on_finished, on_failed=on_failed, **kwargs)
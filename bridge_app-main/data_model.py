@@ -0,0 +1,67 @@
+import threading
+import pandas as pd
+
+
+class BridgeDataModel:
+    """Workbook tables loaded once per process and shared by every analysis view"""
+
+    def __init__(self, data_dir='../data'):
+        self.data_dir = data_dir
+        self._cache = {}
+        self._lock = threading.Lock()
+
+    def _cached(self, key, load):
+        # Loads may run on a worker thread while a view asks for the same table
+        with self._lock:
+            if key not in self._cache:
+                self._cache[key] = load()
+            return self._cache[key]
+
+    def geometry(self):
+        """Return (df_nodes, df_conn) from data.xlsx"""
+        def load():
+            path = f'{self.data_dir}/data.xlsx'
+            df_nodes = pd.read_excel(path, sheet_name='Sheet1', header=None, skiprows=5, usecols='I:L', nrows=1882)
+            df_nodes.columns = ['number', 'x', 'y', 'z']
+
+            df_conn = pd.read_excel(path, sheet_name='Sheet1', header=None, skiprows=4, usecols='A:E', nrows=1882)
+            df_conn.columns = ['Element', 'Node1', 'Node2', 'Node3', 'Node4']
+            return df_nodes, df_conn
+        return self._cached('geometry', load)
+
+    def field_table(self, path=None, num_columns=31):
+        """Return the 'Variables for 5 Timesteps' sheet as a numeric DataFrame"""
+        path = path or f'{self.data_dir}/Data_.xlsx'
+
+        def load():
+            df_fields = pd.read_excel(path, sheet_name='Variables for 5 Timesteps', header=None, skiprows=1, usecols=range(num_columns), nrows=1882)
+            return df_fields.dropna(subset=[0]).fillna(0.0)
+        return self._cached(('fields', path, num_columns), load)
+
+    def sensor_data(self):
+        """Return (accel_data, strain_data) from Data_.xlsx"""
+        def load():
+            path = f'{self.data_dir}/Data_.xlsx'
+            accel_data = pd.read_excel(path, sheet_name='Accelerometer Data', skiprows=0)
+            strain_data = pd.read_excel(path, sheet_name='Strain Gauge Data', skiprows=0)
+            return accel_data, strain_data
+        return self._cached('sensor_data', load)
+
+    def preload(self):
+        """Load the tables the analysis views need, ignoring the ones that are missing"""
+        for load in (self.geometry, self.field_table, self.sensor_data):
+            try:
+                load()
+            except Exception as e:
+                print(f"Error preloading data: {e}")
+
+
+_shared_model = None
+
+
+def shared_model():
+    """Return the process-wide data model"""
+    global _shared_model
+    if _shared_model is None:
+        _shared_model = BridgeDataModel()
+    return _shared_model
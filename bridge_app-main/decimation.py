@@ -0,0 +1,145 @@
+import numpy as np
+
+
+class MinMaxPyramid:
+    """Multi-resolution min/max envelope of one channel for drawing at screen resolution.
+
+    Level k groups the samples into buckets of factor**k and stores, for each bucket,
+    the sample indices of its minimum and maximum. Each level is built from the one
+    below it, so construction is a handful of vectorized passes. Queries pick the
+    coarsest level that still gives at least one bucket per pixel and return about
+    two samples per bucket, which keeps every peak visible. x must be sorted.
+    """
+
+    def __init__(self, x, y, factor=4, min_buckets=256):
+        self.x = np.ascontiguousarray(x, dtype=np.float64)
+        self.y = np.ascontiguousarray(y, dtype=np.float64)
+        self.factor = factor
+
+        # NaN gaps must never be picked as extremes
+        nan = np.isnan(self.y)
+        low_values = np.where(nan, np.inf, self.y)
+        high_values = np.where(nan, -np.inf, self.y)
+
+        # [(bucket_size, lo_indices, hi_indices), ...] from finest to coarsest
+        self.levels = []
+        lo = hi = np.arange(len(self.y))
+        bucket_size = 1
+        while len(lo) > min_buckets * factor:
+            lo = self._reduce(lo, low_values, np.argmin)
+            hi = self._reduce(hi, high_values, np.argmax)
+            bucket_size *= factor
+            self.levels.append((bucket_size, lo, hi))
+
+    def _reduce(self, indices, values, arg):
+        """Group factor neighbouring buckets and keep the index of the winning sample"""
+        count = len(indices) // self.factor
+        grouped = indices[:count * self.factor].reshape(count, self.factor)
+        winners = grouped[np.arange(count), arg(values[grouped], axis=1)]
+
+        # A partial bucket at the end keeps its own winner
+        rest = indices[count * self.factor:]
+        if len(rest):
+            winners = np.append(winners, rest[arg(values[rest])])
+        return winners
+
+    def limits(self):
+        """(min, max) of the channel's samples, NaN if none are finite; read from the coarsest level"""
+        if not self.levels:
+            return value_range(self.y)
+        _, lo, hi = self.levels[-1]
+        return value_range(self.y[lo])[0], value_range(self.y[hi])[1]
+
+    def visible_range(self, x0, x1):
+        """Return the sample range [i0, i1) covering x0..x1 plus one sample either side"""
+        i0 = max(np.searchsorted(self.x, x0, side='left') - 1, 0)
+        i1 = min(np.searchsorted(self.x, x1, side='right') + 1, len(self.x))
+        return i0, i1
+
+    def envelope(self, x0, x1, pixels):
+        """Return (x, y) for the visible range reduced to about two samples per pixel"""
+        i0, i1 = self.visible_range(x0, x1)
+        pixels = max(int(pixels), 1)
+        if i1 - i0 <= 2 * pixels:
+            return self.x[i0:i1], self.y[i0:i1]
+
+        # Coarsest level that still has at least one bucket per pixel
+        level = None
+        for candidate in self.levels:
+            if (i1 - i0) // candidate[0] < pixels:
+                break
+            level = candidate
+        if level is None:
+            return self.x[i0:i1], self.y[i0:i1]
+
+        bucket_size, lo, hi = level
+        j0 = i0 // bucket_size
+        j1 = -(-i1 // bucket_size)
+        first = np.minimum(lo[j0:j1], hi[j0:j1])
+        second = np.maximum(lo[j0:j1], hi[j0:j1])
+
+        # Interleave each bucket's two extremes in time order
+        indices = np.empty(2 * len(first), dtype=np.int64)
+        indices[0::2] = first
+        indices[1::2] = second
+        return self.x[indices], self.y[indices]
+
+    def lttb(self, x0, x1, pixels):
+        """Return (x, y) for the visible range reduced to about one point per pixel with LTTB.
+
+        The min/max envelope at a few points per pixel is used as LTTB's input, so the
+        cost does not depend on the length of the recording.
+        """
+        x, y = self.envelope(x0, x1, 4 * pixels)
+        return lttb(x, y, max(int(pixels), 3))
+
+
+def value_range(values):
+    """(min, max) of an array ignoring NaN, NaN if it has no numbers; reduces in place without copying"""
+    values = np.asarray(values)
+    if values.size == 0:
+        return np.nan, np.nan
+    return float(np.fmin.reduce(values, axis=None)), float(np.fmax.reduce(values, axis=None))
+
+
+def combined_range(ranges):
+    """(min, max) covering several (min, max) ranges, e.g. per-channel value_range()s"""
+    ranges = np.array(list(ranges), dtype=np.float64).reshape(-1, 2)
+    return value_range(ranges[:, 0])[0], value_range(ranges[:, 1])[1]
+
+
+def lttb(x, y, threshold):
+    """Largest-Triangle-Three-Buckets downsampling of (x, y) to threshold points"""
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return x, y
+
+    # Bucket boundaries for the n - 2 interior samples
+    edges = np.floor(np.linspace(1, n - 1, threshold - 1)).astype(np.int64)
+
+    # Mean point of every bucket (NaN samples ignored), used as the third triangle vertex
+    valid = ~np.isnan(y[:n - 1])
+    counts = np.maximum(np.add.reduceat(valid.astype(np.float64), edges[:-1]), 1.0)
+    mean_x = np.add.reduceat(x[:n - 1], edges[:-1]) / (edges[1:] - edges[:-1])
+    mean_y = np.add.reduceat(np.where(valid, y[:n - 1], 0.0), edges[:-1]) / counts
+
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+    previous = 0
+    for bucket in range(threshold - 2):
+        start, stop = edges[bucket], edges[bucket + 1]
+        if bucket + 1 < threshold - 2:
+            next_x, next_y = mean_x[bucket + 1], mean_y[bucket + 1]
+        else:
+            next_x, next_y = x[n - 1], y[n - 1]
+
+        # Twice the triangle area between the previous pick, each candidate and the next mean
+        area = np.abs(
+            (x[previous] - next_x) * (y[start:stop] - y[previous])
+            - (x[previous] - x[start:stop]) * (next_y - y[previous])
+        )
+        area[np.isnan(area)] = -1.0
+        previous = start + int(np.argmax(area))
+        selected[bucket + 1] = previous
+    return x[selected], y[selected]
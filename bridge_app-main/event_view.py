@@ -0,0 +1,92 @@
+from PyQt5.QtCore import QTimer
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel, QTableWidget, QTableWidgetItem, QHeaderView
+
+from plot_widgets import FastPlotWidget
+
+
+class EventWindow(QWidget):
+    """Detected accelerometer events over time, with a table of those in the visible range.
+
+    mode='flow' plots events per minute (Traffic Flow); mode='load' plots each
+    event's peak acceleration (Load Identification). The table lists the events
+    inside the plot's current x-range, looked up in the EventTable by time, and
+    both refresh when live polling adds events.
+    """
+
+    BIN_SECONDS = 60.0
+
+    def __init__(self, title, table, mode='flow', parent=None):
+        super().__init__(parent)
+        self.setWindowTitle(title)
+        self.setGeometry(100, 100, 900, 700)
+        self.events = table
+        self.mode = mode
+        self.shown_count = -1
+
+        if mode == 'flow':
+            self.plot = FastPlotWidget(xlabel="Time", ylabel="Events per minute", toolbar=True)
+            self.plot.line.set_drawstyle('steps-post')
+        else:
+            self.plot = FastPlotWidget(xlabel="Time", ylabel="Peak acceleration", toolbar=True)
+            self.plot.line.set_linestyle('')
+            self.plot.line.set_marker('o')
+            self.plot.line.set_markersize(4)
+
+        self.table = QTableWidget(0, 6)
+        self.table.setHorizontalHeaderLabels(['Start', 'End', 'Duration (s)', 'Type', 'Peak', 'Channels'])
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.summary_label = QLabel()
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(self.plot, 2)
+        layout.addWidget(self.summary_label)
+        layout.addWidget(self.table, 1)
+
+        # Zoom/pan re-queries the table once the view settles
+        self.query_timer = QTimer(self)
+        self.query_timer.setSingleShot(True)
+        self.query_timer.timeout.connect(self.update_table)
+        self.plot.ax.callbacks.connect('xlim_changed', lambda ax: self.query_timer.start(150))
+
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.timeout.connect(self.refresh)
+        self.refresh_timer.start(2000)
+        self.refresh()
+
+    def refresh(self):
+        """Redraw if events were added since the last refresh"""
+        if len(self.events) == self.shown_count:
+            return
+        self.shown_count = len(self.events)
+        if self.mode == 'flow':
+            bins, counts = self.events.rate(self.BIN_SECONDS)
+            self.plot.set_data(bins, counts * (60.0 / self.BIN_SECONDS), label="Events",
+                               title=f"Traffic Flow ({len(self.events)} events)")
+        else:
+            events = self.events.events
+            self.plot.set_data([event.peak_time for event in events], [event.peak for event in events],
+                               label="Events", title=f"Load Identification ({len(self.events)} events)")
+        self.update_table()
+
+    def update_table(self):
+        t0, t1 = self.plot.ax.get_xlim()
+        events = self.events.query(t0, t1)
+        self.table.setRowCount(len(events))
+        for row, event in enumerate(events):
+            values = [f"{event.start:.2f}", f"{event.end:.2f}", f"{event.duration:.2f}", event.kind,
+                      f"{event.peak:.4g}", ", ".join(event.channels)]
+            for column, value in enumerate(values):
+                self.table.setItem(row, column, QTableWidgetItem(value))
+        impacts = sum(1 for event in events if event.kind == 'Impact')
+        self.summary_label.setText(
+            f"{len(events)} events between {t0:.1f} and {t1:.1f}: {len(events) - impacts} heavy vehicles, {impacts} impacts"
+        )
+
+    def closeEvent(self, event):
+        self.refresh_timer.stop()
+        super().closeEvent(event)
+
+    def showEvent(self, event):
+        self.refresh_timer.start(2000)
+        super().showEvent(event)
@@ -0,0 +1,159 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from PyQt5.QtCore import QTimer
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QComboBox, QLabel
+from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.figure import Figure
+
+from data_loader import loader_service
+from decimation import combined_range, value_range
+from sensor_analysis.rainflow import FatigueAccumulator
+
+
+def fatigue_path(feed):
+    """Where a feed's fatigue state is kept: .fatigue/<export name>.npz next to the export"""
+    path = feed.reader.path
+    directory = os.path.join(os.path.dirname(os.path.abspath(path)), '.fatigue')
+    os.makedirs(directory, exist_ok=True)
+    return os.path.join(directory, os.path.splitext(os.path.basename(path))[0] + '.npz')
+
+
+def open_accumulator(feed, path):
+    """Resume the saved state if it belongs to this recording, otherwise start a new one"""
+    start_time = float(feed.time_values[0]) if len(feed.time_values) else 0.0
+    accumulator, extra = FatigueAccumulator.load(path)
+    if (accumulator is not None and accumulator.names == feed.names()
+            and float(extra.get('start_time', np.nan)) == start_time
+            and accumulator.samples <= feed.sample_count()):
+        return accumulator
+
+    # Bins sized from the loaded history, with room for larger cycles later
+    low, high = combined_range(value_range(values) for values in feed.channels.values())
+    if not np.isfinite(low) or not np.isfinite(high):
+        low = high = 0.0
+    span = max(high - low, 1.0)
+    return FatigueAccumulator.for_range(feed.names(), 1.5 * span, (low - 0.25 * span, high + 0.25 * span))
+
+
+def count_cycles(accumulator, tail, path, start_time, task=None, chunk=1000000):
+    """Rainflow-count {name: samples} into the accumulator, saving after every chunk; for a loader thread"""
+    # Channels are stacked a chunk at a time, never as one copy of the whole tail
+    num_samples = len(tail[accumulator.names[0]]) if accumulator.names else 0
+    with ThreadPoolExecutor(max_workers=min(len(accumulator.names), os.cpu_count() or 1) or 1) as pool:
+        for start in range(0, num_samples, chunk):
+            if task is not None:
+                task.check_cancelled()
+                task.report_progress(start, num_samples)
+            accumulator.update(np.vstack([tail[name][start:start + chunk] for name in accumulator.names]), pool)
+            accumulator.save(path, start_time=start_time)
+    return accumulator
+
+
+class FatigueWindow(QWidget):
+    """Miner damage per strain gauge and the rainflow range histogram of one gauge.
+
+    Counting continues from the saved state, so only samples the state has not
+    seen are processed (on the loader thread); while the feed is live new samples
+    are counted every few seconds.
+    """
+
+    def __init__(self, feed, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Fatigue Assessment")
+        self.setGeometry(100, 100, 1100, 600)
+        self.feed = feed
+        self.path = fatigue_path(feed)
+        self.start_time = float(feed.time_values[0]) if len(feed.time_values) else 0.0
+        self.accumulator = open_accumulator(feed, self.path)
+        self.updating = False
+
+        self.dropdown = QComboBox()
+        self.dropdown.addItems(feed.names())
+        self.dropdown.currentIndexChanged.connect(self.update_plots)
+        self.status_label = QLabel()
+
+        self.figure = Figure(figsize=(10, 5))
+        self.canvas = FigureCanvas(self.figure)
+        self.damage_ax = self.figure.add_subplot(121)
+        self.histogram_ax = self.figure.add_subplot(122)
+
+        controls = QHBoxLayout()
+        controls.addWidget(QLabel("Gauge:"))
+        controls.addWidget(self.dropdown, 1)
+        controls.addWidget(self.status_label)
+        layout = QVBoxLayout(self)
+        layout.addLayout(controls)
+        layout.addWidget(self.canvas, 1)
+
+        self.count_timer = QTimer(self)
+        self.count_timer.timeout.connect(self.count_new_samples)
+        self.count_timer.start(5000)
+        self.update_plots()
+        self.count_new_samples()
+
+    def count_new_samples(self):
+        if self.updating or self.accumulator.samples >= self.feed.sample_count():
+            return
+        self.updating = True
+        loader_service().submit(
+            count_cycles, self.accumulator, self.feed.samples_from(self.accumulator.samples), self.path,
+            self.start_time,
+            pass_task=True,
+            owner=self,
+            on_progress=lambda percent: self.status_label.setText(f"Counting cycles... {percent}%"),
+            on_finished=self.on_counted,
+            on_failed=self.on_count_failed,
+            on_cancelled=lambda: setattr(self, 'updating', False)
+        )
+
+    def on_counted(self, accumulator):
+        self.updating = False
+        self.update_plots()
+
+    def on_count_failed(self, message):
+        self.updating = False
+        print(f"Error counting fatigue cycles: {message}")
+        self.status_label.setText("Fatigue counting failed")
+
+    def update_plots(self):
+        accumulator = self.accumulator
+        names = accumulator.names
+        damage = accumulator.damage()
+
+        self.damage_ax.clear()
+        self.damage_ax.bar(range(len(names)), damage, color='#FFB74D')
+        self.damage_ax.set_xticks(range(len(names)))
+        self.damage_ax.set_xticklabels([name.split('_')[-1] for name in names])
+        self.damage_ax.set_xlabel("Strain gauge")
+        self.damage_ax.set_ylabel("Miner damage")
+        self.damage_ax.set_title("Cumulative damage")
+
+        self.histogram_ax.clear()
+        channel = self.dropdown.currentIndex()
+        if 0 <= channel < len(names):
+            counts = accumulator.histogram(channel).sum(axis=1)
+            edges = accumulator.range_edges
+            self.histogram_ax.bar(edges[:-1], counts, width=np.diff(edges), align='edge', color='#4FC3F7')
+            if counts.any():
+                self.histogram_ax.set_yscale('log')
+            self.histogram_ax.set_title(f"{names[channel]} rainflow ranges")
+        self.histogram_ax.set_xlabel("Strain range")
+        self.histogram_ax.set_ylabel("Cycles")
+        self.figure.tight_layout()
+        self.canvas.draw_idle()
+
+        self.status_label.setText(
+            f"{accumulator.samples} samples, {int(accumulator.cycle_count.sum())} cycles, "
+            f"max damage {damage.max() if len(damage) else 0.0:.3e}"
+        )
+
+    def closeEvent(self, event):
+        self.count_timer.stop()
+        loader_service().cancel_owned(self)
+        super().closeEvent(event)
+
+    def showEvent(self, event):
+        self.count_timer.start(5000)
+        super().showEvent(event)
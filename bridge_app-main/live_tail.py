@@ -0,0 +1,128 @@
+import os
+
+import numpy as np
+
+
+class CsvTailReader:
+    """Incrementally parse a ';'-separated sensor export that another process keeps appending to.
+
+    The reader remembers the byte offset it has consumed and carries an incomplete
+    last line over to the next call, so each read_new() only touches the bytes
+    appended since the previous one. Decimal commas and empty cells (NaN) are handled
+    as in the DAQ exports. If the file shrinks (rotated or rewritten) it starts over.
+    """
+
+    def __init__(self, path, prefix, time_column='Time', delimiter=';'):
+        self.path = path
+        self.prefix = prefix
+        self.time_column = time_column
+        self.delimiter = delimiter
+        self.reset()
+
+    def reset(self):
+        self.offset = 0
+        self.carry = b''
+        self.names = None
+        self.columns = None  # [time column, channel columns...] in file order
+        self.num_fields = None
+
+    def _parse_header(self, line):
+        fields = [field.strip().strip('\ufeff') for field in line.split(self.delimiter)]
+        names = [field for field in fields if field.startswith(self.prefix)]
+        names.sort(key=lambda name: int(name.split('_')[-1]))
+        self.names = names
+        self.columns = [fields.index(self.time_column)] + [fields.index(name) for name in names]
+        self.num_fields = len(fields)
+
+    def read_new(self, max_bytes=None):
+        """Return (time_values, values) for the complete rows appended since the last call.
+
+        values has one column per channel in self.names order; both are empty when
+        nothing new has arrived. max_bytes limits how much is read in one call, so a
+        large file can be loaded in steps (see remaining()).
+        """
+        size = os.path.getsize(self.path)
+        if size < self.offset:
+            self.reset()
+        if size == self.offset:
+            return self._empty()
+
+        with open(self.path, 'rb') as f:
+            f.seek(self.offset)
+            chunk = f.read(size - self.offset if max_bytes is None else min(max_bytes, size - self.offset))
+        self.offset += len(chunk)
+
+        # Only complete lines are parsed; the tail waits for the rest of its line
+        data = self.carry + chunk
+        end = data.rfind(b'\n')
+        if end < 0:
+            self.carry = data
+            return self._empty()
+        self.carry = data[end + 1:]
+        lines = data[:end].decode('utf-8-sig').replace('\r', '').split('\n')
+
+        if self.names is None:
+            self._parse_header(lines[0])
+            lines = lines[1:]
+        return self._parse_rows(lines)
+
+    def remaining(self):
+        """Return (bytes_read, file_size)"""
+        return self.offset, os.path.getsize(self.path)
+
+    def _parse_rows(self, lines):
+        rows = [line.split(self.delimiter) for line in lines if line]
+        rows = [row for row in rows if len(row) == self.num_fields]
+        if not rows:
+            return self._empty()
+
+        # Vectorized text to float: decimal commas to dots, empty cells to NaN
+        table = np.array(rows)[:, self.columns]
+        table = np.char.replace(table, ',', '.')
+        # np.where widens the dtype; assigning into short cells (<U1, <U2) would truncate 'nan'
+        table = np.where(np.char.str_len(table) == 0, 'nan', table).astype(np.float64)
+        return table[:, 0], table[:, 1:]
+
+    def _empty(self):
+        return np.empty(0), np.empty((0, len(self.names or [])))
+
+
+class RingBuffer:
+    """Fixed-capacity buffer of the most recent samples for several channels.
+
+    Every sample is written twice, capacity rows apart, so the newest `size` rows
+    are always one contiguous slice and view() never copies.
+    """
+
+    def __init__(self, capacity, num_channels):
+        self.capacity = capacity
+        self.time_values = np.full(2 * capacity, np.nan)
+        self.values = np.full((2 * capacity, num_channels), np.nan)
+        self.head = 0  # Next write position in [0, capacity)
+        self.size = 0
+
+    def extend(self, time_values, values):
+        # Only the newest `capacity` samples can survive
+        if len(time_values) > self.capacity:
+            time_values = time_values[-self.capacity:]
+            values = values[-self.capacity:]
+        count = len(time_values)
+        if count == 0:
+            return
+
+        first = min(count, self.capacity - self.head)
+        for offset in (0, self.capacity):
+            start = self.head + offset
+            self.time_values[start:start + first] = time_values[:first]
+            self.values[start:start + first] = values[:first]
+            # Wrapped part continues from the start of each half
+            self.time_values[offset:offset + count - first] = time_values[first:]
+            self.values[offset:offset + count - first] = values[first:]
+
+        self.head = (self.head + count) % self.capacity
+        self.size = min(self.size + count, self.capacity)
+
+    def view(self):
+        """Return (time_values, values) for the buffered samples, oldest first, without copying"""
+        start = self.head + self.capacity - self.size
+        return self.time_values[start:start + self.size], self.values[start:start + self.size]
@@ -0,0 +1,135 @@
+import math
+import vtk
+from vtk.util import numpy_support
+
+
+class ComparisonView:
+    """Side-by-side viewports that share one mesh and one camera, each showing a different field slice"""
+
+    MAX_VIEWPORTS = 6
+
+    def __init__(self, render_window, camera, points, edge_cells, plane_cells, field_store):
+        self.render_window = render_window
+        self.camera = camera
+        self.points = points
+        self.edge_cells = edge_cells
+        self.plane_cells = plane_cells
+        self.field_store = field_store
+
+        self.renderers = []
+        self.viewports = []
+
+        # VTK arrays wrapping field store slices, keyed by (variable, time_step)
+        self.slice_arrays = {}
+
+    def slice_array(self, variable, time_step):
+        """Return a VTK array that reads the field store slice in place"""
+        key = (variable, time_step)
+        if key not in self.slice_arrays:
+            array = numpy_support.numpy_to_vtk(self.field_store.slice(variable, time_step), deep=0)
+            array.SetName(f"{variable} t{time_step + 1}")
+            self.slice_arrays[key] = array
+        return self.slice_arrays[key]
+
+    def show(self, slices):
+        """Create one viewport per (variable, time_step) slice, laid out in a grid"""
+        self.clear()
+        slices = list(slices)[:self.MAX_VIEWPORTS]
+        rows = 1 if len(slices) <= 3 else 2
+        cols = math.ceil(len(slices) / rows)
+
+        for i, (variable, time_step) in enumerate(slices):
+            row, col = divmod(i, cols)
+
+            renderer = vtk.vtkRenderer()
+            renderer.SetViewport(col / cols, 1.0 - (row + 1) / rows, (col + 1) / cols, 1.0 - row / rows)
+            renderer.SetActiveCamera(self.camera)
+            renderer.SetBackground(0.0, 0.0, 0.0)
+
+            # Points and cells are shared; only the scalar array differs per viewport
+            polydata = vtk.vtkPolyData()
+            polydata.SetPoints(self.points)
+            polydata.SetLines(self.edge_cells)
+            polydata.SetPolys(self.plane_cells)
+
+            lut = vtk.vtkLookupTable()
+            lut.SetHueRange(0.667, 0.0)  # Blue to Red, same as the main view
+            lut.SetNumberOfTableValues(256)
+            lut.Build()
+
+            mapper = vtk.vtkPolyDataMapper()
+            mapper.SetInputData(polydata)
+            mapper.SetLookupTable(lut)
+            mapper.SetScalarModeToUsePointData()
+            mapper.ScalarVisibilityOn()
+
+            actor = vtk.vtkActor()
+            actor.SetMapper(mapper)
+            renderer.AddActor(actor)
+
+            # Caption in the top-left corner of the viewport
+            caption = vtk.vtkTextActor()
+            caption.GetTextProperty().SetColor(1.0, 1.0, 1.0)
+            caption.GetTextProperty().SetFontSize(14)
+            caption.GetPositionCoordinate().SetCoordinateSystemToNormalizedViewport()
+            caption.SetPosition(0.02, 0.92)
+            renderer.AddActor2D(caption)
+
+            scalar_bar = vtk.vtkScalarBarActor()
+            scalar_bar.SetLookupTable(lut)
+            scalar_bar.SetNumberOfLabels(3)
+            scalar_bar.SetLabelFormat("%.2e")
+            scalar_bar.SetWidth(0.1)
+            scalar_bar.SetHeight(0.4)
+            scalar_bar.SetPosition(0.88, 0.5)
+            renderer.AddActor2D(scalar_bar)
+
+            self.render_window.AddRenderer(renderer)
+            self.renderers.append(renderer)
+            self.viewports.append({
+                'polydata': polydata,
+                'mapper': mapper,
+                'lut': lut,
+                'caption': caption,
+                'slice': (variable, time_step)
+            })
+
+        self.set_slices(slices)
+
+    def set_slices(self, slices):
+        """Point each viewport at a new slice without rebuilding anything"""
+        for viewport, (variable, time_step) in zip(self.viewports, slices):
+            viewport['slice'] = (variable, time_step)
+            viewport['polydata'].GetPointData().SetScalars(self.slice_array(variable, time_step))
+            viewport['caption'].SetInput(f"{variable}  t = {time_step + 1}")
+        self.update_ranges()
+
+    def update_ranges(self):
+        # Slices of one variable share a color range so they can be compared directly
+        variables = {viewport['slice'][0] for viewport in self.viewports}
+        shared_range = None
+        if len(variables) == 1:
+            values = [self.field_store.slice(*viewport['slice']) for viewport in self.viewports]
+            shared_range = (min(v.min() for v in values), max(v.max() for v in values))
+
+        for viewport in self.viewports:
+            if shared_range is not None:
+                low, high = shared_range
+            else:
+                values = self.field_store.slice(*viewport['slice'])
+                low, high = values.min(), values.max()
+            if abs(high - low) < 1e-10:
+                low -= 0.5
+                high += 0.5
+            viewport['lut'].SetTableRange(low, high)
+            viewport['mapper'].SetScalarRange(low, high)
+
+    def clear(self):
+        for renderer in self.renderers:
+            self.render_window.RemoveRenderer(renderer)
+        self.renderers = []
+        self.viewports = []
+
+    @property
+    def active(self):
+        return bool(self.renderers)
@@ -1,13 +1,12 @@
-import pandas as pd
+from data_model import shared_model
+from .field_store import FieldStore
 
 class DataHandler:
     @staticmethod
     def load_sensor_data():
         """Load both accelerometer and strain gauge data."""
         try:
-            accel_data = pd.read_excel('../data/Data_.xlsx', sheet_name='Accelerometer Data', skiprows=0)
-            strain_data = pd.read_excel('../data/Data_.xlsx', sheet_name='Strain Gauge Data', skiprows=0)
-            return accel_data, strain_data
+            return shared_model().sensor_data()
         except Exception as e:
             print(f"Error loading sensor data: {e}")
             return None, None
@@ -21,17 +20,22 @@ class DataHandler:
 
         return [chr(ord('B') + var_pos + t * 6) for t in range(5)]
 
+    @staticmethod
+    def load_field_store(node_to_index, num_timesteps=5, path=None):
+        """Load every variable for every timestep in one read, in point index order."""
+        try:
+            num_columns = 1 + num_timesteps * len(FieldStore.VARIABLES)
+            df_fields = shared_model().field_table(path, num_columns)
+            return FieldStore.from_table(df_fields.to_numpy(dtype=float), node_to_index, num_timesteps)
+        except Exception as e:
+            print(f"Error loading field data: {e}")
+            return None
+
     @staticmethod
     def load_geometry_data():
         """Load node and connectivity data."""
         try:
-            df_nodes = pd.read_excel('../data/data.xlsx', sheet_name='Sheet1', header=None, skiprows=5, usecols='I:L', nrows=1882)
-            df_nodes.columns = ['number', 'x', 'y', 'z']
-
-            df_conn = pd.read_excel('../data/data.xlsx', sheet_name='Sheet1', header=None, skiprows=4, usecols='A:E', nrows=1882)
-            df_conn.columns = ['Element', 'Node1', 'Node2', 'Node3', 'Node4']
-
-            return df_nodes, df_conn
+            return shared_model().geometry()
         except Exception as e:
             print(f"Error loading geometry data: {e}")
             return None, None
@@ -0,0 +1,83 @@
+import numpy as np
+
+
+class DifferenceFieldEngine:
+    """Vectorized "what changed" fields over a FieldStore, cached by operand pair.
+
+    Results that vary over time come back as (timesteps, nodes) arrays so they can
+    be played back like any other field; window reductions come back as (1, nodes).
+    """
+
+    def __init__(self, field_store, reference_store=None, eps=1e-12):
+        self.field_store = field_store
+        self.reference_store = reference_store
+        self.eps = eps
+        self.cache = {}
+
+    def set_reference(self, reference_store):
+        """Use another run (e.g. last week's FE results) as the reference operand"""
+        if reference_store is not None and reference_store.values.shape != self.field_store.values.shape:
+            raise ValueError(
+                f"Reference run has shape {reference_store.values.shape}, "
+                f"expected {self.field_store.values.shape}"
+            )
+        self.reference_store = reference_store
+        self.cache = {key: value for key, value in self.cache.items() if not key[0].startswith('run')}
+
+    def _cached(self, key, compute):
+        if key not in self.cache:
+            result = compute()
+            result.flags.writeable = False
+            self.cache[key] = result
+        return self.cache[key]
+
+    def delta(self, variable, base_step=0):
+        """Field at every timestep minus the field at base_step"""
+        def compute():
+            field = self.field_store.field(variable)
+            return field - field[base_step]
+        return self._cached(('delta', variable, base_step), compute)
+
+    def step_delta(self, variable, step, base_step=0):
+        """Field at one timestep minus the field at base_step, e.g. U2 at t5 minus t1"""
+        return self.delta(variable, base_step)[step]
+
+    def relative(self, variable, base_step=0):
+        """Change relative to the magnitude at base_step (0.1 == 10 %)"""
+        def compute():
+            base = np.abs(self.field_store.field(variable)[base_step])
+            change = self.delta(variable, base_step)
+            return np.divide(change, base, out=np.zeros_like(change), where=base > self.eps)
+        return self._cached(('relative', variable, base_step), compute)
+
+    def max_abs(self, variable, start=0, stop=None):
+        """Per-node max |value| over timesteps [start, stop)"""
+        def compute():
+            window = self.field_store.field(variable)[start:stop]
+            return np.abs(window).max(axis=0, keepdims=True)
+        return self._cached(('max_abs', variable, start, stop), compute)
+
+    def max_abs_change(self, variable, start=0, stop=None):
+        """Per-node max |value - value at start| over timesteps [start, stop)"""
+        def compute():
+            return np.abs(self.delta(variable, start)[start:stop]).max(axis=0, keepdims=True)
+        return self._cached(('max_abs_change', variable, start, stop), compute)
+
+    def run_delta(self, variable):
+        """This run minus the reference run, for every timestep"""
+        def compute():
+            return self.field_store.field(variable) - self._reference_field(variable)
+        return self._cached(('run_delta', variable), compute)
+
+    def run_relative(self, variable):
+        """This run minus the reference run, relative to the reference magnitude"""
+        def compute():
+            base = np.abs(self._reference_field(variable))
+            change = self.run_delta(variable)
+            return np.divide(change, base, out=np.zeros_like(change), where=base > self.eps)
+        return self._cached(('run_relative', variable), compute)
+
+    def _reference_field(self, variable):
+        if self.reference_store is None:
+            raise ValueError("No reference run loaded")
+        return self.reference_store.field(variable)
@@ -0,0 +1,53 @@
+import numpy as np
+
+
+class FieldStore:
+    """Nodal result variables for every timestep, held as one (variables, timesteps, nodes) array"""
+
+    VARIABLES = ['U1', 'U2', 'U3', 'R1', 'R2', 'R3']
+    DISPLACEMENT_VARIABLES = ['U1', 'U2', 'U3']
+
+    def __init__(self, values, variables=None):
+        self.values = np.ascontiguousarray(values, dtype=np.float64)
+        self.variables = list(variables or self.VARIABLES)
+        self.num_timesteps = self.values.shape[1]
+        self.num_nodes = self.values.shape[2]
+        self._displacements = None
+
+    @classmethod
+    def from_table(cls, table, node_to_index, num_timesteps=5, variables=None):
+        """Build the store from a numeric table with the node number in the first column
+        followed by one block of variables per timestep, reordered to point index order."""
+        variables = list(variables or cls.VARIABLES)
+        table = np.asarray(table, dtype=np.float64)
+
+        # (rows, timesteps, variables) -> (variables, timesteps, rows)
+        blocks = table[:, 1:1 + num_timesteps * len(variables)]
+        blocks = blocks.reshape(len(table), num_timesteps, len(variables)).transpose(2, 1, 0)
+
+        # Scatter rows into point index order; nodes without results stay at zero
+        values = np.zeros((len(variables), num_timesteps, len(node_to_index)))
+        rows = np.array([node_to_index.get(int(node), -1) for node in table[:, 0]], dtype=np.int64)
+        known = rows >= 0
+        values[:, :, rows[known]] = blocks[:, :, known]
+        return cls(values, variables)
+
+    def index_of(self, variable):
+        return self.variables.index(variable)
+
+    def field(self, variable):
+        """Return the (timesteps, nodes) view for one variable"""
+        return self.values[self.index_of(variable)]
+
+    def slice(self, variable, time_step):
+        """Return the (nodes,) view for one variable at one timestep"""
+        return self.values[self.index_of(variable), time_step]
+
+    def displacements(self):
+        """Return (timesteps, nodes, 3) displacement vectors built from U1-U3 (cached)"""
+        if self._displacements is None:
+            indices = [self.index_of(variable) for variable in self.DISPLACEMENT_VARIABLES]
+            self._displacements = np.ascontiguousarray(
+                np.moveaxis(self.values[indices], 0, -1)
+            )
+        return self._displacements
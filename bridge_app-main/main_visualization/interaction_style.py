@@ -16,18 +16,19 @@ class ClickInteractorStyle(vtk.vtkInteractorStyleTrackballCamera):
         # Get the picked actor
         actor = picker.GetActor()
         
-        if actor in self.parent.sensor_actors:
-            # Get sensor info
-            sensor_index = self.parent.sensor_actors.index(actor)
-            sensor_info = self.parent.sensor_info[sensor_index]
-            
+        sensor_info = self.parent.sensor_lookup.get(actor) if actor is not None else None
+        if sensor_info is not None:
             # Create detailed message with all available information
+            mesh_nodes = self.parent.sensor_manager.mesh_nodes
+            nearest = mesh_nodes.nearest_node(sensor_info['name']) if mesh_nodes is not None else None
             msg = QMessageBox()
             msg.setWindowTitle("Sensor Information")
-            msg.setText(f"Type: {sensor_info['type']}\n"
+            msg.setText(f"Name: {sensor_info['name']}\n"
+                       f"Type: {sensor_info['type']}\n"
                        f"Description: {sensor_info['description']}\n"
                        f"Location: {sensor_info['location']}\n"
-                       f"Coordinates: ({sensor_info['x']:.2f}, {sensor_info['y']:.2f}, {sensor_info['z']:.2f})")
+                       f"Coordinates: ({sensor_info['x']:.2f}, {sensor_info['y']:.2f}, {sensor_info['z']:.2f})"
+                       + (f"\nNearest node: {nearest[0]} ({nearest[1]:.2f} m)" if nearest else ""))
             msg.exec_()
             
             # Reset the interaction state
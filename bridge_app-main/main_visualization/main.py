@@ -1,6 +1,11 @@
+import os
 import sys
+
+# Run as a script: make the package and the shared data model importable
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
 from PyQt5.QtWidgets import QApplication
-from main_window import MainWindow
+from main_visualization.main_window import MainWindow
 
 def main():
     # initialize the qt application
@@ -1,7 +1,7 @@
 import vtk
 import time
-import pandas as pd
-from PyQt5.QtCore import Qt
+import numpy as np
+from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtWidgets import (
     QMainWindow, 
     QWidget, 
@@ -10,14 +10,22 @@ from PyQt5.QtWidgets import (
     QComboBox, 
     QFrame,
     QLabel,
-    QMessageBox
+    QMessageBox,
+    QPushButton,
+    QSlider,
+    QCheckBox,
+    QFileDialog
 )
 from vtkmodules.qt.QVTKRenderWindowInteractor import QVTKRenderWindowInteractor
 
-from data_handler import DataHandler
-from sensor_manager import SensorManager
-from visualization import Visualization
-from interaction_style import ClickInteractorStyle
+from .data_handler import DataHandler
+from .sensor_manager import SensorManager
+from .visualization import Visualization
+from .interaction_style import ClickInteractorStyle
+from .playback import PlaybackEngine
+from .field_store import FieldStore
+from .comparison_view import ComparisonView
+from .difference_field import DifferenceFieldEngine
 
 
 class MainWindow(QMainWindow):
@@ -30,7 +38,7 @@ class MainWindow(QMainWindow):
 
         # Initialize sensor storage
         self.sensor_actors = []
-        self.sensor_info = []
+        self.sensor_lookup = {}
         
         # Create the main widget and layout
         self.frame = QFrame()
@@ -66,6 +74,12 @@ class MainWindow(QMainWindow):
         self.sensor_combo.addItems(['Accelerometers', 'Strain Gauge', 'Cameras', 'Displacement'])
         self.control_layout.addWidget(self.sensor_combo)
 
+        # Create playback and deformed-shape controls
+        self.setup_playback_controls()
+        self.setup_deformation_controls()
+        self.setup_comparison_controls()
+        self.setup_difference_controls()
+
         # Load data and setup controls
         self.load_sensor_data()
         
@@ -91,15 +105,43 @@ class MainWindow(QMainWindow):
         style.SetDefaultRenderer(self.renderer)
         self.interactor.SetInteractorStyle(style)
         
-        # Setup timer variables
-        self.timer_count = 0
-        self.last_update = time.time()
-        self.interactor.AddObserver('TimerEvent', self.update_time_step)
-        self.interactor.CreateRepeatingTimer(1000)
-
         # Initialize visualization
         self.setup_visualization()
 
+        # Playback timer runs at the configured frame rate
+        self.last_update = time.perf_counter()
+        self.playback_timer = QTimer(self)
+        self.playback_timer.timeout.connect(self.update_time_step)
+        self.playback_timer.start(self.playback.frame_interval_ms)
+
+    def set_active(self, active):
+        """Pause playback while the view is hidden, e.g. in an inactive dashboard tab"""
+        if active:
+            self.last_update = time.perf_counter()
+            self.playback_timer.start(self.playback.frame_interval_ms)
+        else:
+            self.playback_timer.stop()
+
+    def setup_playback_controls(self):
+        self.playback_label = QLabel("Playback:")
+        self.control_layout.addWidget(self.playback_label)
+
+        self.play_button = QPushButton("Pause")
+        self.play_button.clicked.connect(self.toggle_playback)
+        self.control_layout.addWidget(self.play_button)
+
+        # Slider works in hundredths of a timestep for smooth scrubbing
+        self.time_slider = QSlider(Qt.Horizontal)
+        self.time_slider.setRange(0, 400)
+        self.time_slider.valueChanged.connect(self.on_slider_changed)
+        self.control_layout.addWidget(self.time_slider)
+
+        self.frame_rate_combo = QComboBox()
+        self.frame_rate_combo.addItems(['10 fps', '24 fps', '30 fps', '60 fps'])
+        self.frame_rate_combo.setCurrentText('30 fps')
+        self.frame_rate_combo.currentTextChanged.connect(self.on_frame_rate_changed)
+        self.control_layout.addWidget(self.frame_rate_combo)
+
     def load_sensor_data(self):
         """Load sensor data using DataHandler"""
         self.accel_data, self.strain_data = DataHandler.load_sensor_data()
@@ -109,20 +151,177 @@ class MainWindow(QMainWindow):
         # Create visualization manager
         self.visualization = Visualization(self.renderer)
         
-        # Initialize visualization with default variable
+        # Build the mesh once; all variables and timesteps come from one field store
         self.current_variable = 'U1'
-        results = self.visualization.setup_visualization(self.current_variable)
+        results = self.visualization.setup_visualization()
         if results is not None:
-            self.node_to_index, self.node_weights, self.edges, self.planes = results
+            self.node_to_index, self.edges, self.planes = results
+        self.field_store = DataHandler.load_field_store(self.node_to_index)
+        if self.field_store is None:
+            self.field_store = FieldStore(np.zeros((len(FieldStore.VARIABLES), 5, len(self.node_to_index))))
         
         # Create sensor manager and add sensors
         self.sensor_manager = SensorManager(self.renderer)
-        self.sensor_manager.add_sensors()
+        self.sensor_manager.add_sensors(
+            list(self.node_to_index.keys()),
+            self.visualization.reference_points[list(self.node_to_index.values())]
+        )
         self.sensor_actors = self.sensor_manager.sensor_actors
-        self.sensor_info = self.sensor_manager.sensor_info
+        self.sensor_lookup = self.sensor_manager.actor_to_sensor
         
+        # Interpolated playback over the timestep arrays
+        self.playback = PlaybackEngine(self.field_store.field(self.current_variable), frame_rate=30)
+        self.deformation = PlaybackEngine(self.field_store.displacements(), frame_rate=30)
+        self.time_slider.setRange(0, (self.playback.num_keyframes - 1) * 100)
+        self.shown_keyframe = None
+
+        # Difference fields are computed from the same field store and cached
+        self.differences = DifferenceFieldEngine(self.field_store)
+
+        # Comparison viewports share the mesh, the cells and the main camera
+        self.comparison = ComparisonView(
+            self.render_window,
+            self.renderer.GetActiveCamera(),
+            self.visualization.points,
+            self.visualization.edge_cells,
+            self.visualization.plane_cells,
+            self.field_store
+        )
+
         # Initialize with first time step
-        self.update_geometry(0)
+        self.show_playback_frame()
+
+    def setup_deformation_controls(self):
+        self.deformation_label = QLabel("Deformed Shape:")
+        self.control_layout.addWidget(self.deformation_label)
+
+        self.deformation_check = QCheckBox("Show deformed shape")
+        self.deformation_check.toggled.connect(self.on_deformation_changed)
+        self.control_layout.addWidget(self.deformation_check)
+
+        self.amplification_combo = QComboBox()
+        self.amplification_combo.addItems(['x1', 'x100', 'x1000', 'x10000', 'x50000'])
+        self.amplification_combo.setCurrentText('x10000')
+        self.amplification_combo.currentTextChanged.connect(self.on_deformation_changed)
+        self.control_layout.addWidget(self.amplification_combo)
+
+    def setup_comparison_controls(self):
+        self.comparison_label = QLabel("Compare:")
+        self.control_layout.addWidget(self.comparison_label)
+
+        self.comparison_combo = QComboBox()
+        self.comparison_combo.addItems(['Off', 'U1 / U2 / U3', 'All Variables', 'All Timesteps'])
+        self.comparison_combo.currentTextChanged.connect(self.on_comparison_changed)
+        self.control_layout.addWidget(self.comparison_combo)
+
+    def comparison_slices(self):
+        """Return the (variable, time_step) slices for the selected comparison mode"""
+        mode = self.comparison_combo.currentText()
+        time_step = self.playback.keyframe_index
+        if mode == 'U1 / U2 / U3':
+            return [(variable, time_step) for variable in FieldStore.DISPLACEMENT_VARIABLES]
+        if mode == 'All Variables':
+            return [(variable, time_step) for variable in self.field_store.variables]
+        if mode == 'All Timesteps':
+            return [(self.current_variable, t) for t in range(self.field_store.num_timesteps)]
+        return []
+
+    def on_comparison_changed(self, mode):
+        style = self.interactor.GetInteractorStyle()
+        if mode == 'Off':
+            if self.comparison.active:
+                self.comparison.clear()
+                self.render_window.AddRenderer(self.renderer)
+                style.SetDefaultRenderer(self.renderer)
+        else:
+            if not self.comparison.active:
+                self.render_window.RemoveRenderer(self.renderer)
+            self.comparison.show(self.comparison_slices())
+            style.SetDefaultRenderer(self.comparison.renderers[0])
+        # All viewports are redrawn in a single pass
+        self.render_window.Render()
+
+    def setup_difference_controls(self):
+        self.difference_label = QLabel("Difference:")
+        self.control_layout.addWidget(self.difference_label)
+
+        self.difference_combo = QComboBox()
+        self.difference_combo.addItems([
+            'Off',
+            'Change vs t1',
+            'Relative Change vs t1',
+            'Max |Change| over Time',
+            'Max |Value| over Time',
+            'Run minus Reference',
+            'Relative to Reference'
+        ])
+        self.difference_combo.currentTextChanged.connect(self.on_difference_changed)
+        self.control_layout.addWidget(self.difference_combo)
+
+        self.reference_button = QPushButton("Load Reference Run...")
+        self.reference_button.clicked.connect(self.load_reference_run)
+        self.control_layout.addWidget(self.reference_button)
+
+    def current_keyframes(self):
+        """Return the keyframes for the current variable and difference mode"""
+        mode = self.difference_combo.currentText()
+        variable = self.current_variable
+        try:
+            if mode == 'Change vs t1':
+                return self.differences.delta(variable, 0), f"Change in {variable} vs t1"
+            if mode == 'Relative Change vs t1':
+                return self.differences.relative(variable, 0), f"Relative change in {variable} vs t1"
+            if mode == 'Max |Change| over Time':
+                return self.differences.max_abs_change(variable), f"Max |change| in {variable}"
+            if mode == 'Max |Value| over Time':
+                return self.differences.max_abs(variable), f"Max |{variable}|"
+            if mode == 'Run minus Reference':
+                return self.differences.run_delta(variable), f"{variable} minus reference"
+            if mode == 'Relative to Reference':
+                return self.differences.run_relative(variable), f"{variable} relative to reference"
+        except ValueError as e:
+            QMessageBox.warning(self, "Difference", str(e))
+            # The raw field is shown, so the dropdown must say so too
+            self.difference_combo.blockSignals(True)
+            self.difference_combo.setCurrentText('Off')
+            self.difference_combo.blockSignals(False)
+        return self.field_store.field(variable), "Weight Values"
+
+    def set_playback_keyframes(self, keyframes_and_title):
+        keyframes, title = keyframes_and_title
+        self.playback.set_keyframes(keyframes)
+        self.time_slider.setRange(0, max(0, (self.playback.num_keyframes - 1) * 100))
+        self.visualization.scalar_title = title
+        self.shown_keyframe = None
+        self.show_playback_frame()
+
+    def on_difference_changed(self, mode):
+        self.set_playback_keyframes(self.current_keyframes())
+        self.render_window.Render()
+
+    def load_reference_run(self):
+        path, _ = QFileDialog.getOpenFileName(self, "Load Reference Run", "../data", "Excel Files (*.xlsx)")
+        if not path:
+            return
+        reference = DataHandler.load_field_store(self.node_to_index, path=path)
+        if reference is None:
+            QMessageBox.warning(self, "Reference Run", f"Could not read results from {path}")
+            return
+        try:
+            self.differences.set_reference(reference)
+        except ValueError as e:
+            QMessageBox.warning(self, "Reference Run", str(e))
+            return
+        self.on_difference_changed(self.difference_combo.currentText())
+
+    def amplification(self):
+        return float(self.amplification_combo.currentText().lstrip('x'))
+
+    def on_deformation_changed(self, *args):
+        if not self.deformation_check.isChecked():
+            self.visualization.clear_displacement()
+        self.show_playback_frame()
+        self.render_window.Render()
 
     def update_labels(self, selection):
         self.visualization.update_labels(selection)
@@ -133,48 +332,53 @@ class MainWindow(QMainWindow):
         # Store current variable
         self.current_variable = variable
         
-        # Get columns for the selected variable
-        cols = DataHandler.get_columns_for_variable(variable)
-        
-        # Read data with new columns
-        df_weights = pd.read_excel('../data/Data_.xlsx', 
-                                 sheet_name='Variables for 5 Timesteps', 
-                                 header=None, 
-                                 skiprows=1,
-                                 usecols=[0] + [ord(col) - ord('A') for col in cols],
-                                 nrows=1882)
-        
-        # Rename columns
-        df_weights.columns = ['number'] + [f'weight_t{i+1}' for i in range(5)]
-        
-        # Update weights
-        self.node_weights = {}
-        for index, row in df_weights.iterrows():
-            node_num = int(row['number'])
-            self.node_weights[node_num] = [
-                float(row[f'weight_t{i+1}']) for i in range(5)
-            ]
-        
-        # Update geometry with current timestep
-        self.update_geometry(self.timer_count % 5)
+        # Swap the keyframes (already in memory) and redraw the current position
+        self.set_playback_keyframes(self.current_keyframes())
+        if self.comparison.active:
+            self.comparison.set_slices(self.comparison_slices())
         self.render_window.Render()
 
-    def update_time_step(self, obj, event):
-        current_time = time.time()
-        # Only update if 1 second has passed
-        if current_time - self.last_update >= 1.0:
-            time_step = self.timer_count % 5
-            self.update_geometry(time_step)
-            self.visualization.update_scalar_bar_title(time_step)
-            self.timer_count += 1
+    def toggle_playback(self):
+        playing = self.playback.toggle()
+        self.play_button.setText("Pause" if playing else "Play")
+        self.last_update = time.perf_counter()
+
+    def on_slider_changed(self, value):
+        """Scrub to the slider position"""
+        self.playback.scrub(value / 100.0)
+        self.show_playback_frame(update_slider=False)
+        self.render_window.Render()
+
+    def on_frame_rate_changed(self, text):
+        self.playback.frame_rate = int(text.split()[0])
+        self.playback_timer.setInterval(self.playback.frame_interval_ms)
+
+    def update_time_step(self):
+        current_time = time.perf_counter()
+        dt = current_time - self.last_update
+        self.last_update = current_time
+
+        if self.playback.advance(dt):
+            self.show_playback_frame()
             self.render_window.Render()
-            self.last_update = current_time
-
-    def update_geometry(self, time_step):
-        self.visualization.update_geometry(
-            time_step, 
-            self.node_weights,
-            self.node_to_index,
-            self.edges,
-            self.planes
-        )
\ No newline at end of file
+
+    def show_playback_frame(self, update_slider=True):
+        """Push the interpolated playback buffer into the scene"""
+        self.visualization.set_node_values(self.playback.buffer)
+
+        # Only the displacement vectors change; the points are warped in place
+        if self.deformation_check.isChecked():
+            self.deformation.scrub(self.playback.position)
+            self.visualization.set_displacement(self.deformation.buffer, self.amplification())
+
+        time_step = self.playback.keyframe_index
+        if time_step != self.shown_keyframe:
+            self.visualization.update_scalar_bar_title(time_step)
+            self.shown_keyframe = time_step
+            if self.comparison.active:
+                self.comparison.set_slices(self.comparison_slices())
+
+        if update_slider:
+            self.time_slider.blockSignals(True)
+            self.time_slider.setValue(int(self.playback.position * 100))
+            self.time_slider.blockSignals(False)
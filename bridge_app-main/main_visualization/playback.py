@@ -0,0 +1,90 @@
+import numpy as np
+
+
+class PlaybackEngine:
+    """Interpolate between precomputed keyframes into a preallocated buffer.
+
+    Keyframes are stored as one array of shape (num_keyframes, ...). The
+    interpolated frame is written into ``self.buffer`` in place, so callers can
+    hold on to the buffer (or wrap it for VTK) and nothing is allocated per frame.
+    """
+
+    def __init__(self, keyframes, frame_rate=30, seconds_per_keyframe=1.0, loop=True):
+        self.frame_rate = frame_rate
+        self.seconds_per_keyframe = seconds_per_keyframe
+        self.loop = loop
+        self.playing = True
+        self.position = 0.0
+        self.buffer = None
+        self.set_keyframes(keyframes)
+
+    def set_keyframes(self, keyframes):
+        """Replace the keyframes; returns True when the buffer had to be reallocated"""
+        self.keyframes = np.ascontiguousarray(keyframes, dtype=np.float64)
+        self.num_keyframes = len(self.keyframes)
+
+        reallocated = self.buffer is None or self.buffer.shape != self.keyframes.shape[1:]
+        if reallocated:
+            self.buffer = np.empty(self.keyframes.shape[1:])
+
+        self.position = self._wrap(self.position)
+        self.evaluate()
+        return reallocated
+
+    @property
+    def frame_interval_ms(self):
+        return max(1, int(round(1000.0 / self.frame_rate)))
+
+    @property
+    def keyframe_index(self):
+        return int(self.position)
+
+    def play(self):
+        self.playing = True
+
+    def pause(self):
+        self.playing = False
+
+    def toggle(self):
+        self.playing = not self.playing
+        return self.playing
+
+    def scrub(self, position):
+        """Jump to a fractional keyframe position and refresh the buffer"""
+        self.position = self._wrap(float(position))
+        self.evaluate()
+
+    def advance(self, dt):
+        """Advance by dt seconds; returns True when the buffer was updated"""
+        if not self.playing or self.num_keyframes < 2:
+            return False
+
+        self.position = self._wrap(self.position + dt / self.seconds_per_keyframe)
+        if not self.loop and self.position >= self.num_keyframes - 1:
+            self.playing = False
+        self.evaluate()
+        return True
+
+    def evaluate(self):
+        """Write the frame at the current position into the buffer"""
+        if self.num_keyframes == 1:
+            np.copyto(self.buffer, self.keyframes[0])
+            return self.buffer
+
+        index = int(self.position)
+        fraction = self.position - index
+        next_index = index + 1
+        if next_index >= self.num_keyframes:
+            next_index = 0 if self.loop else index
+
+        start = self.keyframes[index]
+        np.subtract(self.keyframes[next_index], start, out=self.buffer)
+        self.buffer *= fraction
+        self.buffer += start
+        return self.buffer
+
+    def _wrap(self, position):
+        if self.loop:
+            # The segment after the last keyframe blends back into the first one
+            return position % self.num_keyframes
+        return min(max(position, 0.0), float(self.num_keyframes - 1))
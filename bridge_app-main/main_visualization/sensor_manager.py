@@ -1,43 +1,27 @@
 import vtk
-import pandas as pd
+from sensor_registry import shared_registry
 
 class SensorManager:
     def __init__(self, renderer):
         self.renderer = renderer
         self.sensor_actors = []
-        self.sensor_info = []
+        self.actor_to_sensor = {}  # vtkActor -> sensor dict, for O(1) picking
+        self.registry = shared_registry()
+        self.mesh_nodes = None  # Nearest node of each sensor on this view's mesh
 
-        # Define color mapping for sensor types
-        self.sensor_colors = {
-            'Accelerometer': (1.0, 0.0, 0.0),    # Red
-            'Strain Gauge': (0.0, 1.0, 0.0),     # Green
-            'Camera': (1.0, 0.65, 0.0)           # Orange
-        }
-
-    def add_sensors(self):
+    def add_sensors(self, node_ids=None, node_positions=None):
+        """Add a sphere per registry sensor; with the mesh nodes, also map sensors to their nearest node"""
         try:
-            # Read sensor data from Excel
-            df_sensors = pd.read_excel('../data/Data_.xlsx', 
-                                       sheet_name='Sensor Location',
-                                       skiprows=1)  # Skip header row
-            df_sensors.columns = ['Sensors', 'Descriptions', 'Location', 'x(m)', 'y(m)', 'z(m)', 'Color']
-
-            # Process each sensor
-            for _, row in df_sensors.iterrows():
-                sensor_name = str(row['Sensors'])
-                sensor_type = next((t for t in self.sensor_colors if t.lower() in sensor_name.lower()), None)
-                if not sensor_type:
-                    continue
+            if node_ids is not None and len(node_ids):
+                self.mesh_nodes = self.registry.index_mesh(node_ids, node_positions)
 
-                # Get coordinates
-                try:
-                    x, y, z = float(row['x(m)']), float(row['y(m)']), float(row['z(m)'])
-                except ValueError:
+            for sensor in self.registry.sensors:
+                if sensor['type'] is None:
                     continue
 
                 # Create sphere for sensor
                 sphere = vtk.vtkSphereSource()
-                sphere.SetCenter(x, y, z)
+                sphere.SetCenter(sensor['x'], sensor['y'], sensor['z'])
                 sphere.SetRadius(0.5)
 
                 # Create mapper and actor
@@ -46,19 +30,12 @@ class SensorManager:
 
                 actor = vtk.vtkActor()
                 actor.SetMapper(mapper)
-                actor.GetProperty().SetColor(self.sensor_colors[sensor_type])
+                actor.GetProperty().SetColor(self.registry.color_of(sensor))
                 actor.GetProperty().SetOpacity(0.7)
 
-                # Store sensor information and actor reference
-                self.sensor_info.append({
-                    'type': sensor_type,
-                    'description': row['Descriptions'],
-                    'location': row['Location'],
-                    'x': x,
-                    'y': y,
-                    'z': z
-                })
+                # Store actor reference and its sensor
                 self.sensor_actors.append(actor)
+                self.actor_to_sensor[actor] = sensor
 
                 # Add to renderer
                 self.renderer.AddActor(actor)
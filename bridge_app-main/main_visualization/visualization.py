@@ -1,11 +1,14 @@
 import vtk
 import random
+import numpy as np
 import pandas as pd
-from data_handler import DataHandler
+from vtk.util import numpy_support
+from .data_handler import DataHandler
 
 class Visualization:
     def __init__(self, renderer):
         self.renderer = renderer
+        self.scalar_title = "Weight Values"
         self.setup_lookup_table()
         self.node_labels = []
         # Create data structures
@@ -23,48 +26,32 @@ class Visualization:
         self.lut.SetNanColor(0.0, 0.0, 0.0, 0.0)  # Make NaN values transparent
         self.lut.Build()
 
-    def setup_visualization(self, current_variable='U1'):
-        # Get columns for the selected variable
-        cols = DataHandler.get_columns_for_variable(current_variable)
-        
-        # Read weights data
-        df_weights = pd.read_excel('../data/Data_.xlsx', 
-                                 sheet_name='Variables for 5 Timesteps', 
-                                 header=None, 
-                                 skiprows=1,
-                                 usecols=[0] + [ord(col) - ord('A') for col in cols],
-                                 nrows=1882)
-        
-        df_weights.columns = ['number'] + [f'weight_t{i+1}' for i in range(5)]
-        
+    def setup_visualization(self):
         # Load geometry data
         df_nodes, df_conn = DataHandler.load_geometry_data()
         if df_nodes is None or df_conn is None:
-            return None, None, None, None
+            return None
 
-        # Create points
-        points = vtk.vtkPoints()
-
-        # Map node number to index and store weights
+        # Map node number to index
         node_to_index = {}
-        node_weights = {}
-        current_index = 0
+        for current_index, node_num in enumerate(df_nodes['number']):
+            node_to_index[int(node_num)] = current_index
 
-        # Insert points and store weights
-        for index, row in df_nodes.iterrows():
-            node_num = int(row['number'])
-            points.InsertNextPoint(row['x'], row['y'], row['z'])
-            
-            if node_num in df_weights['number'].values:
-                weight_row = df_weights[df_weights['number'] == node_num].iloc[0]
-                node_weights[node_num] = [
-                    float(weight_row[f'weight_t{i+1}']) for i in range(5)
-                ]
-            else:
-                node_weights[node_num] = [0.0] * 5
-            
-            node_to_index[node_num] = current_index
-            current_index += 1
+        # Undeformed coordinates, plus the buffer VTK reads the (possibly warped) points from
+        self.reference_points = df_nodes[['x', 'y', 'z']].to_numpy(dtype=np.float64)
+        self.deformed_points = self.reference_points.copy()
+        self.displacement = np.zeros(self.reference_points.shape)
+
+        # Create points that share memory with the deformed-point buffer
+        points = vtk.vtkPoints()
+        self.point_coordinates = numpy_support.numpy_to_vtk(self.deformed_points, deep=0)
+        points.SetData(self.point_coordinates)
+        self.points = points
+
+        # Displacement vectors live on the point data, also without copying
+        self.displacement_vectors = numpy_support.numpy_to_vtk(self.displacement, deep=0)
+        self.displacement_vectors.SetName("Displacement")
+        self.point_polydata.GetPointData().SetVectors(self.displacement_vectors)
 
         # Set points for all polydata objects
         self.point_polydata.SetPoints(points)
@@ -90,25 +77,24 @@ class Visualization:
 
         self.create_visualization_actors(points)
         self.create_node_labels(points, node_to_index)
+        self.build_topology(node_to_index, edges, planes)
         
-        return node_to_index, node_weights, edges, planes
+        return node_to_index, edges, planes
 
     def create_visualization_actors(self, points):
         # Create sphere source for points
         sphere = vtk.vtkSphereSource()
         sphere.SetRadius(0.1)
 
-        # Create glyph for points
-        glyph = vtk.vtkGlyph3D()
-        glyph.SetInputData(self.point_polydata)
-        glyph.SetSourceConnection(sphere.GetOutputPort())
-        glyph.ScalingOff()
-
-        # Create mappers
-        self.point_mapper = vtk.vtkPolyDataMapper()
-        self.point_mapper.SetInputConnection(glyph.GetOutputPort())
+        # Instance the sphere on the GPU so moving points does not regenerate glyph geometry
+        self.point_mapper = vtk.vtkGlyph3DMapper()
+        self.point_mapper.SetInputData(self.point_polydata)
+        self.point_mapper.SetSourceConnection(sphere.GetOutputPort())
+        self.point_mapper.ScalingOff()
+        self.point_mapper.OrientOff()
         self.point_mapper.SetLookupTable(self.lut)
 
+        # Create mappers
         self.edge_mapper = vtk.vtkPolyDataMapper()
         self.edge_mapper.SetInputData(self.edge_polydata)
         self.edge_mapper.SetLookupTable(self.lut)
@@ -200,65 +186,107 @@ class Visualization:
             for i, label in enumerate(self.node_labels):
                 label.SetVisibility(1 if i in visible_indices else 0)
 
-    def update_geometry(self, time_step, node_weights, node_to_index, edges, planes):
-        current_weights = []
-        
-        # Update point weights
-        point_weights = vtk.vtkDoubleArray()
-        point_weights.SetName("Weights")
-        for node_num in node_to_index.keys():
-            weight = node_weights[node_num][time_step]
-            point_weights.InsertNextValue(weight)
-            current_weights.append(weight)
-        
-        # Update edge geometry and weights
+    def build_topology(self, node_to_index, edges, planes):
+        """Create the edge and plane cells once and the scalar buffers they are colored from"""
+        self.num_nodes = len(node_to_index)
+        self.edge_index = np.array(
+            [(node_to_index[node1], node_to_index[node2]) for node1, node2 in edges],
+            dtype=np.int64
+        ).reshape(-1, 2)
+        self.plane_index = np.array(
+            [[node_to_index[node] for node in plane] for plane in planes],
+            dtype=np.int64
+        ).reshape(-1, 4)
+
+        # Update edge geometry
         edge_cells = vtk.vtkCellArray()
-        edge_weights = vtk.vtkDoubleArray()
-        edge_weights.SetName("Edge Weights")
-        
-        for node1, node2 in edges:
-            weight1 = node_weights[node1][time_step]
-            weight2 = node_weights[node2][time_step]
-            edge_weight = (weight1 + weight2) / 2.0
-            edge_weights.InsertNextValue(edge_weight)
-            current_weights.append(edge_weight)
-            
+        for point1, point2 in self.edge_index:
             line = vtk.vtkLine()
-            line.GetPointIds().SetId(0, node_to_index[node1])
-            line.GetPointIds().SetId(1, node_to_index[node2])
+            line.GetPointIds().SetId(0, int(point1))
+            line.GetPointIds().SetId(1, int(point2))
             edge_cells.InsertNextCell(line)
-        
-        # Update plane geometry and weights
+
+        # Update plane geometry
         plane_cells = vtk.vtkCellArray()
-        plane_weights = vtk.vtkDoubleArray()
-        plane_weights.SetName("Plane Weights")
-        
-        for node1, node2, node3, node4 in planes:
-            weights_for_quad = [
-                node_weights[node][time_step]
-                for node in [node1, node2, node3, node4]
-            ]
-            plane_weight = sum(weights_for_quad) / 4.0
-            plane_weights.InsertNextValue(plane_weight)
-            current_weights.append(plane_weight)
-            
+        for plane in self.plane_index:
             quad = vtk.vtkQuad()
-            quad.GetPointIds().SetId(0, node_to_index[node1])
-            quad.GetPointIds().SetId(1, node_to_index[node2])
-            quad.GetPointIds().SetId(2, node_to_index[node3])
-            quad.GetPointIds().SetId(3, node_to_index[node4])
+            for corner in range(4):
+                quad.GetPointIds().SetId(corner, int(plane[corner]))
             plane_cells.InsertNextCell(quad)
 
+        self.edge_polydata.SetLines(edge_cells)
+        self.plane_polydata.SetPolys(plane_cells)
+        self.edge_cells = edge_cells
+        self.plane_cells = plane_cells
+
+        # Preallocated value buffers, shared with VTK without copying
+        self.point_values = np.zeros(self.num_nodes)
+        self.edge_values = np.zeros(len(self.edge_index))
+        self.plane_values = np.zeros(len(self.plane_index))
+        self.edge_corner_values = np.zeros(self.edge_index.shape)
+        self.plane_corner_values = np.zeros(self.plane_index.shape)
+
+        self.point_weights = numpy_support.numpy_to_vtk(self.point_values, deep=0)
+        self.point_weights.SetName("Weights")
+        self.edge_weights = numpy_support.numpy_to_vtk(self.edge_values, deep=0)
+        self.edge_weights.SetName("Edge Weights")
+        self.plane_weights = numpy_support.numpy_to_vtk(self.plane_values, deep=0)
+        self.plane_weights.SetName("Plane Weights")
+
+        self.point_polydata.GetPointData().SetScalars(self.point_weights)
+        self.edge_polydata.GetCellData().SetScalars(self.edge_weights)
+        self.plane_polydata.GetCellData().SetScalars(self.plane_weights)
+
+    def set_node_values(self, values):
+        """Update point, edge and plane scalars in place from per-node values (index order)"""
+        np.copyto(self.point_values, values)
+
+        # Edges and planes are colored with the mean of their corner nodes
+        np.take(self.point_values, self.edge_index, out=self.edge_corner_values)
+        np.sum(self.edge_corner_values, axis=1, out=self.edge_values)
+        self.edge_values *= 0.5
+
+        np.take(self.point_values, self.plane_index, out=self.plane_corner_values)
+        np.sum(self.plane_corner_values, axis=1, out=self.plane_values)
+        self.plane_values *= 0.25
+
+        self.point_weights.Modified()
+        self.edge_weights.Modified()
+        self.plane_weights.Modified()
+
+        self.update_scalar_range()
+
+    def set_displacement(self, vectors, scale):
+        """Warp the mesh in place: points = reference + scale * displacement"""
+        np.copyto(self.displacement, vectors)
+        np.multiply(self.displacement, scale, out=self.deformed_points)
+        self.deformed_points += self.reference_points
+
+        self.displacement_vectors.Modified()
+        self.point_coordinates.Modified()
+        self.points.Modified()
+
+    def clear_displacement(self):
+        """Return the mesh to its undeformed shape"""
+        self.displacement.fill(0.0)
+        np.copyto(self.deformed_points, self.reference_points)
+
+        self.displacement_vectors.Modified()
+        self.point_coordinates.Modified()
+        self.points.Modified()
+
+    def update_scalar_range(self):
         # Handle color scaling more robustly
-        if current_weights:
+        if self.num_nodes:
+            current_min = self.point_values.min()
+            current_max = self.point_values.max()
+
             # Filter out extreme values (optional)
-            filtered_weights = [w for w in current_weights if abs(w) < 1e10]  # Adjust threshold as needed
-            if filtered_weights:
-                current_min = min(filtered_weights)
-                current_max = max(filtered_weights)
-            else:
-                current_min = min(current_weights)
-                current_max = max(current_weights)
+            if abs(current_min) >= 1e10 or abs(current_max) >= 1e10:
+                filtered_weights = self.point_values[np.abs(self.point_values) < 1e10]
+                if filtered_weights.size:
+                    current_min = filtered_weights.min()
+                    current_max = filtered_weights.max()
 
             # Prevent division by zero and handle equal min/max
             if abs(current_max - current_min) < 1e-10:
@@ -273,13 +301,6 @@ class Visualization:
             self.lut.SetTableRange(-1, 1)
             self.lut.Build()
         
-        # Update polydata
-        self.point_polydata.GetPointData().SetScalars(point_weights)
-        self.edge_polydata.SetLines(edge_cells)
-        self.edge_polydata.GetCellData().SetScalars(edge_weights)
-        self.plane_polydata.SetPolys(plane_cells)
-        self.plane_polydata.GetCellData().SetScalars(plane_weights)
-        
         # Update scalar ranges consistently
         range = self.lut.GetTableRange()
         self.point_mapper.SetScalarRange(range)
@@ -287,4 +308,4 @@ class Visualization:
         self.plane_mapper.SetScalarRange(range)
 
     def update_scalar_bar_title(self, time_step):
-        self.scalar_bar.SetTitle(f"Weight Values\nt = {time_step + 1}")
\ No newline at end of file
+        self.scalar_bar.SetTitle(f"{self.scalar_title}\nt = {time_step + 1}")
\ No newline at end of file
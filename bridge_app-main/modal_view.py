@@ -0,0 +1,154 @@
+import numpy as np
+from PyQt5.QtCore import QTimer
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QListWidget, QLabel, QCheckBox
+
+from data_loader import loader_service
+from plot_widgets import FastPlotWidget
+from sensor_analysis.modal import ModalAnalysis, ModeShapeMapper
+from sensor_registry import shared_registry
+
+
+def build_analysis(channels, names, fs, ssi_lags, task=None):
+    """Run the initial (possibly long) history of [samples per channel] through a new ModalAnalysis; for a loader thread"""
+    analysis = ModalAnalysis(names, fs, ssi_lags=ssi_lags)
+    chunk = 64 * analysis.spectra.nperseg
+    # Channels are stacked a chunk at a time, never as one copy of the whole history
+    num_samples = len(channels[0]) if channels else 0
+    for start in range(0, num_samples, chunk):
+        if task is not None:
+            task.check_cancelled()
+            task.report_progress(start, num_samples)
+        analysis.add_block(np.vstack([values[start:start + chunk] for values in channels]))
+    return analysis
+
+
+class ModalAnalysisWindow(QWidget):
+    """Singular value spectrum and identified modes of the accelerometer array.
+
+    The loaded history is analysed once on the loader thread; afterwards only
+    samples that arrive while the feed is live are added. Selecting a mode
+    animates its shape on the 3D model returned by get_model (a GLWidget or None).
+    """
+
+    def __init__(self, feed, get_model=None, num_modes=6, ssi_lags=30, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Modal Analysis")
+        self.setGeometry(100, 100, 900, 600)
+        self.feed = feed
+        self.get_model = get_model
+        self.num_modes = num_modes
+        self.ssi_lags = ssi_lags
+        self.analysis = None
+        self.modes = []
+        self.mapper = None
+        self.mapper_model = None
+        self.last_time = None
+
+        self.plot = FastPlotWidget(xlabel="Frequency (Hz)", ylabel="First singular value", toolbar=True)
+        self.plot.ax.set_yscale('log')
+        self.peaks, = self.plot.ax.plot([], [], 'v', color='orange', animated=True)
+        self.plot.animated.append(self.peaks)
+
+        self.ssi_check = QCheckBox("Include SSI (damping)")
+        self.ssi_check.toggled.connect(self.update_modes)
+        self.mode_list = QListWidget()
+        self.mode_list.currentRowChanged.connect(self.animate_mode)
+        self.status_label = QLabel("Analysing...")
+
+        side = QVBoxLayout()
+        side.addWidget(self.ssi_check)
+        side.addWidget(self.mode_list, 1)
+        side.addWidget(self.status_label)
+        layout = QHBoxLayout(self)
+        layout.addWidget(self.plot, 3)
+        layout.addLayout(side, 1)
+
+        # New live samples are folded in periodically
+        self.update_timer = QTimer(self)
+        self.update_timer.timeout.connect(self.add_new_samples)
+
+        names = feed.names()
+        time_values = feed.time_values
+        fs = 1.0 / np.median(np.diff(time_values)) if len(time_values) > 1 else 1.0
+        channels = [feed.channels[name] for name in names]
+        self.last_time = time_values[-1] if len(time_values) else -np.inf
+        loader_service().submit(
+            build_analysis, channels, names, fs, ssi_lags,
+            pass_task=True,
+            owner=self,
+            on_progress=lambda percent: self.status_label.setText(f"Analysing... {percent}%"),
+            on_finished=self.on_analysis_ready,
+            on_failed=lambda message: self.status_label.setText(f"Analysis failed: {message}")
+        )
+
+    def on_analysis_ready(self, analysis):
+        self.analysis = analysis
+        self.update_modes()
+        self.update_timer.start(2000)
+
+    def add_new_samples(self):
+        """Add rows received since the last update (from live blocks or a merged history)"""
+        names = self.analysis.names
+        sources = [(self.feed.time_values, None)] + self.feed.pending
+        added = 0
+        for time_values, values in sources:
+            start = np.searchsorted(time_values, self.last_time, side='right')
+            if start >= len(time_values):
+                continue
+            if values is None:
+                block = np.vstack([self.feed.channels[name][start:] for name in names])
+            else:
+                block = values[start:].T
+            self.analysis.add_block(block)
+            self.last_time = time_values[-1]
+            added += block.shape[1]
+        if added:
+            self.update_modes()
+
+    def update_modes(self):
+        if self.analysis is None:
+            return
+        freqs, s1, _ = self.analysis.singular_values()
+        self.modes = self.analysis.fdd(self.num_modes)
+        if self.ssi_check.isChecked():
+            self.modes = sorted(self.modes + self.analysis.ssi(), key=lambda mode: mode.frequency)
+
+        positive = s1[1:][s1[1:] > 0]
+        if len(positive):
+            self.plot.set_limits((freqs[0], freqs[-1]), (positive.min() * 0.5, positive.max() * 2.0))
+        fdd_modes = [mode for mode in self.modes if mode.method == 'FDD']
+        self.peaks.set_data([mode.frequency for mode in fdd_modes], [mode.magnitude for mode in fdd_modes])
+        self.plot.set_data(freqs, s1, title=f"FDD over {self.analysis.spectra.segment_count} segments")
+
+        row = self.mode_list.currentRow()
+        self.mode_list.blockSignals(True)
+        self.mode_list.clear()
+        self.mode_list.addItems([mode.label() for mode in self.modes])
+        self.mode_list.blockSignals(False)
+        if 0 <= row < len(self.modes):
+            self.mode_list.setCurrentRow(row)
+        self.status_label.setText(f"{len(self.modes)} modes, {len(self.analysis.names)} channels")
+
+    def animate_mode(self, row):
+        model = self.get_model() if self.get_model is not None else None
+        if model is None or not 0 <= row < len(self.modes):
+            return
+        if self.mapper_model is not model:
+            node_ids = list(model.node_data.keys())
+            self.mapper = ModeShapeMapper(shared_registry(), self.analysis.names, node_ids,
+                                          np.array(list(model.node_data.values())))
+            self.mapper_model = model
+        # Peak displacement of about 5% of the model's size
+        positions = np.array(list(model.node_data.values()))
+        amplitude = 0.05 * float(np.max(np.ptp(positions, axis=0)))
+        model.set_node_weights(self.mapper.node_weights(self.modes[row].shape, amplitude=amplitude))
+
+    def closeEvent(self, event):
+        self.update_timer.stop()
+        loader_service().cancel_owned(self)
+        super().closeEvent(event)
+
+    def showEvent(self, event):
+        if self.analysis is not None:
+            self.update_timer.start(2000)
+        super().showEvent(event)
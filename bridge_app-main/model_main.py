@@ -8,23 +8,30 @@ from OpenGL.GL import *
 from OpenGL.GLU import *
 from OpenGL.GLUT import *
 from PyQt5.QtWidgets import QMessageBox
+from sensor_registry import shared_registry
 
 # OpenGL Widget for rendering 3D elements with WASD controls and mouse rotation
 class GLWidget(QOpenGLWidget):
     positionChanged = pyqtSignal(float, float, float)  # Signal to emit camera position
 
-    def __init__(self, node_data, element_data, node_weights, parent=None):
+    def __init__(self, node_data, element_data, node_weights, parent=None, registry=None):
         super(GLWidget, self).__init__(parent)
         self.node_data = node_data  # Dictionary with node number and positions
         self.element_data = element_data  # List with element connections
         self.node_weights = node_weights  # Dictionary with weight data per node
-        # Define spheres with their positions and colors
+
+        # One sphere per sensor in the registry, colored by sensor type
+        self.registry = registry or shared_registry()
+        self.mesh_nodes = self.registry.index_mesh(list(node_data.keys()), np.array(list(node_data.values())))
         self.spheres = [
-            {"color": (1.0, 0.0, 0.0), "position": [0, 0, 4.6], "label": "Accelerometer", "radius": 1.0},
-            {"color": (0.0, 0.0, 1.0), "position": [46, 21, 6], "label": "Strain Gauge", "radius": 1.0},
-            {"color": (0.0, 1.0, 0.0), "position": [70, 21, 6], "label": "Displacement Sensor", "radius": 1.0},
-            {"color": (1.0, 1.0, 0.0), "position": [114, 0, 6], "label": "Camera", "radius": 1.0}
+            {"color": self.registry.color_of(sensor), "position": [sensor['x'], sensor['y'], sensor['z']],
+             "label": sensor['name'], "radius": 1.0, "sensor": sensor}
+            for sensor in self.registry.sensors if sensor['type'] is not None
         ]
+        # Sphere centres and pick radii as arrays for the vectorized ray test
+        pick_tolerance = 0.5  # Adjust this value to increase tolerance
+        self.sphere_centers = np.array([sphere["position"] for sphere in self.spheres], dtype=np.float64).reshape(-1, 3)
+        self.sphere_pick_radii = np.array([sphere["radius"] + pick_tolerance for sphere in self.spheres])
 
         # Camera control variables
         self.camera_pos = [0.0, 5.0, 20.0]
@@ -47,6 +54,11 @@ class GLWidget(QOpenGLWidget):
         self.min_weight = min(all_weights) or 0.0
         self.max_weight = max(all_weights) or 1.0
 
+        # Keyframe weights shown as vertical displacement (see set_node_weights); None draws the mesh at rest
+        self.node_ids = list(node_data.keys())
+        self.rest_positions = np.array(list(node_data.values()), dtype=np.float64).reshape(-1, 3)
+        self.displacement_keyframes = None
+
         # Timer for camera movement
         self.timer = QTimer(self)
         self.timer.timeout.connect(self.update_position)
@@ -99,12 +111,13 @@ class GLWidget(QOpenGLWidget):
         self.viewport = glGetIntegerv(GL_VIEWPORT)
 
         # Draw elements and spheres
+        node_data = self.displaced_nodes() if self.displacement_keyframes is not None else self.node_data
         for element in self.element_data:
             if len(element) == 4:
-                node_positions = [self.node_data[node] for node in element]
+                node_positions = [node_data[node] for node in element]
                 self.draw_surface(node_positions, element)
             elif len(element) == 2:
-                node_positions = [self.node_data[node] for node in element]
+                node_positions = [node_data[node] for node in element]
                 self.draw_line(node_positions, element)
 
         # Draw spheres
@@ -113,6 +126,36 @@ class GLWidget(QOpenGLWidget):
 
         glPopMatrix()
 
+    def set_node_weights(self, node_weights, displace=True):
+        """Replace the keyframe weights ({node: [weight per keyframe]}, e.g. a mode shape).
+
+        With displace=True the mesh is animated by moving each node vertically by its
+        interpolated weight, looping over the keyframes every animation_duration.
+        """
+        self.node_weights = node_weights
+        self.num_keyframes = len(next(iter(node_weights.values())))
+        all_weights = [weight for weights in node_weights.values() for weight in weights]
+        self.min_weight = min(all_weights) or 0.0
+        self.max_weight = max(all_weights) or 1.0
+        if displace:
+            rest = [0.0] * self.num_keyframes
+            self.displacement_keyframes = np.array([node_weights.get(node, rest) for node in self.node_ids])
+        else:
+            self.displacement_keyframes = None
+        self.current_time = 0
+        self.update()
+
+    def displaced_nodes(self):
+        """Node positions at the current animation time, interpolated between keyframes"""
+        position = (self.current_time % self.animation_duration) / self.animation_duration * self.num_keyframes
+        index = int(position)
+        fraction = position - index
+        keyframes = self.displacement_keyframes
+        weights = (1 - fraction) * keyframes[:, index] + fraction * keyframes[:, (index + 1) % self.num_keyframes]
+        positions = self.rest_positions.copy()
+        positions[:, 1] += weights
+        return dict(zip(self.node_ids, positions.tolist()))
+
     def draw_sphere(self, position, color, radius):
         glPushMatrix()
         glTranslatef(*position)
@@ -141,30 +184,27 @@ class GLWidget(QOpenGLWidget):
         ray_direction = np.array(far) - np.array(near)
         ray_direction = ray_direction / np.linalg.norm(ray_direction)  # Normalize
 
-        for sphere in self.spheres:
-            sphere_center = np.array(sphere["position"])
-            sphere_radius = sphere["radius"]  # Use the sphere's actual radius
-
-            pick_tolerance = 0.5  # Adjust this value to increase tolerance
-            pick_radius = sphere_radius + pick_tolerance
-
-            # Ray-sphere intersection test
-            oc = ray_origin - sphere_center
-            a = np.dot(ray_direction, ray_direction)
-            b = 2.0 * np.dot(oc, ray_direction)
-            c = np.dot(oc, oc) - pick_radius ** 2
-            discriminant = b ** 2 - 4 * a * c
-
-            if discriminant >= 0:
-                # The ray intersects the sphere
-                self.show_popover(sphere["label"])
-                break  # Stop after first hit
+        # Ray-sphere intersection test against every sensor at once (direction is unit length)
+        oc = ray_origin - self.sphere_centers
+        b = 2.0 * (oc @ ray_direction)
+        c = np.einsum('ij,ij->i', oc, oc) - self.sphere_pick_radii ** 2
+        discriminant = b ** 2 - 4 * c
+        hits = np.flatnonzero(discriminant >= 0)
+        if len(hits):
+            # The closest sphere along the ray wins
+            distance = (-b[hits] - np.sqrt(discriminant[hits])) / 2.0
+            self.show_popover(self.spheres[hits[np.argmin(distance)]]["sensor"])
 
 
-    def show_popover(self, label):
+    def show_popover(self, sensor):
+        nearest = self.mesh_nodes.nearest_node(sensor['name'])
         msg = QMessageBox()
         msg.setWindowTitle("Sensor Information")
-        msg.setText(f"{label} data:\nDummy Value: 123")
+        msg.setText(f"{sensor['name']}\n"
+                    f"Description: {sensor['description']}\n"
+                    f"Location: {sensor['location']}\n"
+                    f"Coordinates: ({sensor['x']:.2f}, {sensor['y']:.2f}, {sensor['z']:.2f})"
+                    + (f"\nNearest node: {nearest[0]} ({nearest[1]:.2f} m)" if nearest else ""))
         msg.exec_()
 
     def draw_line(self, positions, node_indices):
@@ -261,7 +301,8 @@ class MainWindow(QMainWindow):
     def update_status_bar(self, x, y, z):
         self.statusBar.showMessage(f"Camera Position: x={x:.2f}, y={y:.2f}, z={z:.2f}")
 
-def read_csv(filename):
+def read_csv(filename, task=None):
+    """Read nodes, elements and U2 weights; task is an optional data_loader task for progress/cancel"""
     node_data = {}
     node_weights = {}
     element_data = []
@@ -271,7 +312,10 @@ def read_csv(filename):
         rows = list(reader)
 
     # First, read node data
-    for row in rows:
+    for index, row in enumerate(rows):
+        if task is not None and index % 500 == 0:
+            task.check_cancelled()
+            task.report_progress(index, 2 * len(rows))
         try:
             if row.get('NODE_number'):
                 node_num = int(row['NODE_number'])
@@ -293,7 +337,10 @@ def read_csv(filename):
             print(f"Error: Invalid data format {e}")
 
     # Then, read element data
-    for row in rows:
+    for index, row in enumerate(rows):
+        if task is not None and index % 500 == 0:
+            task.check_cancelled()
+            task.report_progress(len(rows) + index, 2 * len(rows))
         try:
             element = []
             if row.get('Element1'):
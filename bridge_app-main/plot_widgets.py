@@ -0,0 +1,147 @@
+import numpy as np
+from PyQt5.QtWidgets import QWidget, QVBoxLayout
+from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
+from matplotlib.figure import Figure
+
+from decimation import MinMaxPyramid
+
+
+class FastPlotWidget(QWidget):
+    """Matplotlib line plot that keeps its artists and redraws by blitting.
+
+    The axes, ticks and grid are rendered once into a cached background. New data
+    goes through Line2D.set_data and only the line, title and legend are redrawn on
+    top of that background. A full redraw only happens when the axis limits change,
+    so fixing them with set_limits (e.g. shared across every channel of a feed)
+    makes switching series a blit.
+
+    Series longer than DECIMATE_ABOVE samples are drawn through a MinMaxPyramid at
+    the axes' pixel width (min/max envelope, or LTTB with decimation='lttb') and
+    re-reduced whenever the x-limits change, so zooming in reveals full detail.
+    """
+
+    DECIMATE_ABOVE = 20000
+
+    def __init__(self, xlabel='', ylabel='', title='', color=None, linewidth=0.8,
+                 figsize=None, legend=True, toolbar=False, decimation='minmax', parent=None):
+        super().__init__(parent)
+        self.figure = Figure(figsize=figsize)
+        self.canvas = FigureCanvas(self.figure)
+        self.ax = self.figure.add_subplot(111)
+        self.ax.set_xlabel(xlabel)
+        self.ax.set_ylabel(ylabel)
+
+        # Artists that change with the data are excluded from the cached background
+        self.line, = self.ax.plot([], [], color=color, marker='', linewidth=linewidth)
+        self.title = self.ax.set_title(title)
+        self.legend = self.ax.legend([self.line], [''], loc='upper right') if legend else None
+        self.animated = [artist for artist in (self.line, self.title, self.legend) if artist is not None]
+        for artist in self.animated:
+            artist.set_animated(True)
+
+        self.xlim = None  # Fixed limits; None means fit to the current data
+        self.ylim = None
+        self.background = None
+        self.canvas.mpl_connect('draw_event', self.on_draw)
+
+        # Decimation state: the pyramid of the current series and the view it was reduced for
+        self.decimation = decimation
+        self.pyramid = None
+        self.decimated_view = None
+        self.ax.callbacks.connect('xlim_changed', self.on_xlim_changed)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        if toolbar:
+            self.toolbar = NavigationToolbar(self.canvas, self)
+            layout.addWidget(self.toolbar)
+        layout.addWidget(self.canvas)
+
+    def on_draw(self, event):
+        # A full draw skips animated artists, so cache what it produced and add them on top
+        self.background = self.canvas.copy_from_bbox(self.figure.bbox)
+        self.update_decimated_line()  # The axes may have been resized
+        self.draw_animated()
+
+    def on_xlim_changed(self, ax):
+        # Zoom/pan: the toolbar redraws afterwards, which picks up the new line data
+        self.update_decimated_line()
+
+    def update_decimated_line(self):
+        """Reduce the current series to the visible x-range at the axes' pixel width"""
+        if self.pyramid is None:
+            return
+        x0, x1 = self.ax.get_xlim()
+        pixels = max(int(self.ax.bbox.width), 100)
+        view = (x0, x1, pixels)
+        if view == self.decimated_view:
+            return
+        self.decimated_view = view
+        if self.decimation == 'lttb':
+            self.line.set_data(*self.pyramid.lttb(x0, x1, pixels))
+        else:
+            self.line.set_data(*self.pyramid.envelope(x0, x1, pixels))
+
+    def draw_animated(self):
+        for artist in self.animated:
+            self.figure.draw_artist(artist)
+
+    def set_limits(self, xlim=None, ylim=None):
+        """Fix the axis limits (None leaves that axis fitted to the data)"""
+        self.xlim = xlim
+        self.ylim = ylim
+
+    def set_data(self, x, y, label=None, title=None, pyramid=None):
+        """Swap the plotted series; redraws by blitting unless the limits change.
+
+        Pass a prebuilt MinMaxPyramid for series that are shown repeatedly, otherwise
+        one is built here for long series.
+        """
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        if pyramid is None and len(x) > self.DECIMATE_ABOVE:
+            pyramid = MinMaxPyramid(x, y)
+        self.pyramid = pyramid
+        self.decimated_view = None
+        if pyramid is None:
+            self.line.set_data(x, y)
+        if label is not None and self.legend is not None:
+            self.legend.get_texts()[0].set_text(label)
+        if title is not None:
+            self.title.set_text(title)
+
+        xlim = self.xlim or self.data_limits(x, margin=0.0)
+        ylim = self.ylim or self.data_limits(y)
+        if xlim is not None and tuple(xlim) != tuple(self.ax.get_xlim()):
+            self.ax.set_xlim(xlim)
+            self.background = None
+        if ylim is not None and tuple(ylim) != tuple(self.ax.get_ylim()):
+            self.ax.set_ylim(ylim)
+            self.background = None
+        self.update_decimated_line()
+        self.refresh()
+
+    def refresh(self):
+        """Redraw the animated artists over the cached background"""
+        if self.background is None:
+            # Ticks changed (or first draw): render everything, on_draw recaches
+            self.canvas.draw()
+            return
+        self.canvas.restore_region(self.background)
+        self.draw_animated()
+        self.canvas.blit(self.figure.bbox)
+
+    @staticmethod
+    def data_limits(values, margin=0.02):
+        """Return (min, max) of the finite values padded by a margin, or None if there are none"""
+        if len(values) == 0:
+            return None
+        low = np.nanmin(values)
+        high = np.nanmax(values)
+        if not np.isfinite(low) or not np.isfinite(high):
+            return None
+        if high == low:
+            return (low - 1.0, high + 1.0)
+        pad = (high - low) * margin
+        return (low - pad, high + pad)
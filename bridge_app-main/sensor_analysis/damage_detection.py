@@ -0,0 +1,220 @@
+import os
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from .modal import IncrementalCSD, pick_peaks, real_shape
+
+DAMAGE_TYPES = ("", "20%", "40%", "Failure")  # By severity; the damage viewer's color keys
+
+
+def idw_weights(targets, sources, power=2.0):
+    """(targets, sources) inverse-distance weights, each row summing to 1"""
+    distances = np.linalg.norm(np.asarray(targets, dtype=np.float64)[:, None, :]
+                               - np.asarray(sources, dtype=np.float64)[None], axis=2)
+    weights = 1.0 / np.maximum(distances, 1e-9) ** power
+    return weights / weights.sum(axis=1, keepdims=True)
+
+
+def peak_frequency(freqs, values, index):
+    """Frequency of a spectral peak refined by a parabola through the log values around it"""
+    if index <= 0 or index >= len(values) - 1:
+        return freqs[index]
+    left, centre, right = np.log(np.maximum(values[index - 1:index + 2], 1e-300))
+    curvature = left - 2.0 * centre + right
+    offset = 0.5 * (left - right) / curvature if curvature < 0 else 0.0
+    return freqs[index] + offset * (freqs[1] - freqs[0])
+
+
+class DamageTable:
+    """Damage indices per part over window end times, and the viewer's status per window.
+
+    indices is (windows, parts). A window's status is that of its worst part: its
+    damage type is the number of thresholds the index exceeds, and its location is
+    that part's label. entry(window) has the shape of the viewer's damage timeline.
+    """
+
+    def __init__(self, times, parts, indices, thresholds):
+        self.times = np.asarray(times, dtype=np.float64)
+        self.parts = list(parts)
+        self.indices = np.asarray(indices, dtype=np.float64).reshape(len(self.times), len(self.parts))
+        self.thresholds = tuple(thresholds)
+
+    def __len__(self):
+        return len(self.times)
+
+    def levels(self):
+        """(windows, parts) severity levels, indexes into DAMAGE_TYPES"""
+        return np.searchsorted(self.thresholds, np.nan_to_num(self.indices), side='right')
+
+    def entry(self, window):
+        levels = self.levels()[window]
+        worst = int(np.argmax(self.indices[window])) if len(self.parts) else 0
+        if not len(self.parts) or levels[worst] == 0:
+            return {"status": "No", "damage_type": "", "location": None}
+        return {"status": "Yes", "damage_type": DAMAGE_TYPES[levels[worst]], "location": self.parts[worst]}
+
+    def entry_at(self, time):
+        """Entry of the last window ending at or before time"""
+        return self.entry(max(bisect_right(self.times, time) - 1, 0))
+
+    def damage_data(self):
+        """{time: entry} for every window"""
+        return {float(time): self.entry(window) for window, time in enumerate(self.times)}
+
+
+class DamageDetector:
+    """Damage indicators per structural part from sliding windows of accelerometer and strain data.
+
+    Each window yields these indicators per part:
+      - frequency shift: relative drop of each tracked natural frequency (FDD peaks
+        searched near the reference modes), one indicator per mode, the same for
+        every part;
+      - mode-shape change: per-accelerometer change of the tracked mode shapes,
+        spread over the parts by the acc_weights rows;
+      - strain ratio change: per-gauge change of the gauge's RMS relative to the
+        mean gauge RMS (which cancels the traffic level), spread by strain_weights.
+    fit() takes the reference modes and strain ratios from a healthy span, and the
+    mean and spread of each indicator over that span's windows. Reference modes
+    are spectral peaks standing well above the local noise floor where one mode
+    dominates the cross-spectrum, so num_modes is an upper bound. A window's damage
+    index for a part is the norm of its indicators' positive z-scores. Windows are
+    independent once fitted, so detect() spreads them over a thread pool; the
+    arrays may be memory maps, as only the windows being processed are read.
+    """
+
+    TRACK_BAND = 0.15  # Reference modes are searched within this relative frequency band
+    MIN_PROMINENCE = 4.0  # A reference peak's first singular value over the median around it
+    MIN_DOMINANCE = 0.5  # ... and its share of the cross-spectral power at that frequency
+
+    def __init__(self, fs, acc_weights, strain_weights, parts, window_seconds=600.0, step_seconds=None,
+                 nperseg=1024, num_modes=4, thresholds=(3.0, 6.0, 10.0)):
+        self.fs = float(fs)
+        self.acc_weights = np.asarray(acc_weights, dtype=np.float64)
+        self.strain_weights = np.asarray(strain_weights, dtype=np.float64)
+        self.parts = list(parts)
+        self.window = max(int(round(window_seconds * self.fs)), 1)
+        self.step = max(int(round((step_seconds or window_seconds) * self.fs)), 1)
+        self.nperseg = min(nperseg, self.window)
+        self.num_modes = num_modes
+        self.thresholds = thresholds
+
+        # Set by fit()
+        self.reference_freqs = None
+        self.reference_shapes = None
+        self.reference_ratios = None
+        self.mean = None
+        self.spread = None
+
+    def window_starts(self, num_samples, start=0, stop=None):
+        stop = num_samples if stop is None else min(stop, num_samples)
+        return np.arange(start, max(stop - self.window + 1, start), self.step)
+
+    def singular_values(self, acc, dominance=False):
+        """(freqs, s1, u1) of the window's cross-spectral matrix, and s1's share of the power if dominance"""
+        spectra = IncrementalCSD(acc.shape[0], self.fs, self.nperseg)
+        spectra.add_block(np.nan_to_num(acc))
+        freqs, csd = spectra.matrix()
+        values, vectors = np.linalg.eigh(csd)
+        if dominance:
+            with np.errstate(invalid='ignore', divide='ignore'):
+                share = np.nan_to_num(values[:, -1] / values.sum(axis=1))
+            return freqs, values[:, -1], vectors[:, :, -1], share
+        return freqs, values[:, -1], vectors[:, :, -1]
+
+    def significant_peaks(self, s1, share):
+        """Indices of up to num_modes peaks of s1 that stand out of the noise floor"""
+        width = max(len(s1) // 40, 2)
+        padded = np.pad(s1, width, mode='edge')
+        floor = np.median(np.lib.stride_tricks.sliding_window_view(padded, 2 * width + 1), axis=1)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            significant = (s1 >= self.MIN_PROMINENCE * floor) & (share >= self.MIN_DOMINANCE)
+        significant[0] = False  # The DC bin carries no mode
+        return pick_peaks(np.where(significant, s1, 0.0), self.num_modes, max(int(len(s1) * 0.02), 1))
+
+    def strain_ratios(self, strain):
+        rms = np.sqrt(np.nanmean((strain - np.nanmean(strain, axis=1, keepdims=True)) ** 2, axis=1))
+        mean = np.mean(rms) if len(rms) else 0.0
+        return rms / mean if mean > 0 else np.ones_like(rms)
+
+    def features(self, acc, strain):
+        """(mode frequencies, (modes, accelerometers) shapes, strain ratios) of one window, tracking the reference"""
+        freqs, s1, u1 = self.singular_values(acc)
+        frequencies = np.full(len(self.reference_freqs), np.nan)
+        shapes = np.zeros((len(self.reference_freqs), acc.shape[0]))
+        for mode, reference in enumerate(self.reference_freqs):
+            band = np.flatnonzero(np.abs(freqs - reference) <= self.TRACK_BAND * reference)
+            if len(band) == 0:
+                continue
+            index = band[np.argmax(s1[band])]
+            frequencies[mode] = peak_frequency(freqs, s1, index)
+            shape = real_shape(u1[index])
+            # Mode shapes have no sign of their own; match the reference's
+            shapes[mode] = shape if shape @ self.reference_shapes[mode] >= 0 else -shape
+        return frequencies, shapes, self.strain_ratios(strain)
+
+    def indicators(self, acc, strain):
+        """(parts, modes + 2) raw indicators of one window: frequency drop per mode, mode-shape change, strain ratio change"""
+        frequencies, shapes, ratios = self.features(acc, strain)
+        # Modes are scored separately; averaging would dilute one mode's drop with the others' noise
+        drops = np.nan_to_num((self.reference_freqs - frequencies) / self.reference_freqs)
+        shape_change = np.mean(np.abs(shapes - self.reference_shapes), axis=0) if len(shapes) else np.zeros(acc.shape[0])
+        with np.errstate(invalid='ignore', divide='ignore'):
+            ratio_change = np.nan_to_num(np.abs(ratios / self.reference_ratios - 1.0))
+        return np.column_stack([
+            np.tile(drops, (len(self.parts), 1)),
+            self.acc_weights @ shape_change,
+            self.strain_weights @ ratio_change
+        ])
+
+    def fit(self, acc, strain, start=0, stop=None):
+        """Take the reference state from samples [start, stop), assumed healthy"""
+        stop = acc.shape[1] if stop is None else stop
+        freqs, s1, u1, share = self.singular_values(acc[:, start:stop], dominance=True)
+        peaks = self.significant_peaks(s1, share)
+        self.reference_freqs = np.array([peak_frequency(freqs, s1, index) for index in peaks])
+        self.reference_shapes = np.array([real_shape(u1[index]) for index in peaks]).reshape(len(peaks), acc.shape[0])
+        self.reference_ratios = self.strain_ratios(strain[:, start:stop])
+
+        # Indicator spread over the healthy windows sets the scale of the damage index
+        num_indicators = len(peaks) + 2
+        samples = np.array([self.indicators(acc[:, first:first + self.window], strain[:, first:first + self.window])
+                            for first in self.window_starts(acc.shape[1], start, stop)])
+        samples = samples.reshape(-1, len(self.parts), num_indicators)
+        self.mean = samples.mean(axis=0) if len(samples) else np.zeros((len(self.parts), num_indicators))
+        spread = samples.std(axis=0) if len(samples) > 1 else np.zeros((len(self.parts), num_indicators))
+        # Floor the spread so a perfectly steady baseline does not make every change infinite
+        self.spread = np.maximum(spread, np.maximum(1e-3 * np.abs(self.mean), 1e-6))
+
+    def damage_index(self, indicators):
+        scores = np.maximum((indicators - self.mean) / self.spread, 0.0)
+        return np.sqrt(np.sum(scores ** 2, axis=-1))
+
+    def detect(self, time_values, acc, strain, baseline_seconds=None, workers=None, task=None, batch=64):
+        """DamageTable over every window; fits on the first baseline_seconds (default 12 windows) if not fitted yet.
+
+        time_values, acc (accelerometers, samples) and strain (gauges, samples)
+        share one time base, e.g. an AlignedBlock's.
+        """
+        starts = self.window_starts(acc.shape[1])
+        if len(starts) == 0:
+            return DamageTable([], self.parts, np.zeros((0, len(self.parts))), self.thresholds)
+        if self.reference_freqs is None:
+            baseline = int(round(baseline_seconds * self.fs)) if baseline_seconds else 12 * self.window
+            self.fit(acc, strain, 0, baseline)
+
+        def window_index(first):
+            return self.damage_index(self.indicators(acc[:, first:first + self.window],
+                                                     strain[:, first:first + self.window]))
+
+        indices = []
+        with ThreadPoolExecutor(max_workers=workers or os.cpu_count() or 1) as pool:
+            for first in range(0, len(starts), batch):
+                if task is not None:
+                    task.check_cancelled()
+                    task.report_progress(first, len(starts))
+                indices.extend(pool.map(window_index, starts[first:first + batch]))
+        times = np.asarray(time_values)[np.minimum(starts + self.window - 1, len(time_values) - 1)]
+        return DamageTable(times, self.parts, np.array(indices).reshape(len(starts), len(self.parts)),
+                           self.thresholds)
@@ -0,0 +1,122 @@
+import csv
+
+import numpy as np
+
+
+def timeline_locations(damage_data, times):
+    """Damage location (0 for none) of a {time: damage info} timeline at each time, holding the last entry"""
+    keys = sorted(damage_data)
+    if not keys:
+        return np.zeros(len(times), dtype=np.int64)
+    labels = np.array([
+        int(damage_data[key]["location"]) if damage_data[key]["status"] == "Yes" and damage_data[key]["location"] else 0
+        for key in keys
+    ])
+    index = np.searchsorted(keys, np.asarray(times, dtype=np.float64), side='right') - 1
+    return np.where(index >= 0, labels[np.maximum(index, 0)], 0)
+
+
+def confusion_matrices(groups, truth, predicted, num_groups, num_classes):
+    """(groups, true class, predicted class) counts for every group from one bincount"""
+    flat = (np.asarray(groups, dtype=np.int64) * num_classes + truth) * num_classes + predicted
+    counts = np.bincount(flat, minlength=num_groups * num_classes * num_classes)
+    return counts.reshape(num_groups, num_classes, num_classes)
+
+
+def matrix_metrics(matrices, distances):
+    """Metrics of (configurations, classes, classes) confusion matrices, all computed at once.
+
+    Class 0 is "no damage" and class k the damage location k. Localisation error is
+    the mean distance between true and predicted location over the windows where
+    both are damaged.
+    """
+    matrices = np.asarray(matrices, dtype=np.float64)
+    true_positive = np.diagonal(matrices, axis1=1, axis2=2)
+    actual = matrices.sum(axis=2)
+    predicted = matrices.sum(axis=1)
+    total = matrices.sum(axis=(1, 2))
+    located = matrices[:, 1:, 1:]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        precision = true_positive / predicted
+        recall = true_positive / actual
+        return {
+            'precision': precision,
+            'recall': recall,
+            'f1': 2.0 * precision * recall / (precision + recall),
+            'support': actual,
+            'accuracy': true_positive.sum(axis=1) / total,
+            # Damage windows flagged as damaged (anywhere), and healthy windows flagged as damaged
+            'detection_rate': matrices[:, 1:, 1:].sum(axis=(1, 2)) / actual[:, 1:].sum(axis=1),
+            'false_alarm_rate': matrices[:, 0, 1:].sum(axis=1) / actual[:, 0],
+            'localisation_error': (located * distances).sum(axis=(1, 2)) / located.sum(axis=(1, 2)),
+            'windows': total
+        }
+
+
+class EvaluationStore:
+    """Damage localisation results per detector configuration, with cached metrics.
+
+    Results are windows labelled with their true and predicted damage location (0
+    for none). Only confusion-matrix counts are kept, so any number of scenarios
+    can be added; add_bulk() counts mixed configurations with a single bincount.
+    Metrics are computed from the counts for every stale configuration at once and
+    cached until that configuration gets new results. centroids, a (locations, 3)
+    array, makes the localisation error a distance; without it, it is the
+    difference in location number.
+    """
+
+    def __init__(self, num_locations, centroids=None):
+        self.num_classes = num_locations + 1
+        if centroids is not None:
+            centroids = np.asarray(centroids, dtype=np.float64)
+            self.distances = np.linalg.norm(centroids[:, None, :] - centroids[None], axis=2)
+        else:
+            locations = np.arange(1, self.num_classes)
+            self.distances = np.abs(locations[:, None] - locations[None]).astype(np.float64)
+        self.matrices = {}  # configuration -> (classes, classes) counts
+        self.cache = {}
+
+    def configurations(self):
+        return sorted(self.matrices, key=str)
+
+    def add(self, configuration, truth, predicted):
+        """Add windows of one configuration"""
+        self.add_bulk(np.zeros(len(truth), dtype=np.int64), truth, predicted, [configuration])
+
+    def add_bulk(self, configurations, truth, predicted, names=None):
+        """Add windows of many configurations: configurations are names, or indices into names"""
+        truth = np.clip(np.asarray(truth, dtype=np.int64), 0, self.num_classes - 1)
+        predicted = np.clip(np.asarray(predicted, dtype=np.int64), 0, self.num_classes - 1)
+        if names is None:
+            names, configurations = np.unique(np.asarray(configurations), return_inverse=True)
+        matrices = confusion_matrices(configurations, truth, predicted, len(names), self.num_classes)
+        for name, matrix in zip(names, matrices):
+            name = name.item() if isinstance(name, np.generic) else name
+            if not matrix.any():
+                continue
+            self.matrices[name] = self.matrices.get(name, 0) + matrix
+            self.cache.pop(name, None)
+
+    def metrics(self, configuration):
+        """Metrics dict for one configuration (see matrix_metrics), with its 'matrix'"""
+        stale = [name for name in self.matrices if name not in self.cache]
+        if stale:
+            computed = matrix_metrics(np.array([self.matrices[name] for name in stale]), self.distances)
+            for index, name in enumerate(stale):
+                self.cache[name] = {key: values[index] for key, values in computed.items()}
+                self.cache[name]['matrix'] = self.matrices[name]
+        return self.cache.get(configuration)
+
+    @classmethod
+    def from_csv(cls, path, num_locations, centroids=None):
+        """Scenario results with columns configuration, true_location, predicted_location (empty or 0 for none)"""
+        store = cls(num_locations, centroids)
+        configurations, truth, predicted = [], [], []
+        with open(path, newline='', encoding='utf-8-sig') as f:
+            for row in csv.DictReader(f):
+                configurations.append(row['configuration'])
+                truth.append(int(float(row['true_location'] or 0)))
+                predicted.append(int(float(row['predicted_location'] or 0)))
+        if configurations:
+            store.add_bulk(configurations, truth, predicted)
+        return store
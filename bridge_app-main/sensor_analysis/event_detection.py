@@ -0,0 +1,173 @@
+from bisect import bisect_left, bisect_right
+
+import numpy as np
+
+
+class Event:
+    """A detected event: start/end times, peak absolute amplitude and the channels that triggered"""
+
+    IMPACT_MAX_DURATION = 1.0  # Seconds; shorter events are classed as impacts, longer as vehicles
+
+    def __init__(self, start, end, peak, peak_time, channels):
+        self.start = float(start)
+        self.end = float(end)
+        self.peak = float(peak)
+        self.peak_time = float(peak_time)
+        self.channels = channels
+
+    @property
+    def duration(self):
+        return self.end - self.start
+
+    @property
+    def kind(self):
+        return 'Impact' if self.duration < self.IMPACT_MAX_DURATION else 'Heavy vehicle'
+
+
+class EventTable:
+    """Events kept in time order with bisect lookups by time range.
+
+    Detected events never overlap and arrive in order, so appending keeps both the
+    start and end lists sorted and a range query is two binary searches.
+    """
+
+    def __init__(self):
+        self.events = []
+        self.starts = []
+        self.ends = []
+
+    def __len__(self):
+        return len(self.events)
+
+    def add(self, event):
+        if self.starts and event.start < self.starts[-1]:
+            index = bisect_right(self.starts, event.start)
+        else:
+            index = len(self.events)
+        self.events.insert(index, event)
+        self.starts.insert(index, event.start)
+        self.ends.insert(index, event.end)
+
+    def query(self, t0, t1):
+        """Events overlapping [t0, t1], oldest first"""
+        first = bisect_left(self.ends, t0)
+        last = bisect_right(self.starts, t1)
+        return self.events[first:last]
+
+    def count(self, t0, t1):
+        return max(bisect_right(self.starts, t1) - bisect_left(self.ends, t0), 0)
+
+    def rate(self, bin_seconds, t0=None, t1=None):
+        """Return (bin_starts, counts) of event starts per bin over [t0, t1]"""
+        if not self.events:
+            return np.empty(0), np.empty(0, dtype=np.int64)
+        t0 = self.starts[0] if t0 is None else t0
+        t1 = self.starts[-1] if t1 is None else t1
+        edges = np.arange(t0, t1 + bin_seconds, bin_seconds)
+        counts = np.diff(np.searchsorted(self.starts, edges))
+        return edges[:-1], counts
+
+
+class StaLtaDetector:
+    """Streaming STA/LTA trigger over all channels at once, with an amplitude threshold.
+
+    Blocks are (channels, samples) in names order, with their time values. The
+    short- and long-term averages of the squared signal come from one cumulative sum
+    per block over the new samples plus the last nlta squared samples carried from
+    the previous block, so the ratio is continuous across blocks. Each channel switches on when the ratio
+    exceeds on_ratio (or |x| exceeds amplitude_threshold) and off when it falls below
+    off_ratio; the hysteresis is resolved for all samples with a forward fill of the
+    last transition. An event lasts while at least min_channels are on, and is
+    emitted once it ends. A prefilter FilterBank (e.g. a high-pass against drift)
+    is applied to every block first, its state carried like the averages'.
+    """
+
+    def __init__(self, names, fs, sta_seconds=0.5, lta_seconds=10.0, on_ratio=3.0, off_ratio=1.5,
+                 amplitude_threshold=None, min_channels=1, prefilter=None):
+        self.names = list(names)
+        self.num_channels = num_channels = len(self.names)
+        self.nsta = max(int(round(sta_seconds * fs)), 1)
+        self.nlta = max(int(round(lta_seconds * fs)), self.nsta + 1)
+        self.on_ratio = on_ratio
+        self.off_ratio = off_ratio
+        self.amplitude_threshold = amplitude_threshold
+        self.min_channels = min_channels
+        self.prefilter = prefilter
+
+        self.carry = np.zeros((num_channels, 0))  # Last nlta squared samples
+        self.seen = 0
+        self.active = np.zeros(num_channels, dtype=bool)
+        self.open_event = None  # [start, peak, peak_time, channel mask] while an event is in progress
+        self.last_time = None
+
+    def ratio(self, squared):
+        """STA/LTA for every new sample of a (channels, carry + new) array of squared values"""
+        carried = self.carry.shape[1]
+        cumulative = np.concatenate([np.zeros((self.num_channels, 1)), np.cumsum(squared, axis=1)], axis=1)
+        end = np.arange(carried, squared.shape[1]) + 1
+        sta = (cumulative[:, end] - cumulative[:, np.maximum(end - self.nsta, 0)]) / self.nsta
+        lta = (cumulative[:, end] - cumulative[:, np.maximum(end - self.nlta, 0)]) / self.nlta
+        with np.errstate(invalid='ignore', divide='ignore'):
+            ratio = np.where(lta > 0, sta / lta, 0.0)
+        # No trigger until the long-term window has filled once
+        warm = self.seen + np.arange(squared.shape[1] - carried) + 1 >= self.nlta
+        return np.where(warm, ratio, 0.0)
+
+    def process(self, time_values, block):
+        """Feed a block; returns the events that ended within it"""
+        block = np.nan_to_num(np.atleast_2d(np.asarray(block, dtype=np.float64)))
+        if self.prefilter is not None:
+            block = self.prefilter.process(block)
+        count = block.shape[1]
+        if count == 0:
+            return []
+        squared = np.concatenate([self.carry, block ** 2], axis=1)
+        ratio = self.ratio(squared)
+        self.carry = squared[:, -self.nlta:]
+        self.seen += count
+
+        # Transitions: +1 switches a channel on, -1 off; the state is the last transition so far
+        transition = np.zeros(block.shape, dtype=np.int8)
+        on = ratio > self.on_ratio
+        if self.amplitude_threshold is not None:
+            on |= np.abs(block) > self.amplitude_threshold
+        transition[ratio < self.off_ratio] = -1
+        transition[on] = 1
+        positions = np.where(transition != 0, np.arange(count), -1)
+        last = np.maximum.accumulate(positions, axis=1)
+        state = np.where(last >= 0, np.take_along_axis(transition, np.maximum(last, 0), axis=1) > 0,
+                         self.active[:, None])
+        self.active = state[:, -1].copy()
+
+        network = state.sum(axis=0) >= self.min_channels
+        events = self._segments(time_values, block, state, network)
+        self.last_time = time_values[-1]
+        return events
+
+    def _segments(self, time_values, block, state, network):
+        """Turn runs of the network trigger into Event records, continuing the open one"""
+        edges = np.flatnonzero(np.diff(network.astype(np.int8))) + 1
+        bounds = np.concatenate([[0], edges, [len(network)]])
+        events = []
+        magnitude = np.abs(block)
+        for start, stop in zip(bounds[:-1], bounds[1:]):
+            if not network[start]:
+                if self.open_event is not None:
+                    events.append(self._close(time_values[start - 1] if start else self.last_time))
+                continue
+            channel = magnitude[:, start:stop].max(axis=1)
+            loudest = int(np.argmax(channel))
+            peak_index = start + int(np.argmax(magnitude[loudest, start:stop]))
+            mask = state[:, start:stop].any(axis=1)
+            if self.open_event is None:
+                self.open_event = [time_values[start], channel[loudest], time_values[peak_index], mask]
+            else:
+                if channel[loudest] > self.open_event[1]:
+                    self.open_event[1:3] = [channel[loudest], time_values[peak_index]]
+                self.open_event[3] = self.open_event[3] | mask
+        return events
+
+    def _close(self, end):
+        start, peak, peak_time, mask = self.open_event
+        self.open_event = None
+        return Event(start, end, peak, peak_time, [self.names[i] for i in np.flatnonzero(mask)])
@@ -0,0 +1,141 @@
+import numpy as np
+
+try:
+    from scipy.signal import sosfilt  # Compiled filtering when available; the numpy path gives the same result
+except ImportError:
+    sosfilt = None
+
+
+def butterworth_sections(order, cutoff, fs, kind='lowpass'):
+    """Butterworth low/high-pass as second-order sections [b0, b1, b2, 1, a1, a2] (bilinear, prewarped)"""
+    k = np.tan(np.pi * cutoff / fs)
+    sections = []
+    for pole in range(order // 2):
+        q = 1.0 / (2.0 * np.sin((2 * pole + 1) * np.pi / (2 * order)))
+        norm = 1.0 / (1.0 + k / q + k * k)
+        a = [1.0, 2.0 * (k * k - 1.0) * norm, (1.0 - k / q + k * k) * norm]
+        if kind == 'lowpass':
+            b = [k * k * norm, 2.0 * k * k * norm, k * k * norm]
+        else:
+            b = [norm, -2.0 * norm, norm]
+        sections.append(b + a)
+    if order % 2:
+        norm = 1.0 / (1.0 + k)
+        b = [k * norm, k * norm, 0.0] if kind == 'lowpass' else [norm, -norm, 0.0]
+        sections.append(b + [1.0, (k - 1.0) * norm, 0.0])
+    return np.array(sections).reshape(-1, 6)
+
+
+def notch_section(frequency, fs, quality=30.0):
+    """Second-order notch at frequency with bandwidth frequency / quality (as scipy's iirnotch)"""
+    w0 = 2.0 * np.pi * frequency / fs
+    beta = np.tan(w0 / quality / 2.0)
+    gain = 1.0 / (1.0 + beta)
+    return np.array([[gain, -2.0 * gain * np.cos(w0), gain, 1.0, -2.0 * gain * np.cos(w0), 2.0 * gain - 1.0]])
+
+
+class BlockSection:
+    """Exact block form of one transposed direct-form II biquad.
+
+    With state s and y[n] = s1 + b0 x[n], the section is s' = A s + B x, so over a
+    block of L samples y = T x + O s0 (T the lower-triangular Toeplitz matrix of the
+    impulse response, O the state observation rows) and the state after the block
+    is A^L s0 + G x. The block products run as matrix multiplies over every channel
+    and block at once, leaving only the 2-element state hand-over between blocks
+    sequential.
+    """
+
+    def __init__(self, section, length=128):
+        b0, b1, b2, _, a1, a2 = section
+        self.b0 = b0
+        self.length = length
+        a = np.array([[-a1, 1.0], [-a2, 0.0]])
+        b = np.array([b1 - a1 * b0, b2 - a2 * b0])
+        self.powers = [np.eye(2)]
+        for _ in range(length):
+            self.powers.append(a @ self.powers[-1])
+        powers = np.array(self.powers)  # (length + 1, 2, 2)
+        impulse = np.concatenate([[b0], (powers[:length - 1] @ b)[:, 0]])
+        index = np.arange(length)
+        lag = index[:, None] - index[None, :]
+        self.toeplitz = np.where(lag >= 0, impulse[np.clip(lag, 0, length - 1)], 0.0)  # (out, in)
+        self.observe = powers[:length, 0, :]  # Row k: first row of A^k, (length, 2)
+        self.drive = (powers[length - 1 - index] @ b).T  # (2, length): A^(L-1-j) B
+
+    def process(self, block, state):
+        """Filter (channels, samples) with (channels, 2) state; returns (output, new state)"""
+        channels, count = block.shape
+        length = self.length
+        full = count // length
+        output = np.empty_like(block)
+        if full:
+            blocks = block[:, :full * length].reshape(channels, full, length)
+            forced = blocks @ self.toeplitz.T
+            driven = blocks @ self.drive.T  # (channels, blocks, 2)
+            step = self.powers[length]
+            starts = np.empty((channels, full, 2))
+            for index in range(full):
+                starts[:, index] = state
+                state = state @ step.T + driven[:, index]
+            output[:, :full * length] = (forced + starts @ self.observe.T).reshape(channels, -1)
+        rest = count - full * length
+        if rest:
+            tail = block[:, full * length:]
+            output[:, full * length:] = tail @ self.toeplitz[:rest, :rest].T + state @ self.observe[:rest].T
+            state = state @ self.powers[rest].T + tail @ self.drive[:, length - rest:].T
+        return output, state
+
+
+class FilterBank:
+    """Cascade of second-order sections applied to (channels, samples) blocks.
+
+    Every channel has its own state (sections, channels, 2) in scipy's sosfilt zi
+    layout, carried from one process() call to the next, so filtering a record in
+    blocks of any size gives the same output as filtering it whole. Filtering runs
+    across all channels at once: through sosfilt when scipy is installed, otherwise
+    through the exact block form in BlockSection.
+    """
+
+    def __init__(self, sos, num_channels):
+        self.sos = np.atleast_2d(np.asarray(sos, dtype=np.float64)).reshape(-1, 6)
+        self.num_channels = num_channels
+        self.blocks = None
+        self.reset()
+
+    @classmethod
+    def design(cls, fs, num_channels, highpass=None, lowpass=None, notch=(), anti_alias=None, order=4, quality=30.0):
+        """Filter bank from cutoffs in Hz.
+
+        highpass and lowpass together make a band-pass; notch is a list of
+        frequencies to remove; anti_alias is a target rate to decimate to, adding a
+        low-pass at 0.4 of it. Cutoffs at or above Nyquist are left out.
+        """
+        nyquist = fs / 2.0
+        if anti_alias is not None:
+            lowpass = min(lowpass or np.inf, 0.4 * anti_alias)
+        sections = []
+        if highpass is not None and 0.0 < highpass < nyquist:
+            sections.append(butterworth_sections(order, highpass, fs, 'highpass'))
+        if lowpass is not None and 0.0 < lowpass < nyquist:
+            sections.append(butterworth_sections(order, lowpass, fs, 'lowpass'))
+        for frequency in notch or ():
+            if 0.0 < frequency < nyquist:
+                sections.append(notch_section(frequency, fs, quality))
+        return cls(np.concatenate(sections) if sections else np.zeros((0, 6)), num_channels)
+
+    def reset(self):
+        self.state = np.zeros((len(self.sos), self.num_channels, 2))
+
+    def process(self, block):
+        """Filter a (channels, samples) block, continuing from the previous one; NaNs are treated as zeros"""
+        output = np.nan_to_num(np.atleast_2d(np.asarray(block, dtype=np.float64)))
+        if len(self.sos) == 0 or output.shape[1] == 0:
+            return output
+        if sosfilt is not None:
+            output, self.state = sosfilt(self.sos, output, axis=1, zi=self.state)
+            return output
+        if self.blocks is None:
+            self.blocks = [BlockSection(section) for section in self.sos]
+        for index, section in enumerate(self.blocks):
+            output, self.state[index] = section.process(output, self.state[index])
+        return output
@@ -0,0 +1,250 @@
+import numpy as np
+
+from .spectral import hann
+
+
+class Mode:
+    """An identified mode: natural frequency (Hz), real mode shape over the channels and, for SSI, damping"""
+
+    def __init__(self, frequency, shape, damping=None, magnitude=None, method='FDD'):
+        self.frequency = frequency
+        self.shape = shape
+        self.damping = damping
+        self.magnitude = magnitude  # First singular value at the peak (FDD)
+        self.method = method
+
+    def label(self):
+        text = f"{self.method} {self.frequency:.3f} Hz"
+        if self.damping is not None:
+            text += f", {self.damping * 100:.2f}% damping"
+        return text
+
+
+def real_shape(shape):
+    """Rotate a complex mode shape to its dominant phase and scale the real part to a maximum of 1"""
+    shape = np.asarray(shape)
+    phase = np.angle(shape[np.argmax(np.abs(shape))])
+    real = np.real(shape * np.exp(-1j * phase))
+    peak = np.max(np.abs(real))
+    return real / peak if peak > 0 else real
+
+
+def pick_peaks(values, count, min_separation=1):
+    """Indices of the `count` highest local maxima, at least min_separation bins apart"""
+    values = np.asarray(values)
+    if len(values) < 3:
+        return []
+    candidates = np.flatnonzero((values[1:-1] > values[:-2]) & (values[1:-1] >= values[2:])) + 1
+    picked = []
+    for index in candidates[np.argsort(values[candidates])[::-1]]:
+        if all(abs(index - other) >= min_separation for other in picked):
+            picked.append(int(index))
+            if len(picked) == count:
+                break
+    return sorted(picked)
+
+
+class IncrementalCSD:
+    """Welch cross-spectral density matrix accumulated block by block.
+
+    Blocks are (channels, samples). Samples that do not yet fill a segment are kept
+    for the next block, so feeding a recording in any number of blocks gives the same
+    result as one Welch estimate over all of it; each block only transforms its new
+    segments and adds their cross products to a running sum.
+    """
+
+    def __init__(self, num_channels, fs, nperseg=1024, noverlap=None):
+        self.num_channels = num_channels
+        self.fs = float(fs)
+        self.nperseg = nperseg
+        self.hop = nperseg - (nperseg // 2 if noverlap is None else noverlap)
+        self.window = hann(nperseg)
+        self.scale = 1.0 / (self.fs * np.sum(self.window ** 2))
+        self.freqs = np.fft.rfftfreq(nperseg, 1.0 / self.fs)
+        self.reset()
+
+    def reset(self):
+        self.carry = np.zeros((self.num_channels, 0))
+        self.cross_sum = np.zeros((len(self.freqs), self.num_channels, self.num_channels), dtype=np.complex128)
+        self.segment_count = 0
+
+    def add_block(self, block):
+        """Add (channels, samples) of new data; returns the number of segments it completed"""
+        data = np.concatenate([self.carry, np.nan_to_num(np.asarray(block, dtype=np.float64))], axis=1)
+        count = (data.shape[1] - self.nperseg) // self.hop + 1 if data.shape[1] >= self.nperseg else 0
+        if count:
+            starts = np.arange(count) * self.hop
+            frames = data[:, starts[:, None] + np.arange(self.nperseg)]
+            frames = frames - frames.mean(axis=2, keepdims=True)
+            spectra = np.fft.rfft(frames * self.window, axis=2)
+            self.cross_sum += np.einsum('isf,jsf->fij', spectra.conj(), spectra)
+            self.segment_count += count
+        self.carry = data[:, count * self.hop:]
+        return count
+
+    def matrix(self):
+        """Return (freqs, csd) with csd shaped (freqs, channels, channels), one-sided like scipy.signal.csd"""
+        csd = self.cross_sum * (self.scale / max(self.segment_count, 1))
+        last = None if self.nperseg % 2 else -1
+        csd[1:last] *= 2.0
+        return self.freqs, csd
+
+
+class IncrementalCovariance:
+    """Output correlations R_k = E[y(t+k) y(t)^T] for lags 0..max_lag, accumulated block by block.
+
+    The last max_lag samples are carried over, so lag products that straddle a block
+    boundary are counted exactly once.
+    """
+
+    def __init__(self, num_channels, max_lag):
+        self.num_channels = num_channels
+        self.max_lag = max_lag
+        self.carry = np.zeros((num_channels, 0))
+        self.products = np.zeros((max_lag + 1, num_channels, num_channels))
+        self.counts = np.zeros(max_lag + 1)
+        self.total = np.zeros(num_channels)
+        self.samples = 0
+
+    def add_block(self, block):
+        block = np.nan_to_num(np.asarray(block, dtype=np.float64))
+        data = np.concatenate([self.carry, block], axis=1)
+        first_new = self.carry.shape[1]
+        length = data.shape[1]
+        for lag in range(self.max_lag + 1):
+            # Pairs (s - lag, s) whose later sample s arrived in this block
+            start = max(first_new, lag)
+            if start >= length:
+                continue
+            self.products[lag] += data[:, start:] @ data[:, start - lag:length - lag].T
+            self.counts[lag] += length - start
+        self.total += block.sum(axis=1)
+        self.samples += block.shape[1]
+        self.carry = data[:, -self.max_lag:] if self.max_lag else data[:, :0]
+
+    def correlations(self):
+        """(max_lag + 1, channels, channels) mean-removed correlations"""
+        mean = self.total / max(self.samples, 1)
+        return self.products / np.maximum(self.counts, 1)[:, None, None] - np.outer(mean, mean)
+
+
+def ssi_cov(correlations, fs, order, max_damping=0.2):
+    """Covariance-driven stochastic subspace identification.
+
+    correlations are R_0..R_2i from IncrementalCovariance (i block rows); order is
+    the model order kept from the SVD of the block Toeplitz matrix. Returns the
+    physical modes (positive frequency below Nyquist, damping in (0, max_damping)).
+    """
+    rows = (len(correlations) - 1) // 2
+    channels = correlations.shape[1]
+    if rows < 1:
+        return []
+    toeplitz = np.block([[correlations[rows + a - b] for b in range(rows)] for a in range(rows)])
+    u, s, _ = np.linalg.svd(toeplitz)
+    order = min(order, len(s))
+    observability = u[:, :order] * np.sqrt(s[:order])
+
+    # Shift invariance of the observability matrix gives the state matrix
+    state = np.linalg.pinv(observability[:-channels]) @ observability[channels:]
+    output = observability[:channels]
+    eigenvalues, eigenvectors = np.linalg.eig(state)
+    poles = np.log(eigenvalues.astype(np.complex128)) * fs
+
+    modes = []
+    for pole, vector in zip(poles, eigenvectors.T):
+        frequency = abs(pole) / (2.0 * np.pi)
+        damping = -pole.real / abs(pole) if abs(pole) > 0 else 1.0
+        if pole.imag <= 0 or not 0.0 < frequency < fs / 2.0 or not 0.0 < damping < max_damping:
+            continue
+        modes.append(Mode(frequency, real_shape(output @ vector), damping=damping, method='SSI'))
+    return sorted(modes, key=lambda mode: mode.frequency)
+
+
+class ModalAnalysis:
+    """Operational modal analysis over a sensor array, updated as data blocks arrive.
+
+    Frequency-domain decomposition takes the first singular vector of the
+    accumulated cross-spectral matrix at its peaks. With ssi_lags set, output
+    correlations are accumulated alongside for covariance-driven SSI, which also
+    estimates damping. Both estimators are cached until the next block.
+    """
+
+    def __init__(self, names, fs, nperseg=1024, ssi_lags=None):
+        self.names = list(names)
+        self.fs = float(fs)
+        self.spectra = IncrementalCSD(len(self.names), fs, nperseg)
+        self.covariance = IncrementalCovariance(len(self.names), 2 * ssi_lags) if ssi_lags else None
+        self.version = 0
+        self.cache = {}
+
+    def add_block(self, block):
+        """Add (channels, samples) of new data in self.names order"""
+        block = np.atleast_2d(block)
+        if block.shape[1] == 0:
+            return
+        self.spectra.add_block(block)
+        if self.covariance is not None:
+            self.covariance.add_block(block)
+        self.version += 1
+        self.cache = {}
+
+    def singular_values(self):
+        """Return (freqs, s1, u1): the first singular value and vector of the CSD matrix per frequency"""
+        if 'svd' not in self.cache:
+            freqs, csd = self.spectra.matrix()
+            # The CSD matrix is Hermitian, so its eigendecomposition is its SVD
+            values, vectors = np.linalg.eigh(csd)
+            self.cache['svd'] = (freqs, values[:, -1], vectors[:, :, -1])
+        return self.cache['svd']
+
+    def fdd(self, num_modes=4, fmin=0.0, fmax=None, min_separation_hz=0.2):
+        """Peak-pick the first singular value; returns Mode objects sorted by frequency"""
+        key = ('fdd', num_modes, fmin, fmax, min_separation_hz)
+        if key not in self.cache:
+            freqs, s1, u1 = self.singular_values()
+            modes = []
+            if self.spectra.segment_count:
+                band = (freqs >= fmin) & (freqs <= (fmax if fmax is not None else freqs[-1]))
+                band[0] = False  # The DC bin carries no mode
+                offset = np.argmax(band)
+                separation = max(int(min_separation_hz / (freqs[1] - freqs[0])), 1)
+                for index in pick_peaks(np.where(band, s1, 0.0)[offset:], num_modes, separation):
+                    index += offset
+                    modes.append(Mode(freqs[index], real_shape(u1[index]), magnitude=s1[index]))
+            self.cache[key] = modes
+        return self.cache[key]
+
+    def ssi(self, order=20):
+        if self.covariance is None or self.covariance.samples == 0:
+            return []
+        key = ('ssi', order)
+        if key not in self.cache:
+            self.cache[key] = ssi_cov(self.covariance.correlations(), self.fs, order)
+        return self.cache[key]
+
+
+class ModeShapeMapper:
+    """Spread sensor mode shapes over the mesh by inverse-distance weighting.
+
+    The (nodes, sensors) weight matrix is built once from the registry positions of
+    the analysed channels, so mapping a shape is a single matrix product.
+    """
+
+    def __init__(self, registry, names, node_ids, node_positions, power=2.0):
+        self.node_ids = [int(node_id) for node_id in node_ids]
+        sensors = [registry.get(name) for name in names]
+        self.available = np.array([sensor is not None for sensor in sensors])
+        positions = np.array([[s['x'], s['y'], s['z']] for s in sensors if s is not None]).reshape(-1, 3)
+        distances = np.linalg.norm(np.asarray(node_positions, dtype=np.float64)[:, None, :] - positions[None], axis=2)
+        weights = 1.0 / np.maximum(distances, 1e-9) ** power
+        self.weights = weights / weights.sum(axis=1, keepdims=True)
+
+    def node_shape(self, shape):
+        """Per-node amplitude for a shape over the analysed channels"""
+        return self.weights @ np.asarray(shape)[self.available]
+
+    def node_weights(self, shape, num_keyframes=24, amplitude=1.0):
+        """One oscillation of the shape as {node_id: [weight per keyframe]}, the GLWidget keyframe format"""
+        phase = np.sin(2.0 * np.pi * np.arange(num_keyframes) / num_keyframes)
+        keyframes = amplitude * np.outer(self.node_shape(shape), phase)
+        return dict(zip(self.node_ids, keyframes.tolist()))
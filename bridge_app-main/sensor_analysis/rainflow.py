@@ -0,0 +1,218 @@
+import os
+
+import numpy as np
+
+
+def turning_points(values):
+    """Reversals of a series (NaNs and repeated values dropped), keeping the first and last points"""
+    values = np.asarray(values, dtype=np.float64)
+    values = values[np.isfinite(values)]
+    if len(values) > 1:
+        values = values[np.concatenate([[True], np.diff(values) != 0])]
+    if len(values) < 3:
+        return values
+    slope = np.sign(np.diff(values))
+    keep = np.concatenate([[True], slope[1:] != slope[:-1], [True]])
+    return values[keep]
+
+
+MIN_PASS_YIELD = 32  # Points per removed window below which extract_cycles switches to the stack
+
+
+def stack_cycles(points):
+    """Sequential four-point rainflow over alternating turning points; returns (ranges, means, residual)"""
+    stack = []
+    ranges = []
+    means = []
+    for point in np.asarray(points, dtype=np.float64).tolist():
+        stack.append(point)
+        while len(stack) >= 4:
+            x0, x1, x2, x3 = stack[-4:]
+            swing = abs(x2 - x1)
+            if swing > abs(x1 - x0) or swing > abs(x3 - x2):
+                break
+            ranges.append(swing)
+            means.append((x1 + x2) / 2.0)
+            del stack[-3:-1]
+    return np.array(ranges), np.array(means), np.array(stack)
+
+
+def extract_cycles(points):
+    """Four-point rainflow over alternating turning points.
+
+    Returns (ranges, means, residual). Every inner pair (x1, x2) of a window
+    x0..x3 whose range is within both neighbouring ranges closes a full cycle.
+    All such windows are found at once, non-overlapping ones removed together (the
+    removal of one never invalidates another), and the pass repeated until none is
+    left; the extracted cycles are the same as with the sequential stack method.
+    Deeply nested input (a decaying response closed by a large excursion) frees
+    only a few windows per pass, so once a pass removes fewer than one window per
+    MIN_PASS_YIELD points the rest is counted with stack_cycles().
+    """
+    points = np.asarray(points, dtype=np.float64)
+    ranges = []
+    means = []
+    while len(points) >= 4:
+        swings = np.abs(np.diff(points))
+        inner = (swings[1:-1] <= swings[:-2]) & (swings[1:-1] <= swings[2:])
+        if not inner.any():
+            break
+        # Within each run of qualifying windows take every other one, so removals do not overlap
+        index = np.arange(len(inner))
+        run_start = np.maximum.accumulate(np.where(inner & ~np.concatenate([[False], inner[:-1]]), index, 0))
+        selected = np.flatnonzero(inner & ((index - run_start) % 2 == 0))
+        if len(selected) * MIN_PASS_YIELD < len(points):
+            stack_ranges, stack_means, points = stack_cycles(points)
+            ranges.append(stack_ranges)
+            means.append(stack_means)
+            break
+        first = points[selected + 1]
+        second = points[selected + 2]
+        ranges.append(np.abs(first - second))
+        means.append((first + second) / 2.0)
+        keep = np.ones(len(points), dtype=bool)
+        keep[selected + 1] = False
+        keep[selected + 2] = False
+        points = points[keep]
+    if ranges:
+        return np.concatenate(ranges), np.concatenate(means), points
+    return np.empty(0), np.empty(0), points
+
+
+def half_cycles(residual):
+    """(ranges, means) of the half cycles left in a residual"""
+    residual = np.asarray(residual)
+    return np.abs(np.diff(residual)), (residual[1:] + residual[:-1]) / 2.0
+
+
+class SNCurve:
+    """Basquin S-N curve N = C / S^m over stress ranges (MPa).
+
+    The default is steel detail category 71 (71 MPa at 2 million cycles, m = 3)
+    with strain converted to stress through E; strain is in microstrain.
+    """
+
+    def __init__(self, reference_range=71.0, reference_cycles=2.0e6, slope=3.0, modulus=210000.0, strain_scale=1e-6):
+        self.slope = slope
+        self.constant = reference_cycles * reference_range ** slope
+        self.modulus = modulus
+        self.strain_scale = strain_scale
+
+    def stress(self, strain_ranges):
+        return np.asarray(strain_ranges) * self.strain_scale * self.modulus
+
+    def damage(self, strain_ranges, counts=1.0):
+        """Miner's-rule damage of cycles with the given strain ranges"""
+        return np.sum(counts * self.stress(strain_ranges) ** self.slope) / self.constant
+
+
+class FatigueAccumulator:
+    """Streaming rainflow counting and Miner damage for several strain gauges.
+
+    update() takes (channels, samples) blocks. Each channel's residual (the
+    reversals that have not closed a cycle yet) is carried to the next block, so
+    counting a record in chunks gives the same cycles as counting it whole. Closed
+    cycles go into a fixed range x mean histogram and a running damage sum per
+    channel; the residual's half cycles are only added when results are read, so
+    they never get counted twice. save() writes everything, including the position
+    in the record, so processing resumes after a restart.
+    """
+
+    def __init__(self, names, range_edges, mean_edges, curve=None):
+        self.names = list(names)
+        self.range_edges = np.asarray(range_edges, dtype=np.float64)
+        self.mean_edges = np.asarray(mean_edges, dtype=np.float64)
+        self.curve = curve or SNCurve()
+        channels = len(self.names)
+        self.histograms = np.zeros((channels, len(self.range_edges) - 1, len(self.mean_edges) - 1))
+        self.cycle_damage = np.zeros(channels)
+        self.cycle_count = np.zeros(channels)
+        self.residuals = [np.empty(0) for _ in range(channels)]
+        self.samples = 0
+
+    @classmethod
+    def for_range(cls, names, max_range, mean_limits, bins=64):
+        """Accumulator with evenly spaced bins up to max_range and over mean_limits"""
+        return cls(names, np.linspace(0.0, max_range, bins + 1), np.linspace(mean_limits[0], mean_limits[1], bins + 1))
+
+    def update(self, block, pool=None):
+        """Count a (channels, samples) block; with a thread pool the channels are counted in parallel"""
+        block = np.atleast_2d(np.asarray(block, dtype=np.float64))
+
+        def count(channel):
+            points = turning_points(np.concatenate([self.residuals[channel], block[channel]]))
+            return extract_cycles(points)
+
+        channels = range(block.shape[0])
+        results = pool.map(count, channels) if pool is not None else map(count, channels)
+        for channel, (ranges, means, residual) in zip(channels, results):
+            self.residuals[channel] = residual
+            if len(ranges):
+                self.add_cycles(channel, ranges, means, 1.0)
+        self.samples += block.shape[1]
+
+    def add_cycles(self, channel, ranges, means, count):
+        histogram, _, _ = np.histogram2d(
+            np.clip(ranges, self.range_edges[0], self.range_edges[-1]),
+            np.clip(means, self.mean_edges[0], self.mean_edges[-1]),
+            bins=(self.range_edges, self.mean_edges)
+        )
+        self.histograms[channel] += count * histogram
+        self.cycle_damage[channel] += self.curve.damage(ranges, count)
+        self.cycle_count[channel] += count * len(ranges)
+
+    def damage(self):
+        """Miner damage per channel so far, counting the open residual as half cycles"""
+        residual = np.array([self.curve.damage(half_cycles(r)[0], 0.5) if len(r) > 1 else 0.0
+                             for r in self.residuals])
+        return self.cycle_damage + residual
+
+    def histogram(self, channel):
+        """(range x mean) cycle counts for a channel, including the residual's half cycles"""
+        histogram = self.histograms[channel].copy()
+        residual = self.residuals[channel]
+        if len(residual) > 1:
+            ranges, means = half_cycles(residual)
+            half, _, _ = np.histogram2d(
+                np.clip(ranges, self.range_edges[0], self.range_edges[-1]),
+                np.clip(means, self.mean_edges[0], self.mean_edges[-1]),
+                bins=(self.range_edges, self.mean_edges)
+            )
+            histogram += 0.5 * half
+        return histogram
+
+    def save(self, path, **extra):
+        """Write the state atomically to an .npz file; extra values are stored alongside"""
+        lengths = np.array([len(r) for r in self.residuals], dtype=np.int64)
+        residuals = np.concatenate(self.residuals) if self.residuals else np.empty(0)
+        temp_path = f"{path}.tmp.npz"
+        np.savez(
+            temp_path, names=np.array(self.names), range_edges=self.range_edges, mean_edges=self.mean_edges,
+            histograms=self.histograms, cycle_damage=self.cycle_damage, cycle_count=self.cycle_count,
+            residuals=residuals, residual_lengths=lengths, samples=self.samples,
+            curve=np.array([self.curve.constant, self.curve.slope, self.curve.modulus, self.curve.strain_scale]),
+            **extra
+        )
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        """Return (accumulator, extra values) from save(), or (None, {}) if there is no usable file"""
+        if not os.path.exists(path):
+            return None, {}
+        try:
+            with np.load(path) as data:
+                data = dict(data)
+        except (OSError, ValueError) as e:
+            print(f"Error reading {path}: {e}")
+            return None, {}
+        accumulator = cls(data.pop('names').tolist(), data.pop('range_edges'), data.pop('mean_edges'))
+        constant, slope, modulus, strain_scale = data.pop('curve')
+        accumulator.curve.constant, accumulator.curve.slope = constant, slope
+        accumulator.curve.modulus, accumulator.curve.strain_scale = modulus, strain_scale
+        accumulator.histograms = data.pop('histograms')
+        accumulator.cycle_damage = data.pop('cycle_damage')
+        accumulator.cycle_count = data.pop('cycle_count')
+        accumulator.residuals = np.split(data.pop('residuals'), np.cumsum(data.pop('residual_lengths'))[:-1])
+        accumulator.samples = int(data.pop('samples'))
+        return accumulator, data
@@ -0,0 +1,232 @@
+from fractions import Fraction
+
+import numpy as np
+
+
+def rational_ratio(fs_in, fs_out, max_denominator=1000):
+    """(up, down) whose ratio is closest to fs_out / fs_in"""
+    ratio = Fraction(float(fs_out) / float(fs_in)).limit_denominator(max_denominator)
+    return ratio.numerator, ratio.denominator
+
+
+def lowpass_taps(up, down, half_width=10, beta=5.0):
+    """Kaiser-windowed sinc anti-aliasing filter for up/down resampling (resample_poly's default design)"""
+    max_rate = max(up, down)
+    half_len = half_width * max_rate
+    taps = np.sinc(np.arange(-half_len, half_len + 1) / max_rate) * np.kaiser(2 * half_len + 1, beta)
+    return taps * (up / taps.sum())
+
+
+def interpolate_times(positions, time_values, first=0):
+    """Timestamps at fractional sample positions, linear between samples and extrapolated past the ends"""
+    index = np.clip(np.floor(positions - first).astype(np.int64), 0, max(len(time_values) - 2, 0))
+    if len(time_values) < 2:
+        return np.full(len(positions), time_values[0] if len(time_values) else 0.0)
+    step = time_values[index + 1] - time_values[index]
+    return time_values[index] + (positions - first - index) * step
+
+
+class PolyphaseResampler:
+    """Streaming up/down polyphase resampling of (channels, samples) blocks.
+
+    Output m is sum_i x[i] * h[m*down - i*up + half_len]: the upsampled, filtered
+    and decimated signal, zero-phase, so it sits at input position m*down/up. Only
+    the non-zero taps are evaluated: for a batch of outputs the (outputs, taps)
+    matrix of input indices and filter weights is built at once and applied to all
+    channels with one einsum. process() returns every output whose inputs have all
+    arrived and keeps the inputs the next outputs still need; flush() ends the
+    stream with zeros after the last input. The concatenated outputs equal
+    resample_poly over the whole record.
+    """
+
+    def __init__(self, up, down, num_channels, taps=None):
+        self.up = int(up)
+        self.down = int(down)
+        self.num_channels = num_channels
+        self.taps = lowpass_taps(self.up, self.down) if taps is None else np.asarray(taps, dtype=np.float64)
+        self.half_len = (len(self.taps) - 1) // 2
+        self.width = -(-len(self.taps) // self.up) + 1  # Inputs contributing to one output, at most
+        self.buffer = np.zeros((num_channels, 0))
+        self.buffer_start = 0  # Input index of buffer[:, 0]
+        self.received = 0
+        self.emitted = 0
+
+    def ready(self):
+        """Number of outputs whose inputs have all arrived"""
+        return max(((self.received - 1) * self.up - self.half_len) // self.down + 1, 0)
+
+    def process(self, block):
+        block = np.atleast_2d(np.asarray(block, dtype=np.float64))
+        self.buffer = np.concatenate([self.buffer, block], axis=1)
+        self.received += block.shape[1]
+        return self._emit(self.ready())
+
+    def flush(self):
+        """Outputs still owed for the samples received, treating the samples after them as zeros"""
+        return self._emit(-(-self.received * self.up // self.down))
+
+    def _emit(self, last):
+        outputs = self._outputs(self.emitted, last) if last > self.emitted else np.zeros((self.num_channels, 0))
+        self.emitted = max(last, self.emitted)
+
+        # Drop the inputs no later output reaches
+        keep_from = max(-(-(self.emitted * self.down - self.half_len) // self.up), self.buffer_start)
+        keep_from = min(keep_from, self.received)
+        self.buffer = self.buffer[:, keep_from - self.buffer_start:]
+        self.buffer_start = keep_from
+        return outputs
+
+    def _outputs(self, first, last, batch=1 << 20):
+        results = []
+        step = max(batch // (self.width * max(self.num_channels, 1)), 1)
+        for start in range(first, last, step):
+            m = np.arange(start, min(start + step, last))[:, None]
+            first_input = -(-(m * self.down - self.half_len) // self.up)
+            inputs = first_input + np.arange(self.width)
+            tap = m * self.down - inputs * self.up + self.half_len
+            valid = (tap >= 0) & (tap < len(self.taps)) & (inputs >= 0) & (inputs < self.received)
+            weights = np.where(valid, self.taps[np.clip(tap, 0, len(self.taps) - 1)], 0.0)
+            if self.buffer.shape[1] == 0:
+                results.append(np.zeros((self.num_channels, len(m))))
+                continue
+            local = np.clip(inputs - self.buffer_start, 0, self.buffer.shape[1] - 1)
+            results.append(np.einsum('cmk,mk->cm', self.buffer[:, local], weights))
+        return np.concatenate(results, axis=1) if results else np.zeros((self.num_channels, 0))
+
+
+class ResampledStream:
+    """The channels of one acquisition system, resampled to the common rate.
+
+    Each output's timestamp is interpolated from the input timestamps at its input
+    position, so clock offsets and jitter of the source time column carry through
+    to the alignment step. Resampled samples wait in out_times/out_values until the
+    aligner takes them.
+    """
+
+    def __init__(self, names, fs_in, fs_out):
+        self.names = list(names)
+        self.fs_in = float(fs_in)
+        self.up, self.down = rational_ratio(fs_in, fs_out)
+        self.resampler = PolyphaseResampler(self.up, self.down, len(self.names))
+        self.times = np.empty(0)
+        self.times_start = 0  # Input index of times[0]
+        self.out_times = np.empty(0)
+        self.out_values = np.zeros((len(self.names), 0))
+
+    def add(self, time_values, block):
+        self.times = np.concatenate([self.times, np.asarray(time_values, dtype=np.float64)])
+        self._append(self.resampler.process(np.nan_to_num(np.asarray(block, dtype=np.float64))))
+
+    def finish(self):
+        self._append(self.resampler.flush())
+
+    def _append(self, values):
+        count = values.shape[1]
+        first = self.resampler.emitted - count
+        positions = (first + np.arange(count)) * (self.down / self.up)
+        times = interpolate_times(positions, self.times, self.times_start)
+        self.out_times = np.concatenate([self.out_times, times])
+        self.out_values = np.concatenate([self.out_values, values], axis=1)
+
+        # Keep the input timestamps around the next output position
+        keep_from = max(int(self.resampler.emitted * self.down // self.up) - 1, self.times_start)
+        keep_from = min(keep_from, self.times_start + max(len(self.times) - 2, 0))
+        self.times = self.times[keep_from - self.times_start:]
+        self.times_start = keep_from
+
+    def sample(self, grid):
+        """Linear interpolation of every channel onto grid times (all within out_times)"""
+        index = np.clip(np.searchsorted(self.out_times, grid, side='right') - 1, 0, max(len(self.out_times) - 2, 0))
+        if len(self.out_times) < 2:
+            return np.repeat(self.out_values[:, :1], len(grid), axis=1)
+        span = self.out_times[index + 1] - self.out_times[index]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            weight = np.where(span > 0, (grid - self.out_times[index]) / span, 0.0)
+        return self.out_values[:, index] * (1.0 - weight) + self.out_values[:, index + 1] * weight
+
+    def discard_before(self, t):
+        """Drop resampled samples no longer needed to interpolate at times >= t"""
+        keep_from = max(np.searchsorted(self.out_times, t, side='right') - 1, 0)
+        self.out_times = self.out_times[keep_from:]
+        self.out_values = self.out_values[:, keep_from:]
+
+
+class AlignedBlock:
+    """Channels from several acquisition systems on one uniform time base.
+
+    values is (channels, samples) in names order, as ModalAnalysis.add_block,
+    FatigueAccumulator.update and SpectralEngine take it; channels() gives the
+    {name: values} form of SensorFeed.
+    """
+
+    def __init__(self, time_values, names, values, fs):
+        self.time_values = time_values
+        self.names = list(names)
+        self.values = values
+        self.fs = fs
+
+    def __len__(self):
+        return len(self.time_values)
+
+    def channels(self):
+        return {name: self.values[i] for i, name in enumerate(self.names)}
+
+    def subset(self, names):
+        """The same block restricted to the given channels, in that order"""
+        rows = [self.names.index(name) for name in names]
+        return AlignedBlock(self.time_values, names, self.values[rows], self.fs)
+
+    @classmethod
+    def concatenate(cls, blocks, names, fs):
+        if not blocks:
+            return cls(np.empty(0), names, np.zeros((len(names), 0)), fs)
+        return cls(np.concatenate([block.time_values for block in blocks]), names,
+                   np.concatenate([block.values for block in blocks], axis=1), fs)
+
+
+class MultiRateAligner:
+    """Streaming alignment of several multi-rate acquisition systems onto one time base.
+
+    streams maps a stream key to (channel names, sampling rate). Blocks are added
+    per stream as (time_values, (channels, samples)) in any interleaving. Every
+    stream is polyphase-resampled to fs, and pop() interpolates the resampled
+    channels onto a uniform grid t0 + k/fs over the time range all streams have
+    reached, so the output is continuous across calls. t0 is the latest stream
+    start, so every aligned sample is covered by real data from every stream.
+    """
+
+    def __init__(self, streams, fs):
+        self.fs = float(fs)
+        self.streams = {key: ResampledStream(names, fs_in, fs) for key, (names, fs_in) in streams.items()}
+        self.names = [name for stream in self.streams.values() for name in stream.names]
+        self.start_time = None
+        self.next_index = 0
+
+    def add(self, key, time_values, block):
+        if len(time_values):
+            self.streams[key].add(time_values, block)
+
+    def finish(self):
+        """End every stream; the following pop() returns the last aligned samples"""
+        for stream in self.streams.values():
+            stream.finish()
+
+    def pop(self):
+        """AlignedBlock of the samples that every stream now covers, continuing from the last pop()"""
+        streams = list(self.streams.values())
+        if not streams or any(len(stream.out_times) == 0 for stream in streams):
+            return AlignedBlock.concatenate([], self.names, self.fs)
+        if self.start_time is None:
+            self.start_time = max(stream.out_times[0] for stream in streams)
+        end_time = min(stream.out_times[-1] for stream in streams)
+        last_index = int(np.floor((end_time - self.start_time) * self.fs + 1e-9))
+        if last_index < self.next_index:
+            return AlignedBlock.concatenate([], self.names, self.fs)
+
+        grid = self.start_time + np.arange(self.next_index, last_index + 1) / self.fs
+        values = np.concatenate([stream.sample(grid) for stream in streams], axis=0)
+        self.next_index = last_index + 1
+        next_time = self.start_time + self.next_index / self.fs
+        for stream in streams:
+            stream.discard_before(next_time)
+        return AlignedBlock(grid, self.names, values, self.fs)
@@ -0,0 +1,166 @@
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+
+def hann(length):
+    """Periodic Hann window (the default Welch window)"""
+    return 0.5 - 0.5 * np.cos(2.0 * np.pi * np.arange(length) / length)
+
+
+class SpectralEngine:
+    """Welch PSDs and cross-spectral densities for every channel in one batch.
+
+    data is a (channels, samples) array sampled at fs. Segments start at absolute
+    multiples of the hop (nperseg - noverlap), so overlapping analysis windows share
+    segments: each segment is detrended, windowed and transformed once for all
+    channels, and its spectrum cached by its start sample. Spectra for a window are
+    then averages over cached segments; the PSD/CSD results themselves are cached by
+    (window, parameters). Segments are transformed and averaged chunk_samples at a
+    time, so a window over the whole recording never needs one batch of all its
+    segments; such windows are meant for a loader thread (pass task to welch/csd).
+    """
+
+    def __init__(self, data, fs, nperseg=1024, noverlap=None, max_segments=4096, max_results=64,
+                 chunk_samples=1 << 22):
+        self.data = np.atleast_2d(np.asarray(data, dtype=np.float64))
+        self.fs = float(fs)
+        self.max_segments = max_segments
+        self.max_results = max_results
+        self.chunk_samples = chunk_samples
+        self.segment_cache = OrderedDict()  # segment start -> (channels, freqs) complex spectra
+        self.results = OrderedDict()
+        # The GUI and a loader task may share the engine; the caches are updated under the lock
+        self.lock = threading.RLock()
+        self.set_parameters(nperseg, noverlap)
+
+    @classmethod
+    def from_channels(cls, time_values, channels, **kwargs):
+        """Build from a time base and {name: values}; NaN gaps are treated as zeros"""
+        fs = 1.0 / np.median(np.diff(time_values)) if len(time_values) > 1 else 1.0
+        data = np.nan_to_num(np.vstack(list(channels.values()))) if channels else np.zeros((0, 0))
+        return cls(data, fs, **kwargs)
+
+    def set_parameters(self, nperseg, noverlap=None):
+        """Change the segment length/overlap; cached segments are only valid for one setting"""
+        nperseg = int(min(nperseg, max(self.data.shape[1], 1)))
+        noverlap = nperseg // 2 if noverlap is None else int(noverlap)
+        if (nperseg, noverlap) == getattr(self, 'parameters', None):
+            return
+        with self.lock:
+            self._set_parameters(nperseg, noverlap)
+
+    def _set_parameters(self, nperseg, noverlap):
+        self.parameters = (nperseg, noverlap)
+        self.nperseg = nperseg
+        self.hop = nperseg - noverlap
+        self.window = hann(nperseg)
+        self.scale = 1.0 / (self.fs * np.sum(self.window ** 2))
+        self.freqs = np.fft.rfftfreq(nperseg, 1.0 / self.fs)
+        self.segment_cache.clear()
+        self.results.clear()
+
+    def segment_starts(self, start, stop):
+        """Absolute start samples of the segments that fit inside [start, stop)"""
+        start = max(int(start), 0)
+        stop = min(int(stop), self.data.shape[1])
+        first = -(-start // self.hop) * self.hop
+        return np.arange(first, stop - self.nperseg + 1, self.hop)
+
+    def chunk_segments(self):
+        """Segments transformed in one batch"""
+        return max(self.chunk_samples // max(self.data.shape[0] * self.nperseg, 1), 1)
+
+    def missing_segments(self, start, stop):
+        """Number of segments in [start, stop) that are not cached yet"""
+        with self.lock:
+            return sum(1 for s in self.segment_starts(start, stop) if s not in self.segment_cache)
+
+    def segment_chunks(self, start, stop, task=None):
+        """Yield the (channels, segments, freqs) spectra for [start, stop) a chunk at a time, transforming only new segments"""
+        starts = self.segment_starts(start, stop)
+        size = self.chunk_segments()
+        for first in range(0, len(starts), size):
+            if task is not None:
+                task.check_cancelled()
+                task.report_progress(first, len(starts))
+            chunk = starts[first:first + size]
+            with self.lock:
+                missing = [s for s in chunk if s not in self.segment_cache]
+                if missing:
+                    # One batched detrend + window + FFT over channels x the chunk's new segments
+                    frames = self.data[:, np.asarray(missing)[:, None] + np.arange(self.nperseg)]
+                    frames = frames - frames.mean(axis=2, keepdims=True)
+                    spectra = np.fft.rfft(frames * self.window, axis=2)
+                    # Copies, so a cached segment does not keep the whole batch alive
+                    for i, segment_start in enumerate(missing):
+                        self.segment_cache[segment_start] = spectra[:, i].copy()
+
+                for segment_start in chunk:
+                    self.segment_cache.move_to_end(segment_start)
+                stacked = np.stack([self.segment_cache[s] for s in chunk], axis=1)
+
+                # Keep the most recently used segments only
+                while len(self.segment_cache) > self.max_segments:
+                    self.segment_cache.popitem(last=False)
+            yield stacked
+
+    def segments(self, start, stop):
+        """Return the (channels, segments, freqs) spectra for [start, stop)"""
+        chunks = list(self.segment_chunks(start, stop))
+        if not chunks:
+            return np.zeros((self.data.shape[0], 0, len(self.freqs)), dtype=np.complex128)
+        return np.concatenate(chunks, axis=1)
+
+    def _remember(self, key, compute):
+        with self.lock:
+            if key in self.results:
+                self.results.move_to_end(key)
+                return self.results[key]
+        # Computed outside the lock, which segment_chunks takes per chunk
+        result = compute()
+        with self.lock:
+            self.results[key] = result
+            while len(self.results) > self.max_results:
+                self.results.popitem(last=False)
+        return result
+
+    def _one_sided(self, density):
+        """Double the bins that fold the negative frequencies (all but DC and Nyquist)"""
+        density = density * self.scale
+        if self.nperseg % 2:
+            density[..., 1:] *= 2.0
+        else:
+            density[..., 1:-1] *= 2.0
+        return density
+
+    def welch(self, start=0, stop=None, task=None):
+        """Return (freqs, psd) with psd shaped (channels, freqs) for samples [start, stop)"""
+        stop = self.data.shape[1] if stop is None else stop
+        def compute():
+            power = np.zeros((self.data.shape[0], len(self.freqs)))
+            count = 0
+            for spectra in self.segment_chunks(start, stop, task):
+                power += np.sum(spectra.real ** 2 + spectra.imag ** 2, axis=1)
+                count += spectra.shape[1]
+            return self._one_sided(power / count) if count else power
+        return self.freqs, self._remember(('psd', int(start), int(stop), self.parameters), compute)
+
+    def csd(self, start=0, stop=None, task=None):
+        """Return (freqs, csd) with csd shaped (freqs, channels, channels); csd[f, i, j] = <conj(X_i) X_j>"""
+        stop = self.data.shape[1] if stop is None else stop
+        def compute():
+            num_channels = self.data.shape[0]
+            cross = np.zeros((len(self.freqs), num_channels, num_channels), dtype=np.complex128)
+            count = 0
+            for spectra in self.segment_chunks(start, stop, task):
+                cross += np.einsum('isf,jsf->fij', spectra.conj(), spectra)
+                count += spectra.shape[1]
+            cross /= max(count, 1)
+            return np.moveaxis(self._one_sided(np.moveaxis(cross, 0, -1)), -1, 0)
+        return self.freqs, self._remember(('csd', int(start), int(stop), self.parameters), compute)
+
+    def time_range(self, t0, t1, time_start=0.0):
+        """Convert a time window to the sample range used by welch()/csd()"""
+        return int(round((t0 - time_start) * self.fs)), int(round((t1 - time_start) * self.fs))
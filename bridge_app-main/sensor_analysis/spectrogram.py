@@ -0,0 +1,158 @@
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from .spectral import hann
+
+
+class SpectrogramStore:
+    """STFT power (dB) of every channel, appended to one memory-mapped file per channel.
+
+    <directory>/<channel>.f32 holds float32 rows of shape (freqs,), one per frame;
+    frame k covers samples [k * hop, k * hop + nperseg). spectrogram.json records the
+    parameters and how many frames of each channel are complete, and is rewritten
+    atomically after every chunk, so an interrupted job resumes where it stopped and
+    new data only appends frames. Rows beyond the recorded count (a crash between
+    the append and the metadata write) are truncated on open.
+    """
+
+    META_FILE = 'spectrogram.json'
+
+    def __init__(self, directory, names, fs, nperseg=256, hop=128, start_time=0.0):
+        self.directory = directory
+        self.names = list(names)
+        self.fs = float(fs)
+        self.nperseg = nperseg
+        self.hop = hop
+        self.start_time = float(start_time)
+        self.freqs = np.fft.rfftfreq(nperseg, 1.0 / self.fs)
+        self.window = hann(nperseg)
+        self.scale = 1.0 / (self.fs * np.sum(self.window ** 2))
+        self.lock = threading.Lock()
+        self.maps = {}
+        os.makedirs(directory, exist_ok=True)
+        self.frames = self._load_metadata()
+
+    @property
+    def parameters(self):
+        return {'fs': self.fs, 'nperseg': self.nperseg, 'hop': self.hop, 'start_time': self.start_time}
+
+    def path(self, name):
+        return os.path.join(self.directory, f"{name}.f32")
+
+    def _load_metadata(self):
+        frames = {name: 0 for name in self.names}
+        try:
+            with open(os.path.join(self.directory, self.META_FILE)) as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            meta = None
+        if meta is None or meta.get('parameters') != self.parameters:
+            # Different settings or recording: start over
+            for name in self.names:
+                if os.path.exists(self.path(name)):
+                    os.remove(self.path(name))
+            return frames
+
+        row_bytes = len(self.freqs) * 4
+        for name in self.names:
+            done = int(meta.get('frames', {}).get(name, 0))
+            size = os.path.getsize(self.path(name)) if os.path.exists(self.path(name)) else 0
+            done = min(done, size // row_bytes)
+            if size != done * row_bytes:
+                with open(self.path(name), 'r+b' if size else 'wb') as f:
+                    f.truncate(done * row_bytes)
+            frames[name] = done
+        return frames
+
+    def _save_metadata(self):
+        meta = {'parameters': self.parameters, 'frames': self.frames}
+        path = os.path.join(self.directory, self.META_FILE)
+        temp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(temp_path, 'w') as f:
+            json.dump(meta, f)
+        os.replace(temp_path, path)
+
+    def frames_available(self, num_samples):
+        """Complete frames that num_samples of data allow"""
+        return max((num_samples - self.nperseg) // self.hop + 1, 0)
+
+    def compute_frames(self, values, first, last, offset=0):
+        """dB power rows for frames [first, last) of a channel whose values start at sample offset"""
+        segment = values[first * self.hop - offset:(last - 1) * self.hop + self.nperseg - offset]
+        frames = np.lib.stride_tricks.sliding_window_view(segment, self.nperseg)[::self.hop]
+        frames = np.nan_to_num(frames)
+        frames = frames - frames.mean(axis=1, keepdims=True)
+        spectra = np.fft.rfft(frames * self.window, axis=1)
+        power = (spectra.real ** 2 + spectra.imag ** 2) * self.scale
+        power[:, 1:None if self.nperseg % 2 else -1] *= 2.0
+        return (10.0 * np.log10(np.maximum(power, 1e-20))).astype(np.float32)
+
+    def append_channel(self, name, values, chunk_frames, offset=0):
+        """Compute up to chunk_frames new frames of one channel; returns how many were appended"""
+        first = self.frames[name]
+        if first * self.hop < offset:
+            raise ValueError(f"{name}: samples from {first * self.hop} are needed, data starts at {offset}")
+        last = min(self.frames_available(offset + len(values)), first + chunk_frames)
+        if last <= first:
+            return 0
+        rows = self.compute_frames(values, first, last, offset)
+        with open(self.path(name), 'ab') as f:
+            f.write(rows.tobytes())
+        with self.lock:
+            self.frames[name] = last
+            self.maps.pop(name, None)
+            self._save_metadata()
+        return last - first
+
+    def first_needed_sample(self):
+        """Sample index new frames start from; data passed to update() may begin here"""
+        return min((self.frames[name] * self.hop for name in self.names), default=0)
+
+    def update(self, channels, offset=0, chunk_frames=4096, workers=None, task=None):
+        """Append the frames that channels ({name: samples from sample offset}) allow beyond what is stored.
+
+        Work proceeds in rounds of at most chunk_frames frames per channel, with the
+        channels of a round transformed in parallel (NumPy's FFT releases the GIL),
+        so memory stays bounded by channels x chunk_frames x nperseg. task is an
+        optional data_loader task for progress and cancellation.
+        """
+        names = [name for name in self.names if name in channels]
+        total = sum(max(self.frames_available(offset + len(channels[name])) - self.frames[name], 0) for name in names)
+        done = 0
+        with ThreadPoolExecutor(max_workers=workers or min(len(names), os.cpu_count() or 1) or 1) as pool:
+            while True:
+                if task is not None:
+                    task.check_cancelled()
+                    task.report_progress(done, total)
+                appended = list(pool.map(lambda name: self.append_channel(name, channels[name], chunk_frames, offset), names))
+                if not any(appended):
+                    break
+                done += sum(appended)
+        return done
+
+    def rows(self, name):
+        """Read-only memory map of a channel's (frames, freqs) dB array; only touched rows are read"""
+        with self.lock:
+            frames = self.frames[name]
+            if frames == 0:
+                return np.zeros((0, len(self.freqs)), dtype=np.float32)
+            rows = self.maps.get(name)
+            if rows is None or len(rows) != frames:
+                rows = np.memmap(self.path(name), dtype=np.float32, mode='r', shape=(frames, len(self.freqs)))
+                self.maps[name] = rows
+            return rows
+
+    def frame_time(self, frame):
+        """Centre time of a frame"""
+        return self.start_time + (frame * self.hop + self.nperseg / 2.0) / self.fs
+
+    def frame_range(self, t0, t1, frames):
+        """[first, last) frame indices covering the time window, clamped to frames"""
+        first = int(np.floor((t0 - self.start_time) * self.fs / self.hop - self.nperseg / (2.0 * self.hop)))
+        last = int(np.ceil((t1 - self.start_time) * self.fs / self.hop - self.nperseg / (2.0 * self.hop))) + 1
+        return min(max(first, 0), frames), min(max(last, 0), frames)
+
@@ -0,0 +1,209 @@
+import numpy as np
+
+
+class RunningMoments:
+    """Count, mean, variance, min and max of every channel since the start.
+
+    Each block's moments are computed in one vectorized pass and merged into the
+    running totals with the parallel Welford (Chan et al.) update, so the cost per
+    sample is constant and no history is kept. NaN samples are skipped.
+    """
+
+    def __init__(self, num_channels):
+        self.count = np.zeros(num_channels)
+        self.mean = np.zeros(num_channels)
+        self.m2 = np.zeros(num_channels)
+        self.minimum = np.full(num_channels, np.inf)
+        self.maximum = np.full(num_channels, -np.inf)
+
+    def update(self, block):
+        """Merge a (channels, samples) block"""
+        finite = np.isfinite(block)
+        count = finite.sum(axis=1)
+        block_mean = np.where(finite, block, 0.0).sum(axis=1) / np.maximum(count, 1)
+        block_m2 = (np.where(finite, block - block_mean[:, None], 0.0) ** 2).sum(axis=1)
+
+        total = self.count + count
+        delta = block_mean - self.mean
+        weight = count / np.maximum(total, 1)
+        self.mean = self.mean + delta * weight
+        self.m2 = self.m2 + block_m2 + delta ** 2 * self.count * weight
+        self.count = total
+        self.minimum = np.minimum(self.minimum, np.where(finite, block, np.inf).min(axis=1, initial=np.inf))
+        self.maximum = np.maximum(self.maximum, np.where(finite, block, -np.inf).max(axis=1, initial=-np.inf))
+
+    def variance(self):
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.where(self.count > 0, self.m2 / self.count, np.nan)
+
+
+class SlidingMaximum:
+    """Maximum of each channel over the last `window` samples, from a monotonic deque.
+
+    The deque holds (position, value) candidates with strictly decreasing values.
+    A block's only possible candidates are its suffix maxima (samples larger than
+    everything after them), found with one reversed maximum.accumulate; older
+    candidates they dominate are dropped from the back and expired ones from the
+    front, both by binary search. Each sample enters and leaves the deque once.
+    """
+
+    def __init__(self, num_channels, window):
+        self.window = window
+        self.values = [np.empty(0) for _ in range(num_channels)]
+        self.positions = [np.empty(0, dtype=np.int64) for _ in range(num_channels)]
+        self.position = 0  # Absolute index of the next sample
+
+    def update(self, block):
+        """Add a (channels, samples) block; NaN samples are ignored"""
+        block = np.where(np.isnan(block), -np.inf, block)
+        if block.shape[1] > self.window:
+            # Older samples leave the window within this block anyway
+            self.position += block.shape[1] - self.window
+            block = block[:, -self.window:]
+        count = block.shape[1]
+        if count == 0:
+            return
+
+        suffix = np.maximum.accumulate(block[:, ::-1], axis=1)[:, ::-1]
+        candidate = np.empty(block.shape, dtype=bool)
+        candidate[:, :-1] = block[:, :-1] > suffix[:, 1:]
+        candidate[:, -1] = True
+        positions = self.position + np.arange(count)
+        self.position += count
+        oldest = self.position - self.window
+
+        for channel in range(block.shape[0]):
+            values = self.values[channel]
+            # values decrease, so the candidates that survive the block maximum are a prefix
+            keep = np.searchsorted(-values, -suffix[channel, 0], side='left')
+            mask = candidate[channel]
+            values = np.concatenate([values[:keep], block[channel, mask]])
+            kept_positions = np.concatenate([self.positions[channel][:keep], positions[mask]])
+            start = np.searchsorted(kept_positions, oldest, side='left')
+            self.values[channel] = values[start:]
+            self.positions[channel] = kept_positions[start:]
+
+    def current(self):
+        result = np.array([values[0] if len(values) else np.nan for values in self.values])
+        result[np.isneginf(result)] = np.nan
+        return result
+
+
+class SlidingMoments:
+    """Mean, variance and mean square of each channel over the last `window` samples.
+
+    Running sums are updated with the samples entering and leaving the window, kept
+    in a circular buffer. Values are offset by each channel's first mean to limit
+    cancellation, and the sums are recomputed from the buffer now and then so
+    rounding cannot accumulate.
+    """
+
+    REFRESH_WINDOWS = 16  # Exact recomputation every this many windows of samples
+
+    def __init__(self, num_channels, window):
+        self.window = window
+        self.history = np.full((num_channels, window), np.nan)
+        self.head = 0
+        self.offset = None
+        self.since_refresh = 0
+        self.count = np.zeros(num_channels)
+        self.total = np.zeros(num_channels)
+        self.total_sq = np.zeros(num_channels)
+
+    def update(self, block):
+        """Add a (channels, samples) block"""
+        if block.shape[1] == 0:
+            return
+        if self.offset is None:
+            self.offset = np.nan_to_num(np.nanmean(block, axis=1)) if np.isfinite(block).any() else \
+                np.zeros(block.shape[0])
+        block = block[:, -self.window:] - self.offset[:, None]
+        count = block.shape[1]
+
+        slots = (self.head + np.arange(count)) % self.window
+        leaving = self.history[:, slots]
+        self.history[:, slots] = block
+        self.head = (self.head + count) % self.window
+        self.since_refresh += count
+
+        if self.since_refresh >= self.REFRESH_WINDOWS * self.window:
+            self.refresh()
+            return
+        entering_finite = np.isfinite(block)
+        leaving_finite = np.isfinite(leaving)
+        entering = np.where(entering_finite, block, 0.0)
+        leaving = np.where(leaving_finite, leaving, 0.0)
+        self.count += entering_finite.sum(axis=1) - leaving_finite.sum(axis=1)
+        self.total += entering.sum(axis=1) - leaving.sum(axis=1)
+        self.total_sq += (entering ** 2).sum(axis=1) - (leaving ** 2).sum(axis=1)
+
+    def refresh(self):
+        finite = np.isfinite(self.history)
+        values = np.where(finite, self.history, 0.0)
+        self.count = finite.sum(axis=1).astype(np.float64)
+        self.total = values.sum(axis=1)
+        self.total_sq = (values ** 2).sum(axis=1)
+        self.since_refresh = 0
+
+    def moments(self):
+        """Return (mean, variance, mean_square) arrays; NaN for channels without samples"""
+        with np.errstate(invalid='ignore', divide='ignore'):
+            count = np.where(self.count > 0, self.count, np.nan)
+            shifted_mean = self.total / count
+            variance = np.maximum(self.total_sq / count - shifted_mean ** 2, 0.0)
+        offset = self.offset if self.offset is not None else 0.0
+        mean = shifted_mean + offset
+        return mean, variance, variance + mean ** 2
+
+
+class StreamingStats:
+    """Per-channel statistics over a sliding window and since the start, updated block by block.
+
+    update() takes (channels, samples) blocks in names order at whatever rate they
+    arrive; window() and totals() then read the current values without touching
+    the history, so panels can poll them as often as they redraw.
+    """
+
+    def __init__(self, names, window):
+        self.names = list(names)
+        self.index = {name: i for i, name in enumerate(self.names)}
+        self.window_size = window
+        self.moments = SlidingMoments(len(self.names), window)
+        self.maximum = SlidingMaximum(len(self.names), window)
+        self.minimum = SlidingMaximum(len(self.names), window)  # Fed negated values
+        self.running = RunningMoments(len(self.names))
+        self.samples = 0
+
+    def update(self, block):
+        block = np.atleast_2d(np.asarray(block, dtype=np.float64))
+        if block.shape[1] == 0:
+            return
+        self.moments.update(block)
+        self.maximum.update(block)
+        self.minimum.update(-block)
+        self.running.update(block)
+        self.samples += block.shape[1]
+
+    def window(self):
+        """{statistic: array over channels} for the last window_size samples"""
+        mean, variance, mean_square = self.moments.moments()
+        maximum = self.maximum.current()
+        minimum = -self.minimum.current()
+        rms = np.sqrt(mean_square)
+        peak = np.fmax(np.abs(maximum), np.abs(minimum))
+        with np.errstate(invalid='ignore', divide='ignore'):
+            crest_factor = np.where(rms > 0, peak / rms, np.nan)
+        return {'mean': mean, 'variance': variance, 'rms': rms, 'peak': peak,
+                'crest_factor': crest_factor, 'min': minimum, 'max': maximum}
+
+    def totals(self):
+        """{statistic: array over channels} since the first block"""
+        variance = self.running.variance()
+        return {'count': self.running.count, 'mean': self.running.mean, 'variance': variance,
+                'rms': np.sqrt(variance + self.running.mean ** 2),
+                'min': self.running.minimum, 'max': self.running.maximum}
+
+    def channel(self, name):
+        """Current window statistics of one channel as floats"""
+        i = self.index[name]
+        return {key: float(values[i]) for key, values in self.window().items()}
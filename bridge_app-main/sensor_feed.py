@@ -0,0 +1,615 @@
+import numpy as np
+from PyQt5.QtCore import Qt, QTimer, QFileSystemWatcher
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QComboBox, QPushButton, QCheckBox, QTabWidget, QLabel
+
+from data_loader import loader_service
+from decimation import MinMaxPyramid, combined_range, value_range
+from live_tail import CsvTailReader, RingBuffer
+from plot_widgets import FastPlotWidget
+from sensor_analysis.spectral import SpectralEngine
+from sensor_analysis.event_detection import EventTable, StaLtaDetector
+from sensor_analysis.filters import FilterBank
+from sensor_analysis.resampling import AlignedBlock, MultiRateAligner
+from sensor_analysis.streaming_stats import StreamingStats
+from stacked_viewer import StackedTraceViewer
+
+
+class SensorFeed:
+    """Time base and channels of one sensor export, with a MinMaxPyramid per channel built on demand.
+
+    The export is parsed by a CsvTailReader, so live mode can keep following the
+    file from where the initial load stopped. Live samples go into a RingBuffer
+    for display and are merged into the full history when live mode ends.
+
+    A display filter, once applied, replaces the raw channels in the plots,
+    pyramids and spectra; its FilterBank state continues from the history into the
+    live blocks. Statistics, spectrograms and fatigue keep using the raw channels.
+    """
+
+    LIVE_CAPACITY = 20000  # Samples kept for the live plot (below FastPlotWidget's decimation threshold)
+    STATS_WINDOW = 1000  # Samples in the sliding statistics window
+    EVENT_HIGHPASS = 0.5  # Hz; removes drift before STA/LTA detection
+
+    def __init__(self, time_values, channels, ylabel, reader=None):
+        self.time_values = time_values
+        self.channels = channels
+        self.ylabel = ylabel
+        self.reader = reader
+        self.pyramids = {}
+        self.spectral = None
+        self.stats = None
+        self.detector = None
+        self.event_table = None
+        self.ring = None
+        self.pending = []  # Live (time_values, values) blocks not merged into the history yet
+        self.filter_bank = None
+        self.filtered = None  # {name: filtered history} while a display filter is applied
+        self.filtered_pending = []  # Filtered values of the pending blocks
+
+    @classmethod
+    def from_csv(cls, data_file, prefix, ylabel, task=None, chunk_bytes=4 * 1024 * 1024):
+        """Parse an export in chunks; with a data_loader task, reports progress and honours cancellation"""
+        reader = CsvTailReader(data_file, prefix)
+        blocks = []
+        while True:
+            time_values, values = reader.read_new(max_bytes=chunk_bytes)
+            if len(time_values):
+                blocks.append((time_values, values))
+            done, total = reader.remaining()
+            if task is not None:
+                task.check_cancelled()
+                task.report_progress(done, total)
+            if done >= total:
+                break
+
+        if blocks:
+            time_values = np.concatenate([block[0] for block in blocks])
+            values = np.concatenate([block[1] for block in blocks])
+        else:
+            time_values, values = reader._empty()
+        channels = {name: np.ascontiguousarray(values[:, i]) for i, name in enumerate(reader.names or [])}
+        return cls(time_values, channels, ylabel, reader)
+
+    @classmethod
+    def load(cls, data_file, prefix, ylabel, task=None):
+        """Parse an export and build every channel's pyramid and statistics; meant to run on a loader thread"""
+        feed = cls.from_csv(data_file, prefix, ylabel, task)
+        for name in feed.names():
+            if task is not None:
+                task.check_cancelled()
+            feed.pyramid(name)
+        feed.statistics()
+        return feed
+
+    def names(self):
+        return list(self.channels.keys())
+
+    def sample_rate(self):
+        """Nominal sampling rate of the loaded history, from the median time step"""
+        time_values = self.time_values
+        return 1.0 / np.median(np.diff(time_values)) if len(time_values) > 1 else 1.0
+
+    def display_channels(self):
+        """{name: history} as displayed: filtered when a display filter is applied, raw otherwise"""
+        return self.filtered if self.filtered is not None else self.channels
+
+    def pyramid(self, name):
+        if name not in self.pyramids:
+            self.pyramids[name] = MinMaxPyramid(self.time_values, self.display_channels()[name])
+        return self.pyramids[name]
+
+    def spectral_engine(self):
+        """SpectralEngine over every displayed channel, built once per history so its segment cache is reused"""
+        if self.spectral is None:
+            self.spectral = SpectralEngine.from_channels(self.time_values, self.display_channels())
+        return self.spectral
+
+    def filter_history(self, settings, task=None, chunk=1000000):
+        """Return (bank, {name: filtered history}) for FilterBank.design settings, or (None, None) for raw.
+
+        All channels are filtered together in chunks; meant for a loader thread,
+        with apply_filter() called on the result afterwards.
+        """
+        names = self.names()
+        if settings is None or not names:
+            return None, None
+        bank = FilterBank.design(self.sample_rate(), len(names), **settings)
+        parts = []
+        for start in range(0, len(self.time_values), chunk):
+            if task is not None:
+                task.check_cancelled()
+                task.report_progress(start, len(self.time_values))
+            parts.append(bank.process(np.vstack([self.channels[name][start:start + chunk] for name in names])))
+        filtered = np.concatenate(parts, axis=1) if parts else np.zeros((len(names), 0))
+        return bank, {name: filtered[i] for i, name in enumerate(names)}
+
+    def apply_filter(self, bank, filtered):
+        """Switch the displayed channels to a filter_history() result, catching up on samples added meanwhile"""
+        names = self.names()
+        if bank is not None:
+            done = len(filtered[names[0]])
+            if done < len(self.time_values):
+                # Live blocks were merged into the history while filtering
+                extra = bank.process(np.vstack([self.channels[name][done:] for name in names]))
+                filtered = {name: np.concatenate([filtered[name], extra[i]]) for i, name in enumerate(names)}
+            self.filtered_pending = [bank.process(values.T).T for _, values in self.pending]
+        else:
+            self.filtered_pending = []
+        self.filter_bank = bank
+        self.filtered = filtered
+        self.pyramids = {}
+        self.spectral = None
+        if self.ring is not None:
+            self.fill_ring(self.ring.capacity)
+
+    def statistics(self):
+        """StreamingStats over every channel, seeded once with the loaded history and kept current by poll()"""
+        if self.stats is None:
+            names = self.names()
+            self.stats = StreamingStats(names, self.STATS_WINDOW)
+            if names:
+                self.stats.update(np.vstack([self.channels[name] for name in names]))
+        return self.stats
+
+    def detect_events(self, task=None, chunk=1000000):
+        """(detector, EventTable, samples covered) of STA/LTA events over the loaded history; meant for a loader thread.
+
+        The result is only kept once attach_events() has run on the GUI thread.
+        """
+        names = self.names()
+        time_values = self.time_values
+        # The arrays as they are now; stop_live() may replace them while this runs
+        channels = [self.channels[name] for name in names]
+        fs = self.sample_rate()
+        highpass = FilterBank.design(fs, len(names), highpass=self.EVENT_HIGHPASS)
+        detector = StaLtaDetector(names, fs, prefilter=highpass)
+        table = EventTable()
+        for start in range(0, len(time_values) if names else 0, chunk):
+            if task is not None:
+                task.check_cancelled()
+                task.report_progress(start, len(time_values))
+            block = np.vstack([values[start:start + chunk] for values in channels])
+            for event in detector.process(time_values[start:start + chunk], block):
+                table.add(event)
+        return detector, table, len(time_values)
+
+    def attach_events(self, detection):
+        """Keep a detect_events() result current from now on and return its table; on the GUI thread.
+
+        Samples that arrived while it ran (live blocks, or a history merged by
+        stop_live) are run through the detector first, so poll() continues
+        exactly where they end.
+        """
+        if self.event_table is not None:
+            return self.event_table
+        detector, table, samples = detection
+        time_values = self.times_from(samples)
+        if len(time_values) and self.names():
+            tail = self.samples_from(samples)
+            for event in detector.process(time_values, np.vstack([tail[name] for name in self.names()])):
+                table.add(event)
+        self.detector = detector
+        self.event_table = table
+        return table
+
+    def times_from(self, offset):
+        """Time values from sample offset on, over the history and any live blocks not merged yet"""
+        pieces = []
+        for part in [self.time_values] + [time_values for time_values, _ in self.pending]:
+            if offset >= len(part):
+                offset -= len(part)
+                continue
+            pieces.append(part[offset:])
+            offset = 0
+        if len(pieces) == 1:
+            return pieces[0]
+        return np.concatenate(pieces) if pieces else np.empty(0)
+
+    def samples_from(self, offset):
+        """{name: samples from sample offset on}, over the history and any live blocks not merged yet"""
+        tail = {}
+        for i, name in enumerate(self.names()):
+            parts = [self.channels[name]] + [values[:, i] for _, values in self.pending]
+            skip = offset
+            pieces = []
+            for part in parts:
+                if skip >= len(part):
+                    skip -= len(part)
+                    continue
+                pieces.append(part[skip:])
+                skip = 0
+            if len(pieces) == 1:
+                tail[name] = pieces[0]  # Just a view of the history
+            else:
+                tail[name] = np.concatenate(pieces) if pieces else np.empty(0)
+        return tail
+
+    def sample_count(self):
+        return len(self.time_values) + sum(len(block[0]) for block in self.pending)
+
+    def traces(self):
+        """[(name, pyramid), ...] for every channel, as the stacked viewer expects"""
+        return [(name, self.pyramid(name)) for name in self.names()]
+
+    def start_live(self, capacity=None):
+        """Start buffering appended rows, seeded with the end of the loaded history"""
+        self.fill_ring(capacity or self.LIVE_CAPACITY)
+
+    def fill_ring(self, capacity):
+        """(Re)create the live buffer with the newest displayed samples of the history and pending blocks"""
+        names = self.names()
+        channels = self.display_channels()
+        self.ring = RingBuffer(capacity, len(names))
+        tail = slice(-self.ring.capacity, None)
+        self.ring.extend(
+            self.time_values[tail],
+            np.column_stack([channels[name][tail] for name in names]) if names else np.empty((0, 0))
+        )
+        pending = self.filtered_pending if self.filter_bank is not None else [block[1] for block in self.pending]
+        for (time_values, _), values in zip(self.pending, pending):
+            self.ring.extend(time_values, values)
+
+    def poll(self):
+        """Parse rows appended since the last poll; returns how many arrived"""
+        if self.reader is None or self.ring is None:
+            return 0
+        try:
+            time_values, values = self.reader.read_new()
+        except Exception as e:
+            print(f"Error reading {self.reader.path}: {e}")
+            return 0
+        if len(time_values):
+            self.pending.append((time_values, values))
+            if self.filter_bank is not None:
+                self.filtered_pending.append(self.filter_bank.process(values.T).T)
+                self.ring.extend(time_values, self.filtered_pending[-1])
+            else:
+                self.ring.extend(time_values, values)
+            if self.stats is not None:
+                self.stats.update(values.T)
+            if self.detector is not None:
+                for event in self.detector.process(time_values, values.T):
+                    self.event_table.add(event)
+        return len(time_values)
+
+    def stop_live(self):
+        """Leave live mode, appending everything received to the full history once"""
+        self.poll()
+        self.ring = None
+        if not self.pending:
+            return
+        time_values = np.concatenate([self.time_values] + [block[0] for block in self.pending])
+        for i, name in enumerate(self.names()):
+            self.channels[name] = np.concatenate([self.channels[name]] + [block[1][:, i] for block in self.pending])
+            if self.filtered is not None:
+                self.filtered[name] = np.concatenate(
+                    [self.filtered[name]] + [values[:, i] for values in self.filtered_pending]
+                )
+        self.time_values = time_values
+        self.pending = []
+        self.filtered_pending = []
+        self.pyramids = {}
+        self.spectral = None
+
+
+def align_feeds(feeds, fs=None, task=None, chunk_seconds=600.0):
+    """AlignedBlock of every channel of several feeds (e.g. accelerometers and strain gauges)
+    on one time base at fs (default: the fastest feed's rate); meant for a loader thread.
+
+    The histories are fed to a MultiRateAligner in matching time slices, so each
+    slice is resampled and aligned while the next is read.
+    """
+    feeds = [feed for feed in feeds if feed.names() and len(feed.time_values)]
+    if fs is None:
+        fs = max((feed.sample_rate() for feed in feeds), default=1.0)
+    aligner = MultiRateAligner({index: (feed.names(), feed.sample_rate()) for index, feed in enumerate(feeds)}, fs)
+    if not feeds:
+        return aligner.pop()
+
+    start = min(feed.time_values[0] for feed in feeds)
+    end = max(feed.time_values[-1] for feed in feeds)
+    blocks = []
+    for t0 in np.arange(start, end + chunk_seconds, chunk_seconds):
+        if task is not None:
+            task.check_cancelled()
+            task.report_progress(t0 - start, end - start)
+        for index, feed in enumerate(feeds):
+            first, last = np.searchsorted(feed.time_values, [t0, t0 + chunk_seconds])
+            block = np.vstack([feed.channels[name][first:last] for name in feed.names()])
+            aligner.add(index, feed.time_values[first:last], block)
+        blocks.append(aligner.pop())
+    aligner.finish()
+    blocks.append(aligner.pop())
+    return AlignedBlock.concatenate(blocks, aligner.names, fs)
+
+
+def show_stacked_view(title, traces, parent=None):
+    """Open a StackedTraceViewer window over [(name, pyramid), ...]"""
+    viewer = StackedTraceViewer(traces, parent)
+    viewer.setWindowFlags(Qt.Window)
+    viewer.setWindowTitle(title)
+    viewer.resize(1200, max(60 * len(traces), 400))
+    viewer.show()
+    return viewer
+
+
+class SensorFeedWindow(QWidget):
+    """Channel picker plus a FastPlotWidget, with y-limits shared across every channel.
+
+    With spectrum=True a second tab shows the Welch PSD of the selected channel over
+    the time range currently visible in the time plot, and a Spectrogram button
+    opens the cached STFT of the whole recording. With fatigue=True a Fatigue
+    button opens the rainflow / Miner damage assessment of the gauges.
+    """
+
+    # Display filters offered in the filter dropdown, as FilterBank.design settings
+    FILTER_PRESETS = {
+        "Raw": None,
+        "High-pass 0.5 Hz": {'highpass': 0.5},
+        "Band-pass 0.5-50 Hz": {'highpass': 0.5, 'lowpass': 50.0},
+        "Notch 50 Hz": {'highpass': 0.5, 'notch': [50.0]},
+        "Anti-alias 100 Hz": {'anti_alias': 100.0},
+    }
+
+    def __init__(self, title, feed, spectrum=False, fatigue=False, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle(title)
+        self.setGeometry(100, 100, 800, 600)
+        layout = QVBoxLayout(self)
+
+        self.feed = feed
+        self.stacked_viewer = None
+
+        # Create a dropdown, with a button to see every channel at once
+        controls = QHBoxLayout()
+        self.dropdown = QComboBox()
+        self.dropdown.addItems(feed.names())
+        self.dropdown.currentIndexChanged.connect(self.update_plot)
+        self.filter_dropdown = QComboBox()
+        self.filter_dropdown.addItems(list(self.FILTER_PRESETS))
+        self.filter_dropdown.currentTextChanged.connect(self.set_filter)
+        stacked_button = QPushButton("Show All Channels")
+        stacked_button.clicked.connect(self.show_all_channels)
+        self.live_check = QCheckBox("Live")
+        self.live_check.setEnabled(feed.reader is not None)
+        self.live_check.toggled.connect(self.set_live)
+        controls.addWidget(self.dropdown, 1)
+        controls.addWidget(self.filter_dropdown)
+        controls.addWidget(stacked_button)
+        self.spectrogram_window = None
+        if spectrum and feed.reader is not None:
+            spectrogram_button = QPushButton("Spectrogram")
+            spectrogram_button.clicked.connect(self.show_spectrogram)
+            controls.addWidget(spectrogram_button)
+        self.fatigue_window = None
+        if fatigue and feed.reader is not None:
+            fatigue_button = QPushButton("Fatigue")
+            fatigue_button.clicked.connect(self.show_fatigue)
+            controls.addWidget(fatigue_button)
+        controls.addWidget(self.live_check)
+
+        # Live mode: file-watch events (plus a slow poll, as watchers can miss appends)
+        # parse new rows, and the plot refreshes at a fixed rate only if any arrived
+        self.watcher = None
+        self.poll_timer = QTimer(self)
+        self.poll_timer.timeout.connect(self.poll_feed)
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.timeout.connect(self.refresh_live_plot)
+        self.live_dirty = False
+
+        self.plot = FastPlotWidget(xlabel="Time", ylabel=feed.ylabel, toolbar=True)
+
+        self.apply_shared_limits()
+
+        layout.addLayout(controls)
+        self.tabs = None
+        self.spectrum_plot = None
+        if spectrum:
+            self.spectrum_plot = FastPlotWidget(xlabel="Frequency (Hz)", ylabel="PSD", toolbar=True)
+            self.spectrum_plot.ax.set_yscale('log')
+            # Zooming the time plot recomputes the spectrum once the view settles
+            self.spectrum_timer = QTimer(self)
+            self.spectrum_timer.setSingleShot(True)
+            self.spectrum_timer.timeout.connect(self.update_spectrum)
+            self.plot.ax.callbacks.connect('xlim_changed', lambda ax: self.spectrum_timer.start(150))
+
+            self.tabs = QTabWidget()
+            self.tabs.addTab(self.plot, "Time")
+            self.tabs.addTab(self.spectrum_plot, "Spectrum")
+            self.tabs.currentChanged.connect(self.update_spectrum)
+            layout.addWidget(self.tabs)
+        else:
+            layout.addWidget(self.plot)
+        self.stats_label = QLabel()
+        layout.addWidget(self.stats_label)
+
+        # Initial plot
+        self.update_plot()
+
+    def apply_shared_limits(self):
+        # One set of limits for all channels, so switching channels never re-renders the axes
+        # Combined from per-channel ranges (a built pyramid's coarsest level is enough),
+        # as stacking every channel's history would copy it on the GUI thread
+        channels = self.feed.display_channels()
+        if channels:
+            low, high = combined_range(
+                self.feed.pyramids[name].limits() if name in self.feed.pyramids else value_range(values)
+                for name, values in channels.items()
+            )
+            self.plot.set_limits(
+                FastPlotWidget.data_limits(self.feed.time_values, margin=0.0),
+                FastPlotWidget.data_limits(np.array([low, high]))
+            )
+
+    def select(self, channel_name):
+        """Show a channel by name; returns False if the feed has no such channel"""
+        index = self.dropdown.findText(channel_name)
+        if index < 0:
+            return False
+        if index == self.dropdown.currentIndex():
+            self.update_plot()
+        else:
+            self.dropdown.setCurrentIndex(index)  # Triggers update_plot
+        return True
+
+    def update_plot(self):
+        label = self.dropdown.currentText()
+        channels = self.feed.display_channels()
+        if label not in channels:
+            return
+        if self.feed.ring is not None:
+            self.refresh_live_plot(force=True)
+            return
+        self.plot.set_data(
+            self.feed.time_values, channels[label],
+            label=label, title=f"{label} Data Over Time", pyramid=self.feed.pyramid(label)
+        )
+        self.update_stats()
+        self.update_spectrum()
+
+    def update_stats(self):
+        """Show the selected channel's current sliding-window statistics (read, not recomputed)"""
+        label = self.dropdown.currentText()
+        stats = self.feed.statistics()
+        if label not in stats.index:
+            self.stats_label.clear()
+            return
+        values = stats.channel(label)
+        self.stats_label.setText(
+            f"Last {stats.window_size} samples   Mean: {values['mean']:.4g}   Std: {np.sqrt(values['variance']):.4g}   "
+            f"RMS: {values['rms']:.4g}   Peak: {values['peak']:.4g}   Crest factor: {values['crest_factor']:.3g}"
+        )
+
+    def update_spectrum(self, *args):
+        """PSD of the selected channel over the visible time range; skipped while the tab is hidden"""
+        if self.tabs is None or self.tabs.currentWidget() is not self.spectrum_plot:
+            return
+        label = self.dropdown.currentText()
+        names = self.feed.names()
+        if label not in names or len(self.feed.time_values) < 2:
+            return
+        engine = self.feed.spectral_engine()
+        t0, t1 = self.plot.ax.get_xlim()
+        start, stop = engine.time_range(t0, t1, self.feed.time_values[0])
+        # A superseded request would only be drawn over
+        loader_service().cancel_owned(self.spectrum_plot)
+        if engine.missing_segments(start, stop) > engine.chunk_segments():
+            # Wide ranges with many new segments are transformed on the loader thread
+            loader_service().submit(
+                engine.welch, start, stop,
+                pass_task=True,
+                owner=self.spectrum_plot,
+                on_progress=lambda percent: self.stats_label.setText(f"Computing spectrum... {percent}%"),
+                on_finished=lambda result: self.show_spectrum(engine, *result, t0, t1),
+                on_failed=lambda message: print(f"Error computing spectrum of {self.windowTitle()}: {message}")
+            )
+            return
+        # All channels come from one batch, so switching channels is a cache hit
+        freqs, psd = engine.welch(start, stop)
+        self.show_spectrum(engine, freqs, psd, t0, t1)
+
+    def show_spectrum(self, engine, freqs, psd, t0, t1):
+        if engine is not self.feed.spectral:
+            return  # Computed before the data was filtered or reloaded
+        label = self.dropdown.currentText()
+        names = self.feed.names()
+        if label not in names:
+            return
+        positive = psd[:, 1:][psd[:, 1:] > 0]
+        if len(positive) == 0:
+            return
+        self.spectrum_plot.set_limits((freqs[0], freqs[-1]), (positive.min() * 0.5, positive.max() * 2.0))
+        self.spectrum_plot.set_data(
+            freqs, psd[names.index(label)], label=label,
+            title=f"{label} PSD ({max(t0, self.feed.time_values[0]):.1f} - {min(t1, self.feed.time_values[-1]):.1f})"
+        )
+
+    def set_filter(self, preset):
+        """Filter every channel on the loader thread, then show the filtered data"""
+        loader_service().cancel_owned(self)
+        loader_service().submit(
+            self.feed.filter_history, self.FILTER_PRESETS[preset],
+            pass_task=True,
+            owner=self,
+            on_progress=lambda percent: self.stats_label.setText(f"Filtering... {percent}%"),
+            on_finished=self.on_filtered,
+            on_failed=lambda message: print(f"Error filtering {self.windowTitle()}: {message}")
+        )
+
+    def on_filtered(self, result):
+        self.feed.apply_filter(*result)
+        if self.stacked_viewer is not None:
+            # Its lanes were built from the previous pyramids
+            self.stacked_viewer.close()
+            self.stacked_viewer = None
+        self.apply_shared_limits()
+        if self.feed.ring is not None:
+            self.plot.set_limits(None, self.plot.ylim)
+        self.update_plot()
+
+    def show_all_channels(self):
+        if self.stacked_viewer is None:
+            self.stacked_viewer = show_stacked_view(f"{self.windowTitle()} - All Channels", self.feed.traces())
+        else:
+            self.stacked_viewer.show()
+            self.stacked_viewer.raise_()
+
+    def show_spectrogram(self):
+        from spectrogram_view import SpectrogramWindow
+        if self.spectrogram_window is None:
+            self.spectrogram_window = SpectrogramWindow(self.feed, self.dropdown.currentText())
+        else:
+            self.spectrogram_window.dropdown.setCurrentText(self.dropdown.currentText())
+        self.spectrogram_window.show()
+        self.spectrogram_window.raise_()
+
+    def show_fatigue(self):
+        from fatigue_view import FatigueWindow
+        if self.fatigue_window is None:
+            self.fatigue_window = FatigueWindow(self.feed)
+        self.fatigue_window.dropdown.setCurrentText(self.dropdown.currentText())
+        self.fatigue_window.show()
+        self.fatigue_window.raise_()
+
+    def set_live(self, live):
+        if live:
+            self.feed.start_live()
+            self.watcher = QFileSystemWatcher([self.feed.reader.path], self)
+            self.watcher.fileChanged.connect(self.poll_feed)
+            self.poll_timer.start(1000)
+            self.refresh_timer.start(100)  # 10 fps
+            # The x-axis follows the buffered window; y keeps the shared limits
+            self.plot.set_limits(None, self.plot.ylim)
+            self.refresh_live_plot(force=True)
+        else:
+            self.poll_timer.stop()
+            self.refresh_timer.stop()
+            if self.watcher is not None:
+                self.watcher.deleteLater()
+                self.watcher = None
+            self.feed.stop_live()
+            self.apply_shared_limits()
+            self.update_plot()
+
+    def poll_feed(self, path=None):
+        if self.feed.poll():
+            self.live_dirty = True
+        # Watchers drop files that are replaced rather than appended to
+        if self.watcher is not None and not self.watcher.files():
+            self.watcher.addPath(self.feed.reader.path)
+
+    def refresh_live_plot(self, force=False):
+        if self.feed.ring is None or not (self.live_dirty or force):
+            return
+        self.live_dirty = False
+        label = self.dropdown.currentText()
+        names = self.feed.names()
+        if label not in names:
+            return
+        time_values, values = self.feed.ring.view()
+        self.plot.set_data(time_values, values[:, names.index(label)], label=label, title=f"{label} (live)")
+        self.update_stats()
+
+    def closeEvent(self, event):
+        self.live_check.setChecked(False)
+        super().closeEvent(event)
@@ -0,0 +1,203 @@
+import os
+import threading
+
+import numpy as np
+
+
+class GridIndex:
+    """Uniform-grid spatial index over 3D points for nearest-point queries"""
+
+    def __init__(self, points, cell_size=None):
+        self.points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+        self.origin = self.points.min(axis=0) if len(self.points) else np.zeros(3)
+        if cell_size is None:
+            # About one point per cell on average over the occupied bounding box, sized
+            # from its non-degenerate axes so flat (deck, 2D) meshes do not get tiny cells
+            extent = np.ptp(self.points, axis=0) if len(self.points) else np.ones(3)
+            spanned = extent[extent > 1e-6 * max(extent.max(), 1e-12)]
+            if len(spanned):
+                cell_size = (np.prod(spanned) / max(len(self.points), 1)) ** (1.0 / len(spanned))
+            else:
+                cell_size = 1.0
+            cell_size = max(cell_size, 1e-6)
+        self.cell_size = cell_size
+
+        cells = np.floor((self.points - self.origin) / cell_size).astype(np.int64)
+        self.cells = {}
+        order = np.lexsort(cells.T[::-1])
+        sorted_cells = cells[order]
+        boundaries = np.flatnonzero(np.any(np.diff(sorted_cells, axis=0) != 0, axis=1)) + 1
+        for group in np.split(order, boundaries):
+            if len(group):
+                self.cells[tuple(cells[group[0]])] = group
+        self.max_cell = cells.max(axis=0) if len(cells) else np.zeros(3, dtype=np.int64)
+        self.max_ring = int(np.max(np.abs(cells).max(axis=0))) + 1 if len(cells) else 0
+
+    def nearest(self, point):
+        """Return (index, distance) of the closest indexed point"""
+        point = np.asarray(point, dtype=np.float64)
+        center = np.floor((point - self.origin) / self.cell_size).astype(np.int64)
+        best_index, best_distance = -1, np.inf
+
+        # Search shells of cells outward until no unsearched cell can be closer, starting
+        # at the first shell that reaches the occupied cells. Once that would visit more
+        # cells than a quarter of the points (a query far from them), one vectorized
+        # scan over all points is cheaper
+        ring = int(np.max(np.maximum(np.maximum(-center, center - self.max_cell), 0)))
+        visited, budget = 0, max(len(self.points) // 4, 27)
+        while ring <= self.max_ring + int(np.abs(center).max()):
+            visited += (2 * ring + 1) ** 3 - max(2 * ring - 1, 0) ** 3
+            if visited > budget:
+                return self._brute_force(point)
+            for cell in self._shell(center, ring):
+                candidates = self.cells.get(cell)
+                if candidates is None:
+                    continue
+                distances = np.linalg.norm(self.points[candidates] - point, axis=1)
+                closest = int(np.argmin(distances))
+                if distances[closest] < best_distance:
+                    best_index, best_distance = int(candidates[closest]), float(distances[closest])
+            # Anything in shell ring+1 is at least ring * cell_size away
+            if best_index >= 0 and best_distance <= ring * self.cell_size:
+                break
+            ring += 1
+        return best_index, best_distance
+
+    def _brute_force(self, point):
+        distances = np.linalg.norm(self.points - point, axis=1)
+        closest = int(np.argmin(distances))
+        return closest, float(distances[closest])
+
+    @staticmethod
+    def _shell(center, ring):
+        """Cells whose Chebyshev distance from center is exactly ring"""
+        if ring == 0:
+            yield tuple(center)
+            return
+        span = range(-ring, ring + 1)
+        for dx in span:
+            for dy in span:
+                for dz in span:
+                    if max(abs(dx), abs(dy), abs(dz)) == ring:
+                        yield (center[0] + dx, center[1] + dy, center[2] + dz)
+
+
+class SensorRegistry:
+    """The bridge's sensor inventory, loaded once and indexed for O(1) lookups.
+
+    Sensors are the same dicts the dashboard table has always used (name,
+    description, location, x/y/z, color, image, data_key) plus their type. They
+    can be looked up by name or data key, listed by type or location code, and
+    mapped to their nearest node of a mesh through index_mesh().
+    """
+
+    TYPE_COLORS = {
+        'Accelerometer': (1.0, 0.0, 0.0),    # Red
+        'Strain Gauge': (0.0, 1.0, 0.0),     # Green
+        'Camera': (1.0, 0.65, 0.0),          # Orange
+        'Displacement': (0.0, 0.0, 1.0)      # Blue
+    }
+    TYPE_IMAGES = {
+        'Accelerometer': 'accelerometer_img.jpg',
+        'Strain Gauge': 'strain_gauge_img.jpeg',
+        'Camera': 'Camera.jpg',
+        'Displacement': 'displacement_sensor_img.jpg'
+    }
+
+    def __init__(self, sensors):
+        self.sensors = list(sensors)
+        self.by_id = {}
+        self.by_type = {}
+        self.by_location = {}
+        for sensor in self.sensors:
+            self.by_id[sensor['name']] = sensor
+            self.by_id[sensor['data_key']] = sensor
+            self.by_type.setdefault(sensor['type'], []).append(sensor)
+            self.by_location.setdefault(sensor['location'], []).append(sensor)
+        self.positions = np.array([[s['x'], s['y'], s['z']] for s in self.sensors], dtype=np.float64).reshape(-1, 3)
+
+    @classmethod
+    def from_file(cls, path):
+        """Read the tab-separated inventory (decimal commas, as exported from the sensor sheet)"""
+        with open(path, encoding='utf-8-sig') as f:
+            lines = [line.rstrip('\n') for line in f if line.strip()]
+        headers = lines[0].split('\t')
+
+        sensors = []
+        for line in lines[1:]:
+            data = dict(zip(headers, line.split('\t')))
+            sensor_type = cls.sensor_type(data['Sensors'])
+            sensor = {
+                'name': data['Sensors'],
+                'type': sensor_type,
+                'description': data['Descriptions'],
+                'location': data['Location'],
+                'x': float(data['x(m)'].replace(',', '.')),
+                'y': float(data['y(m)'].replace(',', '.')),
+                'z': float(data['z(m)'].replace(',', '.')),
+                'color': data['Color (Small Sphere or Cube)'],
+                'image': cls.TYPE_IMAGES.get(sensor_type, 'default_sensor_img.jpg')
+            }
+            sensor['data_key'] = sensor['name'].replace(' ', '_')
+            sensors.append(sensor)
+        return cls(sensors)
+
+    @classmethod
+    def sensor_type(cls, name):
+        return next((t for t in cls.TYPE_COLORS if t.lower() in name.lower()), None)
+
+    def get(self, sensor_id):
+        """Look a sensor up by name ('Accelerometer 3') or data key ('Accelerometer_3')"""
+        return self.by_id.get(sensor_id)
+
+    def of_type(self, sensor_type):
+        return self.by_type.get(sensor_type, [])
+
+    def at_location(self, location):
+        return self.by_location.get(location, [])
+
+    def color_of(self, sensor):
+        return self.TYPE_COLORS.get(sensor['type'], (1.0, 1.0, 1.0))
+
+    def index_mesh(self, node_ids, node_positions):
+        """MeshNodeIndex mapping every sensor to its nearest node of one mesh, for the view that shows it"""
+        return MeshNodeIndex(self, node_ids, node_positions)
+
+
+class MeshNodeIndex:
+    """Nearest mesh node of every registry sensor for one mesh.
+
+    The registry is shared by every view in the process while each view may load
+    its own mesh, so the mapping is kept by the view rather than the registry.
+    """
+
+    def __init__(self, registry, node_ids, node_positions):
+        self.registry = registry
+        self.node_ids = np.asarray(node_ids)
+        self.node_index = GridIndex(node_positions)
+        self.nearest_nodes = {}
+        for sensor, position in zip(registry.sensors, registry.positions):
+            index, distance = self.node_index.nearest(position)
+            self.nearest_nodes[sensor['name']] = (int(self.node_ids[index]), distance)
+
+    def nearest_node(self, sensor_id):
+        """Return (node_id, distance) for a sensor, or None if it is not in the registry"""
+        sensor = self.registry.get(sensor_id)
+        if sensor is None:
+            return None
+        return self.nearest_nodes.get(sensor['name'])
+
+
+_shared_registry = None
+_registry_lock = threading.Lock()
+
+
+def shared_registry(path=None):
+    """Return the process-wide sensor registry, reading the inventory on first use"""
+    global _shared_registry
+    with _registry_lock:
+        if _shared_registry is None:
+            if path is None:
+                path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'sensors.tsv')
+            _shared_registry = SensorRegistry.from_file(path)
+        return _shared_registry
@@ -0,0 +1,199 @@
+import os
+
+import numpy as np
+from PyQt5.QtCore import Qt, QRectF, QTimer
+from PyQt5.QtGui import QColor, QImage, QPainter
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QComboBox, QLabel
+
+from data_loader import loader_service
+from sensor_analysis.spectrogram import SpectrogramStore
+from stacked_viewer import StackedTraceViewer
+
+
+def store_for_feed(feed, nperseg=256, hop=128):
+    """SpectrogramStore kept next to the feed's export, in .spectrograms/<export name>/"""
+    path = feed.reader.path
+    directory = os.path.join(os.path.dirname(os.path.abspath(path)), '.spectrograms',
+                             os.path.splitext(os.path.basename(path))[0])
+    time_values = feed.time_values
+    fs = 1.0 / np.median(np.diff(time_values)) if len(time_values) > 1 else 1.0
+    start_time = float(time_values[0]) if len(time_values) else 0.0
+    return SpectrogramStore(directory, feed.names(), fs, nperseg, hop, start_time)
+
+
+def colormap_table(name='viridis'):
+    """256-entry QImage color table from a matplotlib colormap"""
+    import matplotlib
+    colors = (matplotlib.colormaps[name](np.linspace(0.0, 1.0, 256))[:, :3] * 255).astype(np.uint32)
+    return [int(0xFF000000 | (r << 16) | (g << 8) | b) for r, g, b in colors]
+
+
+class SpectrogramView(StackedTraceViewer):
+    """Spectrogram of one channel read straight from a SpectrogramStore's memory map.
+
+    Only the frames inside the visible time window are read, strided down to at
+    most one per pixel column, and turned into an indexed QImage through a fixed
+    color table, so panning over hours of data touches a screen's worth of rows.
+    Pan, zoom and the time axis are the stacked viewer's.
+    """
+
+    def __init__(self, store, parent=None):
+        super().__init__([], parent)
+        self.store = store
+        self.name = None
+        self.levels = (-100.0, 0.0)
+        self.color_table = colormap_table()
+        self.image_buffer = None  # Keeps the pixels alive while the QImage is drawn
+        self.frames_shown = 0
+
+    def set_channel(self, name):
+        self.name = name
+        self.refresh(reset_levels=True)
+
+    def refresh(self, reset_levels=False):
+        """Pick up newly appended frames (and, on a channel change, new color levels)"""
+        if self.name is None:
+            return
+        rows = self.store.rows(self.name)
+        frames = len(rows)
+        at_end = self.view[1] >= self.full_range[1]
+        self.full_range = (self.store.frame_time(0), self.store.frame_time(max(frames - 1, 1)))
+        if reset_levels or self.frames_shown == 0:
+            self.view = self.full_range
+            reset_levels = True
+        elif at_end:
+            # Keep following new data when the view was at the end
+            span = self.view[1] - self.view[0]
+            self.view = (max(self.full_range[1] - span, self.full_range[0]), self.full_range[1])
+        if reset_levels and frames:
+            sample = np.asarray(rows[::max(frames // 2000, 1)])
+            self.levels = (float(np.percentile(sample, 5)), float(np.percentile(sample, 99.5)))
+        self.frames_shown = frames
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), QColor('#1E1E1E'))
+        rect = self.plot_rect()
+        x0, x1 = self.view
+        rows = self.store.rows(self.name) if self.name is not None else None
+
+        if rows is not None and len(rows):
+            first, last = self.store.frame_range(x0, x1, len(rows))
+            step = max((last - first) // max(int(rect.width()), 1), 1)
+            tile = np.asarray(rows[first:last:step])
+            if len(tile):
+                low, high = self.levels
+                indices = np.clip((tile - low) * (255.0 / max(high - low, 1e-6)), 0, 255).astype(np.uint8)
+                # Frequency increases upwards; QImage rows need 4-byte aligned strides
+                pixels = indices.T[::-1]
+                width = pixels.shape[1]
+                stride = (width + 3) // 4 * 4
+                self.image_buffer = np.zeros((pixels.shape[0], stride), dtype=np.uint8)
+                self.image_buffer[:, :width] = pixels
+                image = QImage(self.image_buffer.data, width, pixels.shape[0], stride, QImage.Format_Indexed8)
+                image.setColorTable(self.color_table)
+
+                # Place the tile by the centre times of its first and last frames
+                t_first = self.store.frame_time(first)
+                t_last = self.store.frame_time(first + (len(tile) - 1) * step)
+                scale = rect.width() / (x1 - x0)
+                column = (t_last - t_first) / max(len(tile) - 1, 1)
+                target = QRectF(
+                    rect.left() + (t_first - column / 2 - x0) * scale, rect.top(),
+                    len(tile) * column * scale, rect.height()
+                )
+                painter.setClipRect(rect)
+                painter.drawImage(target, image)
+                painter.setClipping(False)
+
+        self.draw_frequency_axis(painter, rect)
+        self.draw_time_axis(painter, rect, x0, x1)
+        painter.end()
+
+    def draw_frequency_axis(self, painter, rect):
+        painter.setPen(QColor('#AAAAAA'))
+        nyquist = self.store.freqs[-1]
+        for fraction in np.linspace(0.0, 1.0, 6):
+            y = rect.bottom() - fraction * rect.height()
+            painter.drawText(
+                QRectF(4, y - 10, self.LABEL_WIDTH - 12, 20), Qt.AlignVCenter | Qt.AlignRight,
+                f"{fraction * nyquist:.1f} Hz"
+            )
+
+
+class SpectrogramWindow(QWidget):
+    """Channel picker over a SpectrogramView, computing missing frames on the loader thread.
+
+    The store persists between sessions, so reopening only computes frames for data
+    that arrived since; while the feed is live the new samples are appended every
+    few seconds.
+    """
+
+    def __init__(self, feed, channel=None, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Spectrogram")
+        self.setGeometry(100, 100, 1100, 500)
+        self.feed = feed
+        self.store = store_for_feed(feed)
+        self.updating = False
+
+        self.dropdown = QComboBox()
+        self.dropdown.addItems(feed.names())
+        self.dropdown.currentTextChanged.connect(lambda name: self.view.set_channel(name))
+        self.status_label = QLabel()
+        self.view = SpectrogramView(self.store)
+
+        controls = QHBoxLayout()
+        controls.addWidget(self.dropdown, 1)
+        controls.addWidget(self.status_label)
+        layout = QVBoxLayout(self)
+        layout.addLayout(controls)
+        layout.addWidget(self.view, 1)
+
+        self.append_timer = QTimer(self)
+        self.append_timer.timeout.connect(self.compute_new_frames)
+        self.append_timer.start(5000)
+
+        if channel is not None and self.dropdown.findText(channel) >= 0:
+            self.dropdown.setCurrentText(channel)
+        self.view.set_channel(self.dropdown.currentText())
+        self.compute_new_frames()
+
+    def compute_new_frames(self):
+        if self.updating:
+            return
+        offset = self.store.first_needed_sample()
+        tail = self.feed.samples_from(offset)
+        if not any(self.store.frames_available(offset + len(values)) > self.store.frames[name]
+                   for name, values in tail.items()):
+            return
+        self.updating = True
+        loader_service().submit(
+            self.store.update, tail, offset,
+            pass_task=True,
+            owner=self,
+            on_progress=lambda percent: self.status_label.setText(f"Computing... {percent}%"),
+            on_finished=self.on_frames_computed,
+            on_failed=self.on_compute_failed,
+            on_cancelled=lambda: setattr(self, 'updating', False)
+        )
+
+    def on_frames_computed(self, count):
+        self.updating = False
+        self.status_label.setText(f"{self.store.frames.get(self.dropdown.currentText(), 0)} frames")
+        self.view.refresh()
+
+    def on_compute_failed(self, message):
+        self.updating = False
+        print(f"Error computing spectrogram: {message}")
+        self.status_label.setText("Spectrogram failed")
+
+    def closeEvent(self, event):
+        self.append_timer.stop()
+        loader_service().cancel_owned(self)
+        super().closeEvent(event)
+
+    def showEvent(self, event):
+        self.append_timer.start(5000)
+        super().showEvent(event)
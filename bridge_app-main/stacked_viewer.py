@@ -0,0 +1,165 @@
+import numpy as np
+from PyQt5.QtCore import Qt, QPointF, QRectF, pyqtSignal
+from PyQt5.QtGui import QColor, QPainter, QPen, QPolygonF
+from PyQt5.QtWidgets import QWidget
+
+
+LANE_COLORS = ['#4FC3F7', '#81C784', '#FFB74D', '#E57373', '#BA68C8', '#FFF176']
+
+
+def polygon_buffer(polygon, size):
+    """Resize a QPolygonF to size points and return its memory as a writable (size, 2) array"""
+    polygon.fill(QPointF(), size)
+    buffer = polygon.data()
+    buffer.setsize(size * 2 * 8)
+    return np.frombuffer(buffer, dtype=np.float64).reshape(size, 2)
+
+
+class StackedTraceViewer(QWidget):
+    """All sensor channels stacked in lanes over one linked time axis.
+
+    Every lane is drawn with QPainter into the same widget from its MinMaxPyramid at
+    the widget's pixel width, writing screen coordinates straight into a reused
+    QPolygonF buffer. Drag to pan, wheel to zoom around the cursor, double-click to
+    show the full recording; all lanes always share the same time window.
+    """
+
+    rangeChanged = pyqtSignal(float, float)
+
+    LABEL_WIDTH = 120
+    AXIS_HEIGHT = 24
+
+    def __init__(self, traces, parent=None):
+        super().__init__(parent)
+        self.setMinimumSize(600, 400)
+        self.setMouseTracking(False)
+
+        # [(name, pyramid), ...]; y-limits are fixed per lane so panning never rescales
+        self.traces = list(traces)
+        self.lane_limits = [self.finite_limits(pyramid.limits()) for _, pyramid in self.traces]
+        self.polygons = [QPolygonF() for _ in self.traces]
+
+        starts = [pyramid.x[0] for _, pyramid in self.traces if len(pyramid.x)]
+        stops = [pyramid.x[-1] for _, pyramid in self.traces if len(pyramid.x)]
+        self.full_range = (min(starts), max(stops)) if starts else (0.0, 1.0)
+        if self.full_range[1] == self.full_range[0]:
+            # A single sample still needs a time window to draw in
+            self.full_range = (self.full_range[0] - 0.5, self.full_range[1] + 0.5)
+        self.view = self.full_range
+        self.drag_origin = None
+
+    @staticmethod
+    def finite_limits(limits):
+        """Lane y-limits from a pyramid's (min, max), which comes from its coarsest level"""
+        low, high = limits
+        if not np.isfinite(low) or not np.isfinite(high):
+            return (-1.0, 1.0)
+        if high == low:
+            return (low - 1.0, high + 1.0)
+        return (low, high)
+
+    def plot_rect(self):
+        return QRectF(
+            self.LABEL_WIDTH, 0,
+            max(self.width() - self.LABEL_WIDTH, 1), max(self.height() - self.AXIS_HEIGHT, 1)
+        )
+
+    def set_view(self, x0, x1):
+        """Show the time window [x0, x1] in every lane, clamped to the recording"""
+        full0, full1 = self.full_range
+        span = min(x1 - x0, full1 - full0)
+        if span <= 0:
+            return
+        x0 = min(max(x0, full0), full1 - span)
+        self.view = (x0, x0 + span)
+        self.update()
+        self.rangeChanged.emit(*self.view)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), QColor('#1E1E1E'))
+        rect = self.plot_rect()
+        x0, x1 = self.view
+        pixels = int(rect.width())
+        x_scale = rect.width() / (x1 - x0)
+        lane_height = rect.height() / max(len(self.traces), 1)
+
+        painter.setPen(QColor('#3C3C3C'))
+        for lane in range(1, len(self.traces)):
+            painter.drawLine(QPointF(rect.left(), lane * lane_height), QPointF(rect.right(), lane * lane_height))
+
+        for lane, (name, pyramid) in enumerate(self.traces):
+            top = lane * lane_height
+            color = QColor(LANE_COLORS[lane % len(LANE_COLORS)])
+            painter.setPen(color)
+            painter.drawText(
+                QRectF(4, top, self.LABEL_WIDTH - 8, lane_height), Qt.AlignVCenter | Qt.AlignLeft, name
+            )
+
+            x, y = pyramid.envelope(x0, x1, pixels)
+            finite = np.isfinite(y)
+            if not finite.all():
+                x, y = x[finite], y[finite]
+            if len(x) < 2:
+                continue
+
+            # Map straight into the polygon's memory, leaving a small gap between lanes
+            low, high = self.lane_limits[lane]
+            y_scale = (lane_height * 0.9) / (high - low)
+            points = polygon_buffer(self.polygons[lane], len(x))
+            np.subtract(x, x0, out=points[:, 0])
+            points[:, 0] *= x_scale
+            points[:, 0] += rect.left()
+            np.subtract(high, y, out=points[:, 1])
+            points[:, 1] *= y_scale
+            points[:, 1] += top + lane_height * 0.05
+
+            painter.setClipRect(QRectF(rect.left(), top, rect.width(), lane_height))
+            painter.setPen(QPen(color, 1))
+            painter.drawPolyline(self.polygons[lane])
+            painter.setClipping(False)
+
+        self.draw_time_axis(painter, rect, x0, x1)
+        painter.end()
+
+    def draw_time_axis(self, painter, rect, x0, x1):
+        painter.setPen(QColor('#AAAAAA'))
+        bottom = rect.bottom()
+        painter.drawLine(QPointF(rect.left(), bottom), QPointF(rect.right(), bottom))
+
+        # Round tick step of 1, 2 or 5 x 10^k giving roughly eight ticks
+        raw_step = (x1 - x0) / 8
+        magnitude = 10 ** np.floor(np.log10(raw_step))
+        step = next(m * magnitude for m in (1, 2, 5, 10) if m * magnitude >= raw_step)
+        decimals = max(0, int(-np.floor(np.log10(step))))
+        for tick in np.arange(np.ceil(x0 / step) * step, x1, step):
+            px = rect.left() + (tick - x0) * rect.width() / (x1 - x0)
+            painter.drawLine(QPointF(px, bottom), QPointF(px, bottom + 4))
+            painter.drawText(
+                QRectF(px - 40, bottom + 4, 80, self.AXIS_HEIGHT - 4), Qt.AlignHCenter | Qt.AlignTop,
+                f"{tick:.{decimals}f}"
+            )
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.LeftButton:
+            self.drag_origin = (event.x(), self.view)
+
+    def mouseMoveEvent(self, event):
+        if self.drag_origin is None:
+            return
+        origin_x, (x0, x1) = self.drag_origin
+        shift = (origin_x - event.x()) * (x1 - x0) / self.plot_rect().width()
+        self.set_view(x0 + shift, x1 + shift)
+
+    def mouseReleaseEvent(self, event):
+        self.drag_origin = None
+
+    def mouseDoubleClickEvent(self, event):
+        self.set_view(*self.full_range)
+
+    def wheelEvent(self, event):
+        rect = self.plot_rect()
+        x0, x1 = self.view
+        anchor = x0 + (event.x() - rect.left()) / rect.width() * (x1 - x0)
+        factor = 0.8 ** (event.angleDelta().y() / 120)
+        self.set_view(anchor - (anchor - x0) * factor, anchor + (x1 - anchor) * factor)
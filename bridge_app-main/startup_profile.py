@@ -0,0 +1,100 @@
+"""Startup timing for the dashboard entry points.
+
+Run ``python startup_profile.py dashboard_new`` for an import-time report of a
+module, or start a dashboard with ``--startup-report`` (or BRIDGE_STARTUP_REPORT=1)
+to print its time-to-interactive milestones. ``--json PATH`` appends the numbers
+as one JSON line so regressions can be tracked over time.
+"""
+import json
+import os
+import subprocess
+import sys
+import time
+
+
+class StartupProfiler:
+    """Record named startup milestones relative to when the profiler was created"""
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.marks = []
+
+    def mark(self, name):
+        self.marks.append((name, (time.perf_counter() - self.start) * 1000.0))
+
+    def milestones(self):
+        return dict(self.marks)
+
+    def report(self):
+        lines = ["Startup milestones (ms since launch):"]
+        for name, elapsed in self.marks:
+            lines.append(f"  {elapsed:8.1f}  {name}")
+        return "\n".join(lines)
+
+
+# Created when the entry point imports this module, i.e. before its heavy imports
+profiler = StartupProfiler()
+
+
+def report_requested(argv=None):
+    argv = sys.argv if argv is None else argv
+    return '--startup-report' in argv or bool(os.environ.get('BRIDGE_STARTUP_REPORT'))
+
+
+def import_time_report(module, top=15, python=None):
+    """Import a module in a fresh interpreter with -X importtime.
+
+    Returns (total_ms, [(cumulative_ms, self_ms, package), ...]) for the slowest
+    imports by cumulative time.
+    """
+    completed = subprocess.run(
+        [python or sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        capture_output=True,
+        text=True,
+        cwd=os.path.dirname(os.path.abspath(__file__))
+    )
+
+    entries = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith('import time:') or '[us]' in line:
+            continue
+        self_us, cumulative_us, package = line[len('import time:'):].split('|')
+        entries.append((int(cumulative_us) / 1000.0, int(self_us) / 1000.0, package.rstrip()))
+
+    # Top-level imports are the ones without leading indentation
+    total = sum(cumulative for cumulative, _, package in entries if not package.startswith('  '))
+    entries.sort(reverse=True)
+    return total, entries[:top]
+
+
+def append_json(path, record):
+    record = dict(record, timestamp=time.strftime('%Y-%m-%dT%H:%M:%S'))
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(record) + '\n')
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    json_path = None
+    if '--json' in argv:
+        index = argv.index('--json')
+        json_path = argv[index + 1]
+        argv = argv[:index] + argv[index + 2:]
+    modules = argv or ['dashboard_new', 'dashboard']
+
+    for module in modules:
+        total, entries = import_time_report(module)
+        print(f"\nImport time for {module}: {total:.1f} ms")
+        print(f"  {'cumulative':>10}  {'self':>8}  package")
+        for cumulative, self_ms, package in entries:
+            print(f"  {cumulative:10.1f}  {self_ms:8.1f}  {package.strip()}")
+        if json_path:
+            append_json(json_path, {
+                'module': module,
+                'import_ms': round(total, 1),
+                'slowest': [[package.strip(), round(cumulative, 1)] for cumulative, _, package in entries]
+            })
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,31 @@
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from live_tail import CsvTailReader
+
+
+def test_short_cells_become_nan(tmp_path):
+    path = tmp_path / 'tail.csv'
+    path.write_text('Time;Sensor_1;Sensor_2\n1;2;\n3;;4\n')
+    reader = CsvTailReader(str(path), 'Sensor_')
+    time_values, values = reader.read_new()
+    np.testing.assert_array_equal(time_values, [1.0, 3.0])
+    np.testing.assert_array_equal(values, [[2.0, np.nan], [np.nan, 4.0]])
+
+
+def test_rows_appended_in_parts(tmp_path):
+    path = tmp_path / 'tail.csv'
+    path.write_text('Time;Sensor_1\n0,5;1,25\n1;')
+    reader = CsvTailReader(str(path), 'Sensor_')
+    time_values, values = reader.read_new()
+    np.testing.assert_array_equal(time_values, [0.5])
+    np.testing.assert_array_equal(values, [[1.25]])
+    with open(path, 'a') as f:
+        f.write('2\n')
+    time_values, values = reader.read_new()
+    np.testing.assert_array_equal(time_values, [1.0])
+    np.testing.assert_array_equal(values, [[2.0]])
@@ -0,0 +1,34 @@
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sensor_analysis.rainflow import extract_cycles, stack_cycles, turning_points
+
+
+def assert_same_cycles(points):
+    ranges, means, residual = extract_cycles(points)
+    stack_ranges, stack_means, stack_residual = stack_cycles(points)
+    order, stack_order = np.lexsort((means, ranges)), np.lexsort((stack_means, stack_ranges))
+    np.testing.assert_allclose(ranges[order], stack_ranges[stack_order])
+    np.testing.assert_allclose(means[order], stack_means[stack_order])
+    np.testing.assert_allclose(residual, stack_residual)
+
+
+def test_matches_stack_method_on_random_series():
+    rng = np.random.default_rng(0)
+    for _ in range(20):
+        assert_same_cycles(turning_points(np.cumsum(rng.standard_normal(rng.integers(2, 5000)))))
+
+
+def test_nested_cycles_match_stack_method_quickly():
+    # Decaying response closed by one load step: every cycle is nested in the previous one
+    count = 1 << 16
+    amplitude = np.linspace(1000.0, 1.0, count // 2)
+    points = turning_points(np.concatenate([np.ravel(np.column_stack([amplitude, -amplitude])), [5000.0]]))
+    started = time.perf_counter()
+    assert_same_cycles(points)
+    assert time.perf_counter() - started < 5.0
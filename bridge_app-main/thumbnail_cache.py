@@ -0,0 +1,86 @@
+import hashlib
+import os
+
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QImage, QImageReader, QPixmap, QPixmapCache
+
+
+class ThumbnailCache:
+    """Pre-scaled dashboard images, cached in memory (QPixmapCache) and on disk.
+
+    Thumbnails are keyed by file, modification time, file size and target size,
+    so editing an image in images/ regenerates its thumbnails automatically.
+    """
+
+    def __init__(self, image_dir, cache_dir=None, cache_limit_kb=32 * 1024):
+        self.image_dir = image_dir
+        self.cache_dir = cache_dir or os.path.join(image_dir, '.thumbnails')
+        os.makedirs(self.cache_dir, exist_ok=True)
+        QPixmapCache.setCacheLimit(max(QPixmapCache.cacheLimit(), cache_limit_kb))
+
+    def _key(self, path, width, height):
+        stat = os.stat(path)
+        return f"{os.path.basename(path)}@{width}x{height}:{stat.st_mtime_ns}:{stat.st_size}"
+
+    def _disk_path(self, key, path, width, height):
+        stem = os.path.splitext(os.path.basename(path))[0]
+        digest = hashlib.sha1(key.encode('utf-8')).hexdigest()[:12]
+        return os.path.join(self.cache_dir, f"{stem}_{width}x{height}_{digest}.png")
+
+    def image(self, img_file, width, height):
+        """Return the thumbnail as a QImage (safe off the GUI thread), or None if the file is missing"""
+        path = os.path.join(self.image_dir, img_file)
+        if not os.path.exists(path):
+            return None
+        key = self._key(path, width, height)
+        disk_path = self._disk_path(key, path, width, height)
+
+        if os.path.exists(disk_path):
+            image = QImage(disk_path)
+            if not image.isNull():
+                return image
+
+        # Let the decoder scale while reading (JPEG decodes at reduced resolution)
+        reader = QImageReader(path)
+        size = reader.size()
+        if size.isValid():
+            reader.setScaledSize(size.scaled(width, height, Qt.KeepAspectRatio))
+        image = reader.read()
+        if image.isNull():
+            print(f"Error reading image {path}: {reader.errorString()}")
+            return None
+
+        # Scaled decoding can only shrink, so finish off with a smooth scale if needed
+        if image.width() > width or image.height() > height:
+            image = image.scaled(width, height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+        # Write then rename, so a thumbnail being generated on a worker thread is never read half-written
+        temp_path = f"{disk_path}.{os.getpid()}.{id(image)}.tmp"
+        if image.save(temp_path, 'PNG'):
+            os.replace(temp_path, disk_path)
+        else:
+            print(f"Error writing thumbnail {disk_path}")
+        return image
+
+    def pixmap(self, img_file, width, height):
+        """Return the thumbnail as a QPixmap (GUI thread only), or None if the file is missing"""
+        path = os.path.join(self.image_dir, img_file)
+        if not os.path.exists(path):
+            return None
+        key = self._key(path, width, height)
+
+        pixmap = QPixmapCache.find(key)
+        if pixmap is not None and not pixmap.isNull():
+            return pixmap
+
+        image = self.image(img_file, width, height)
+        if image is None:
+            return None
+        pixmap = QPixmap.fromImage(image)
+        QPixmapCache.insert(key, pixmap)
+        return pixmap
+
+    def generate(self, entries):
+        """Write the disk thumbnails for [(img_file, width, height), ...]; meant for a worker thread"""
+        for img_file, width, height in entries:
+            self.image(img_file, width, height)
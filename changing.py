@@ -4,6 +4,7 @@ import numpy as np
 import time
 import random
 import sys
+import os
 from PyQt5.QtCore import Qt
 from PyQt5.QtCore import QTimer
 from PyQt5.QtWidgets import (
@@ -21,43 +22,47 @@ from PyQt5.QtWidgets import (
 )
 from vtkmodules.qt.QVTKRenderWindowInteractor import QVTKRenderWindowInteractor
 from vtkmodules.vtkInteractionStyle import vtkInteractorStyleTrackballCamera
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
+
+# The shared plot widgets live with the dashboard code
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'bridge_app-main'))
+from plot_widgets import FastPlotWidget
 
 
 class AccelerometerGraph(QDialog):
-    def __init__(self, x_data, y_data, title, parent=None):
+    """Non-modal graph window that is created once and reused for every selection"""
+
+    def __init__(self, parent=None):
         super().__init__(parent)
-        self.setWindowTitle(title)
+        self.setModal(False)
         self.setGeometry(300, 300, 800, 400)
         
         # Create the layout
         layout = QVBoxLayout()
         
-        # Create the figure and canvas with a smaller size
-        fig = Figure(figsize=(6, 3))  # Smaller figure
-        canvas = FigureCanvas(fig)
-        layout.addWidget(canvas)
-        
-        # Convert data
-        x_data = x_data.astype(float).to_numpy()
-        y_data = y_data.astype(float).to_numpy()
-        
-        # Create the plot
-        ax = fig.add_subplot(111)
-        ax.plot(x_data, y_data, 'b-', linewidth=0.5)  # Thin blue line
-        ax.set_xlabel('Time (s)', fontsize=8)
-        ax.set_ylabel('Acceleration', fontsize=8)
-        ax.set_title(title, fontsize=10)
-        ax.grid(True, linestyle=':', alpha=0.6)
-        ax.tick_params(labelsize=8)
-        
-        # Adjust layout
-        fig.tight_layout()
+        # Create the plot with a smaller figure and a thin blue line
+        self.plot = FastPlotWidget(xlabel='Time (s)', color='b', linewidth=0.5, figsize=(6, 3), legend=False, toolbar=True)
+        self.plot.ax.grid(True, linestyle=':', alpha=0.6)
+        self.plot.ax.tick_params(labelsize=8)
+        self.plot.ax.xaxis.label.set_fontsize(8)
+        self.plot.ax.yaxis.label.set_fontsize(8)
+        self.plot.title.set_fontsize(10)
+        self.plot.figure.tight_layout()
+        layout.addWidget(self.plot)
         
         # Set the layout
         self.setLayout(layout)
 
+    def show_series(self, x_data, y_data, title, ylabel, ylim=None):
+        """Swap in a new series and bring the window to the front"""
+        self.setWindowTitle(title)
+        if ylabel != self.plot.ax.get_ylabel():
+            self.plot.ax.set_ylabel(ylabel)
+            self.plot.background = None  # The label is part of the cached background
+        self.plot.set_limits(ylim=ylim)
+        self.plot.set_data(x_data, y_data, title=title)
+        self.show()
+        self.raise_()
+
 
 class ClickInteractorStyle(vtk.vtkInteractorStyleTrackballCamera):
     def __init__(self, parent=None):
@@ -103,6 +108,7 @@ class MainWindow(QMainWindow):
 
         self.accel_data = None
         self.strain_data = None
+        self.graph_window = None
 
         # Initialize sensor storage
         self.sensor_actors = []
@@ -376,11 +382,31 @@ class MainWindow(QMainWindow):
                                            skiprows=0)
             print("Strain gauge data loaded successfully")
             print("Columns:", self.strain_data.columns.tolist())
+
+            # Shared limits keep the axes fixed when switching channels
+            self.accel_limits = self.channel_limits(self.accel_data, 'Accelerometer ')
+            self.strain_limits = self.channel_limits(self.strain_data, 'Strain Gauge ')
             
         except Exception as e:
             print(f"Error loading sensor data: {e}")
             self.accel_data = None
             self.strain_data = None
+            self.accel_limits = None
+            self.strain_limits = None
+
+    def get_graph_window(self):
+        """Return the sensor graph window, creating it on first use"""
+        if self.graph_window is None:
+            self.graph_window = AccelerometerGraph(self)
+        return self.graph_window
+
+    @staticmethod
+    def channel_limits(data, prefix):
+        """Return y-limits covering every channel with the given column prefix"""
+        columns = [column for column in data.columns if column.startswith(prefix)]
+        if not columns:
+            return None
+        return FastPlotWidget.data_limits(data[columns].to_numpy(dtype=float))
 
     def show_accelerometer_graph(self, selection):
         """Show graph for selected accelerometer"""
@@ -390,13 +416,14 @@ class MainWindow(QMainWindow):
                 accel_num = int(selection.split()[-1])
                 
                 # Get time and accelerometer data
-                time_data = self.accel_data['Time (s)']
-                accel_data = self.accel_data[f'Accelerometer {accel_num}']
+                time_data = self.accel_data['Time (s)'].to_numpy(dtype=float)
+                accel_data = self.accel_data[f'Accelerometer {accel_num}'].to_numpy(dtype=float)
                 
-                # Create and show graph
+                # Show graph
                 title = f"Accelerometer {accel_num} Data"
-                graph_window = AccelerometerGraph(time_data, accel_data, title, self)
-                graph_window.exec_()
+                self.get_graph_window().show_series(
+                    time_data, accel_data, title, 'Acceleration', self.accel_limits
+                )
                 
             except Exception as e:
                 msg = QMessageBox()
@@ -412,13 +439,14 @@ class MainWindow(QMainWindow):
                 gauge_num = int(selection.split()[-1])
                 
                 # Get time and strain gauge data
-                time_data = self.strain_data['Time (s)']
-                strain_data = self.strain_data[f'Strain Gauge {gauge_num}']
+                time_data = self.strain_data['Time (s)'].to_numpy(dtype=float)
+                strain_data = self.strain_data[f'Strain Gauge {gauge_num}'].to_numpy(dtype=float)
                 
-                # Create and show graph
+                # Show graph
                 title = f"Strain Gauge {gauge_num} Data"
-                graph_window = AccelerometerGraph(time_data, strain_data, title, self)
-                graph_window.exec_()
+                self.get_graph_window().show_series(
+                    time_data, strain_data, title, 'Strain', self.strain_limits
+                )
                 
             except Exception as e:
                 msg = QMessageBox()